@@ -0,0 +1,187 @@
+# exercises/aho_corasick.py
+# Run:
+#   python exercises/aho_corasick.py --file data/raw/Genomes/e_coli.txt --patterns barcodes.txt
+#   python exercises/aho_corasick.py --file genome.txt --revcomp --positions ATGATCAAG CTTGATCAT
+
+"""
+Aho-Corasick multi-pattern counting.
+
+count_pattern_occurrences() makes one full pass over the sequence per pattern.
+Here all patterns (barcodes, adapters, DnaA boxes...) are compiled into one
+automaton and a single streaming pass reports every overlapping occurrence of
+every pattern.
+
+Implementation notes:
+- The automaton is a complete DFA over the characters of the patterns, so each
+  sequence character costs one dict lookup; any other character resets to the root.
+- The input can be one string or any iterable of string chunks (e.g. lines of a
+  file); the automaton state carries across chunks and positions are global.
+- With reverse_complement=True, the reverse complement of every pattern is
+  compiled too, and reverse-strand hits are credited to the original pattern.
+  A window is reported at its forward-strand start, so a palindromic pattern is
+  found once on each strand.
+"""
+
+import argparse
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+COMPLEMENT = {"A": "T", "C": "G", "G": "C", "T": "A"}
+
+
+def reverse_complement(pattern: str) -> str:
+    return "".join(COMPLEMENT[base] for base in reversed(pattern))
+
+
+class AhoCorasick:
+    """Automaton matching a fixed set of patterns in one pass."""
+
+    def __init__(self, patterns: Iterable[str], reverse_complement_mode: bool = False):
+        self.patterns = list(dict.fromkeys(patterns))  # unique, input order kept
+        if any(not p for p in self.patterns):
+            raise ValueError("Patterns must be non-empty.")
+        if reverse_complement_mode:
+            invalid = [p for p in self.patterns if set(p) - set(COMPLEMENT)]
+            if invalid:
+                raise ValueError(f"Reverse-complement mode needs upper-case A/C/G/T patterns, got: {', '.join(invalid)}")
+        self.reverse_complement_mode = reverse_complement_mode
+
+        # keys: strings compiled into the automaton -> list of (pattern, strand) they stand for
+        keys: Dict[str, List[Tuple[str, str]]] = {}
+        for p in self.patterns:
+            keys.setdefault(p, []).append((p, "+"))
+            if reverse_complement_mode:
+                keys.setdefault(reverse_complement(p), []).append((p, "-"))
+        self._keys = list(keys)
+        self._labels = [keys[key] for key in self._keys]
+        self._build()
+
+    def _build(self) -> None:
+        alphabet = sorted({ch for key in self._keys for ch in key})
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+
+        # 1) Trie of all keys
+        for key_id, key in enumerate(self._keys):
+            state = 0
+            for ch in key:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(key_id)
+
+        # 2) Breadth-first pass: failure links folded into a complete transition table,
+        #    and outputs of the failure state merged into each state.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        queue = deque()
+        for ch in alphabet:
+            nxt = goto[0].get(ch, 0)
+            delta[0][ch] = nxt
+            if nxt:
+                queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            out[state] = out[state] + out[fail[state]]
+            for ch in alphabet:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    delta[state][ch] = delta[fail[state]][ch]
+                else:
+                    fail[nxt] = delta[fail[state]][ch]
+                    delta[state][ch] = nxt
+                    queue.append(nxt)
+
+        self._delta = delta
+        self._out = [tuple(o) for o in out]
+
+    def iter_matches(self, text: Union[str, Iterable[str]]) -> Iterator[Tuple[int, str, str]]:
+        """
+        Yield (start, pattern, strand) for every overlapping occurrence, in order of
+        the position where the occurrence ends.
+        """
+        chunks = [text] if isinstance(text, str) else text
+        delta, out, keys, labels = self._delta, self._out, self._keys, self._labels
+        state = 0
+        pos = 0
+        for chunk in chunks:
+            for ch in chunk:
+                pos += 1
+                state = delta[state].get(ch, 0)
+                if out[state]:
+                    for key_id in out[state]:
+                        start = pos - len(keys[key_id])
+                        for pattern, strand in labels[key_id]:
+                            yield start, pattern, strand
+
+    def count(self, text: Union[str, Iterable[str]]) -> Dict[str, int]:
+        """Overlapping occurrence count of every pattern (both strands summed in RC mode)."""
+        counts = {p: 0 for p in self.patterns}
+        for _, pattern, _ in self.iter_matches(text):
+            counts[pattern] += 1
+        return counts
+
+    def positions(self, text: Union[str, Iterable[str]]) -> Dict[str, list]:
+        """
+        Sorted 0-based start positions of every pattern. In RC mode each entry is a
+        (position, strand) tuple with strand '+' or '-'.
+        """
+        hits = {p: [] for p in self.patterns}
+        for start, pattern, strand in self.iter_matches(text):
+            hits[pattern].append((start, strand) if self.reverse_complement_mode else start)
+        return {p: sorted(h) for p, h in hits.items()}
+
+
+def count_patterns(text: Union[str, Iterable[str]], patterns: Iterable[str],
+                   reverse_complement: bool = False) -> Dict[str, int]:
+    """Batch version of count_pattern_occurrences: one pass for all patterns."""
+    return AhoCorasick(patterns, reverse_complement).count(text)
+
+
+def find_patterns(text: Union[str, Iterable[str]], patterns: Iterable[str],
+                  reverse_complement: bool = False) -> Dict[str, list]:
+    """Batch version of pattern_matching: one pass for all patterns."""
+    return AhoCorasick(patterns, reverse_complement).positions(text)
+
+
+def read_sequence_chunks(file_path: str) -> Iterator[str]:
+    """Stream a plain sequence file line by line, without line breaks or spaces."""
+    with open(file_path, "r") as f:
+        for line in f:
+            yield "".join(line.split())
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Count many patterns in one pass (Aho-Corasick).")
+    ap.add_argument("--file", "-f", required=True, help="Path to the sequence file.")
+    ap.add_argument("--patterns", "-p", type=str, default=None,
+                    help="File with one pattern per line (in addition to positional patterns).")
+    ap.add_argument("--revcomp", action="store_true",
+                    help="Also count reverse-complement occurrences of every pattern.")
+    ap.add_argument("--positions", action="store_true", help="Print start positions, not only counts.")
+    ap.add_argument("pattern", nargs="*", help="Patterns to count.")
+    args = ap.parse_args()
+
+    patterns = list(args.pattern)
+    if args.patterns:
+        with open(args.patterns, "r") as f:
+            patterns.extend(line.strip() for line in f if line.strip())
+    if not patterns:
+        raise SystemExit("[ERROR] No patterns given (use positional patterns or --patterns FILE).")
+
+    automaton = AhoCorasick(patterns, args.revcomp)
+    if args.positions:
+        for pattern, hits in automaton.positions(read_sequence_chunks(args.file)).items():
+            shown = [f"{pos}{strand}" for pos, strand in hits] if args.revcomp else map(str, hits)
+            print(f"{pattern}\t{len(hits)}\t{' '.join(shown)}")
+    else:
+        for pattern, count in automaton.count(read_sequence_chunks(args.file)).items():
+            print(f"{pattern}\t{count}")
+
+
+if __name__ == "__main__":
+    main()
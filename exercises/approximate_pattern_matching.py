@@ -6,7 +6,16 @@ def HammingDistance(p, q):
     # Compute the Hamming distance between two sequences
     return sum([1 for i in range(len(p)) if p[i] != q[i]])
 
-def ApproximatePatternMatching(Pattern, Text, d):
+def ApproximatePatternMatching(Pattern, Text, d, backend="python", index=None):
+    if index is not None:
+        # Seed-and-verify search on a prebuilt k-mer position index of Text (see seed_index.py)
+        return ' '.join(map(str, index.positions_within(Pattern, d)))
+    if backend == "numpy":
+        # Vectorized mismatch accumulation over the whole text (see hamming_scan.py)
+        from hamming_scan import approximate_match_positions
+        positions = approximate_match_positions(Pattern, Text, d).tolist()
+        return ' '.join(map(str, positions))
+
     positions = []  # Initialize the list of positions
     # Iterate over the text and compare with the pattern
     for i in range(len(Text) - len(Pattern) + 1):
@@ -15,11 +24,23 @@ def ApproximatePatternMatching(Pattern, Text, d):
     # Format the output as a space-separated string
     return ' '.join(map(str, positions))
 
-# Define the pattern and the maximum number of allowed errors
-Pattern = "TTGCCAGTTA"   # Example pattern
-Text = "GGCAGCTTTGGTGAGGGACCCACCCTCCGTCTGGTCTGCGTTAGGAATGCGTAGTGTGTCCGCCATCAGTGCGTTCCTCTTATAATTGATGAGGGTCGTAGCGGTGAGGGCACTTGCATAAGATCGGATCTCTCACTCATGCTGGCCGGTCAAGCACAATGCAACTTAAAAGCTTTACGTAGATTCATCGTTCAATCGCAGAGGTTTAATGACTGAGGGCACCAGCGAACGGATAAGTGCGTGCGCACAGTTGGAATCCTGATTTAAAAGGACGTTCTCAACGGTGTTCCAGCTAGCGGTACCAAGTCGTTTCATTTCGAGGCGGTCGCAACACATTGTCTTACAACAACGAAGTGTCGAAGCGTAAATGGTGATGGGGGTAATCCGCGTGATCTTTACGCCTGTCCTGAGGCAAGGTTCACTACTCTGCCGCTACGTGCATGTTTTGTTGACAGGAGACACGTTGCTGTGATCTCGACCTAGAGGGCTTCCCTCAAGTTGTGTCCCGGACTAGCACAACAAACCTTGCCAGGAAGGTGCTATACCAAACATAGTAGAATGCTTGCGTAGGTGAGTCTTCCCCGAGGTCTATATGCCTACTGATTGTTCCGAGCAAGGTGCCCGAGAGGCATTTCGCACTTTTTTTCCGTCTGTAGTTTATGAACCCATCCCCCAATTAGAGATAGACCCCCATGGCGGGCTTTATATGCTTCTGCACTAAGTTGGGCGCGCTTGGGTTGTATAGCTACGGAAATGAATAGGTACGAAGGCGATGACGGGTTGAATGTTTAAAGACGACTAGACCCGTGCAAATCATTTGTGAGATACGGGGCCAGTTATAACTGCGTGATCGCTACTCGGCCAGGAACAGTTGGGTAATGTAGGTTATTCTCTTATGAGGATGACAGTTCAACCATGGGCCAGTCTCGCAGACCAGGGCAGGTAGGTCTCGAGCGGCCCTGGTAACGCGGCGCTTGTTAACGACTCTATATGAACCAGGGGCTTGCACAGGCGGGCAAACCCTCCACGAGGTTGTCCGAATCAGCCTGCCTGGCTAATGCCTAAGTAGATTTACGGAGTCCCTAATAAGCCAAGCCGTAGGGTATGTAGACACGTATCCCTTGTTCCTAAGAGTACGGAGCTTCCGTGCCCTGTTGGTAGAGAGAGTGGTATAGAAGAAATTTCGGCTGTGTTACTCCGCATAGGCAAGGATAAGCCAGTATACCCACTGGAAGCGGTTACTCTGTGCAAGCCTTTCTAGGAGCTCTGCGTGTCAGGCCGATGCCCATTGCGGTCACCTTTGGGGAGATTCGTACACTGAATCACCGTCTGTAGCATATGCACACGCGTATTCGTAACTTAAATTTGTGTTCACTTCGGACGACAGGATAGACAGGCCGTCGGGGGTACGTGGGAGTAACCGTGTGTCTCGTCTCCATCCTGTGCCTTAAGTTCCCAGCAGGAGGGTTGGCCTTTGTACTTGAAAGTTCAAGATACCGGATTTCCTGCTCAACCCCTACCTTCACCTTCGAAGTTGGCCACTGTTAGTAACATAACCGGCTCCGGGGTCGCTAGGTTTCTTGATGGGTACAGGCCTCAGTTAGCTCCCGCTCCGGATGCCAAGATCTGATTTGTTTAGATCGGATCATACCACCCAACTAGCGGTCTCAAAGCTCGTAGTGCACACGGCAAGACGGCTGAGCAAACACTGGCCACTAAAATTATCCTGGAAGAGTGATGGAGCCTAAGCATATGGTGCAATGCGTCGGGTATGATACGAATTGTCACCATGACAGCGCCCGCGCAGATATCTGTCTCCATTCGTGGGTCTGAATAAATATGTACTTGTTGAGTTCCGCGACCCATTGTACACAGTTCTAAGATGGTCGTCACGCGCAATGTCTGAGCAGAAGTAAGATAAGTGGCCACATCTATTTTTACTTACCCCGCCAATATTATAGTCGCCGGTGCCCCGGGCAAAGATGCGGAAGAAAGATCGACATTGGCCGTTATTGCTCGTACGTCACCTGAGAGTGAGGGGAGTCGCGGGTTGCACTCTTACACCGGGACCCAGGTTTCCAAGACAGAACCCCATACGAGAGCGGACCGCAAGTTCGCCACACACTTCCAGGTAAGGCTGCCTGAAAACGGATAAATTCACTACTTAGCAGAATGCCATAAATTCCAAGTTGGCGTACAACCGTAACGCCGCGGCCCCTGCGTATAAACCTTCGACAAGAAAACAGACGATCCACGTATTCGGTCTCTGTAGTCCGTAGTGCACGTGTGAGGGATCCCGATTTCCCTGATAAGTTTTAGGTCTCGCTGGCGTACTCCTGTCACATGCCATGCCCAAGGACGAGTCAACCGATACCATCTCTGCTACTCTGACAAATCTCACGAATGAGCTGAGAAACGCTGATATGTTTCACAGCAAAAAAATATCGCCACTCCCAGTGTCCGTTGTTCTTTTTAGAATTGGGAGATGCATAAGACTTTCCGACCGTATCGAACGGGCGTAGTCGGGGTGAGCAAAATAGGCCATTAACGCTACCAGGGTGCAGCGGGCGCGAAAACACGGGACGCATCATATGATTGGCACCCGGTAGGCACGATATGAGAAACATACTATGCGGAAGACATCCATGCACATCAGTCTCCGTTCGCGGCTTATGAATCGAAACCTGCGTTTTAAAACATAACTCGAGTGGAAGATGGGATCAAAGATAGGCGATAATGACTGGATCACTGGGCGTTTTTATAGTACGCTGTTAAGGTACACCAATGACCACTGTGGCTCATGAGAATCTAATACCTCCTCTCTCACACAAAAGTCTTCCTGCCGGGGGTGGTGGACTCCTTCTACTGGGCTTCTGCTTTAATGCTATAGGATTTGTAGCGAGAACAGTCGCGCCGTAGGGTTCTGCGATCGTCTTTTGATACGCCGTAGGCGTTCCCATACCGATGCGCGTACGATTGCCGATCACGACCACCATACGCTCGGTGACACGATAAAGAACGACATGCTTTTCGGCAAAAGCATTACCCCCTATCACGGGCCCGAGAAAAGGTCTGAAAGCCATAATACGTCTGATTTTATTCGGAGTGTCTCCCGGACCTCACATCATCACATACGAGAATGCTTCGGCGCAAGCCAACTGCGTCGTAGTCTGGGACTGCGTACTTTCTCGAATATCCAACGGTAATGGCGCTCGGAATAATGAAGGAAATCCTCATAGTGCTACCCGTTGCGCCAGAGGGCAGATAATAGTACATGTGATTTATTCGCTATCGTCACGGTCTGGGAAAGTACAGTTCGGAAGCCTTCCATTCCCTGACCGTTAGCCAGTGGGGGTTCCACTGTCTCACCAATACCCATTATGTTATAGGAGGACCAATGTCGCATCGTGTATCATGCCCGAGGACTGTTACTAATTATGCGGCTTCTTATCTGCGGAGATGGCAGAAGACGCTCCCTGGTCGTCTCTCCTTCCTTAGGTCTAGCATCGAGCCGCAAACCAAGAGACGAACCCGAGAGTGATGAAACATTGTCGACCCACAAATCCTATCGGGGGGACAATCTCTAACACTCAGAAGATTGCCAATCCTCCATTCTTCTGAAGGTCCATAAGTATATAACCGTAATGGCTTCGTTTTCGGAGTAGTCAGAAGGGGTCGTAAGGTTGCCTGCGCCCCAGCTGTCCCCTATTCCGTTATCGATGGTCGTTACAAGTGCATCAGCCCGGCATTGCGAGACAAGATGCGTTGCGACAGTAGGGGACACCGCGATTACCCTCTTCAATTCAACCCGTCAGCTTGTAGCGGCATACCATCAAAAGGGAGGAATCGCTAACAGATCCCCGAATGGGGTTCATTCCCCTGGGCGCAGAAAGAACTCATCTCTTTCTCGTACCGCGCAAGAGTGGTTTCGGCCTAGGTCTTGCGCGAGTCAACAAGAGGTAGAAGAAAAGACCGCCTAAATTTCTCTCATAGGCCAAAATCCAGCATAATCGCTATCACAGAGCACAAGACTGGCTCTCCGCTAGAAGTGGTGTTAGAGCGGAGGTTGCTTGGCGGTAGATCCACCCCGACGTCACTCAGTGTTGAAAGCCATGCAAGCCGAACGCCGAGCCAGTTATGGCCCTCCAGCGTAAAGAACCGTTACTTGCAGTCTCCTGTCCCCGCGTCAACATACGAGAAGCTGTAAATTTAATCTGGCGAACAGCAAGCTATCCGGAAGGCATGATGCAACCCTCATTCCGGAGTGTGGTAAGAATAAGCGTTGTTTGAGAACTGGTCGGCTGCTCACACACCAGGACAGAAGGTTGTGTTGCTGGTAGACATAGGATAAAGATAACTTCCTCTACAGAGACGCATATGGATGTGGAATCGTGGGCTCGAGAAAATACGGGCGAATCTTCACAACGCTGTGCGAATGTCAATGTCTGTTCAAACTTAGGTGAGATTGAGACATATCTTTGCTGGTAATGGATTCCTTAAGCCCTGTTCAGCTGAAGCTGTTCACACGATTCTCTAGTCTAATGTTGCCTCTTTTCCGACGGTGCTGGAGAGCGAGGAGTAAATCTATATTGGTTCGAGCTTATATCCTTCCGTAAGCAAATATGTAAGTCACTGGTTAGGTAGCAGTCGGTATAGCCAGACAATTCATGACCTCTTTTCAGGACCTTGCTAGAACGGGACGCCTAAACTACCGTTACAAGACCGAATTTCTGGGTGGTCGTGGACCTTAAATCACTATGCTCGGATGACGGCCAGAACTACCCACTCTAATTTTCTAGCCCCTTCAATCGACTCCAACCGAGCAAGCTGAGCGCATAAAGCTAGCTAGCCTGCGCGAACTGGCTACTGATTATGACAAAAGGTCCCATATTGTGATTGAGCGTTGTGAACTGCTTAGCCCTACCTAAACGCGCATAACGGCAGCATAAGGTAACGTAACCTTCTCGGACGCTCCCGTCATCGCCCACGGGGATTTTTTGGGAATATTCCTGGTGCGATTGAATCTAACGTAAGCGACGCCTTTATTAGGTAATAGTCCTTCGCAAGTCTGCATCCTAAGTCCGGTCTATCCGAGAGTTGCTATGTTTGAGGGCCTCGGCCGCCTCGTTCCTAATCCTCTGGCCATGGGCTACGACAGCGGGCAAAGAGCATCGCCCCACGTCCTCCATAACCGTAAAGCCAAGTCCCTTGCGTCGTCTACAAAGTGCATCTCCCATGACTATAAACAAGACGTTTGACTAATTCATATTCTTAGTATAATGGGACTTCCACTTGGTCTAGAATAGCCCGTAAGTGTCCAGGACCCCCTGGAGTAAGCATGTGATATGCAGGTATGAGGCGGCTCGCGCGGCGAACCTAAAATAGACCTTTTTTAAACTGGAAGATCTTAATCACGACCCATACCGAGCTTTGCTTACCCATGATTTGACTTTATACGGTGAAGGTGCGTAACTGCTCCATACATCCTCCAAGATACCAGCGACGTAAGCCGGAGACACACAGGCTATGTGTGAAATTTGTCGCGGTGGTCTTTGAGCTGTAGAGAGTGTCGCCAACGAGCTTGCGTAGGTGGTGGTTCGGGTCATATGATTTTAAGCAACTATACGGCATGGAGTGCTCGGTTTGATCGGCGTGTGAGACCAGCAGACCTCGGTTGCCTGGTACGTTCGAGTATGGATTTTGCCTTGGGGTGCAAGTGTCGGCCCTACCGATACAGCGTCGATATTGGAAGATCAGTGTCAAGGGCGTACGGGCCGCTGGATAGTGTTCGCTACAGTTCTTTGATTTCAGGTAAGTTGCCAATGGAATCCTACCTTGCGACAGAAATGACCGAATTAGTACGGGTGTACAGCACTAAATTATGACGCACGGAACCGCGCCGCTATATCGACCACACTAACTTGGATCTACCGAATTTATACCAATAAGTTGCGCAATCCACTCTTTGTGCGACATGTCCACCTAGTGGGCCGTGAGATGTTGAATGCGGAACGCTACGGATGTTATCAATCTGTAAGCAAGGTCGTTCAACTCTATCCACGCTTGCTATCTCGGCAATTTCTGTCTATATCAAGAGTTCAACAAGTCAGGTTTATGATATTGCCACGGTAGGAGATTAACGAGGTTCACTTAACCAATGTTCATCGTCGAGCTATTGGGCAAATCTTGTACGTCGAACAGAGGGTACGGTGAGTCGCGGTGACCCTGCAGTATAGGCGGTCGTAATTAAGTCCGTGCTTTATCCTCAAAAGCGTGACTGCGCTCTCCGTGGGGTTCAACGCGTTGCTAAGGGGTTATGGCGCCCGACCTTTGGGGAATGTACGCCGGGTCGTATGATTAGGCCGCAATTATGGGAAGTACTGTGGAGTGACGGAAACGGCCCATATATAGTCAGGGTCATACTCGCCTGCACAATGAGCAACGGCGCGACCGTCCCTGTGTCTAAATACCGTGGCACATGGGGCTCTGAATATTTGGGTAGTCTCCTGGCTCACGGATCGCGTTGGCTGATATAAACATAGAGTAGAATTTCGGGGGGGCACTTGATAAAGAACTCAAGCGACATTACTCTGAAATTGTTATGGCCAAAGACGAACTCGGCAAGGACGCATCTTACGGAACCCAACTCGAGCACAGCTCCGACCGCAGCCGCGCCATTGCTTCTCAGCATAGTCAGAGGGTTGCCAATCTTTTTCATGCTTAGAGAAGTGCAAACCCGAACTATTCGCCAAACACCGTAGTAGACATAGCCCGATCGTAGCAGCGCGGAAAAACATGACGCTAAAAGCTTTGGGACTTTATACAATGGGGCATAAAGGCGCGTAGGGAGATTTCCCACGTGGAAGGGGATAATTATGCCTCATGTCGATGCTCTTCCTACTTCACCGCAAACCGGTCACTCTTTGAGTATTCGAGGTAATTCTGCGAATGGATGCAAACTGAAAGCAGAGAAAGCCATACCCCTAGAACGAGTTGACGGATTTGCTCAGACACATACGGTCGGAGCGACTCCAACTGTGACACAAGAGAAACTTCCAGACAAAAGCCCTCGACTGCCTATCATAAAGCTTGTACTCGAGGGGTGGTATATTCCATAAACGGACCTGCTATTATCTCACTTACGGTCGTCAGTAACGCGTCAAGCATCAAAGACACGCCTTGCCGGGAATGTGCGTAATGCTCCTTGCCATAGTCCTTCTACAATGACCGGGTCTCCAAGGAAGGACCACCATATGGTCATTAAATCTCACATGGGGTGGGGATTGTGAAAGTCATTGTCCTAGCACACGAGACAACACAGGTAACCGACCATTTGTGCTCTGGAGCGACGTCCTCTTACCATCATTAACGTATTAAAATTGTAAAAGGTCGACGAAGAAAGTTGCTTGGGCCCGGCACGAATCGCTGGTTTTCTCCACTACAGGAGGGGTAATGATCAAGACTTGTGTATTCTATAGTTATCGATAGGCCGTCGAAAAAACCTGACATACCTAGGAACGATCATGAACAAACTTGACCGGCCGCTCAAATTAGTGTGTCAGGGCGTATGCCTTCCGCGAGGGCCCTTGCTAAGTATAGGCCGAGAGCCAGCAGATCGGGCCCGAGATAGCTTCGGGAGACGATGTACACGACATCTGGTGGTATTAGGCGACAAGGTCAGGGTTAAGAGGAGCTCTCTGGAACGTTATGTACATCCGAGATGGTCGAGTGACTCAATTGCGCTTGCTCCTCCTGTTTAGACTTAGTTGTAGGCTCGCCCGAGACGCATTTCACGACACGTACTTCCCATAGCACAAGAGCTTCATTAGCTCTGTAGCTTTGAAAAACCGCATTTGTAGTAAGGGCACAGACGGCAACGCATTCCGATTAGGTTTGAGGCCGATCGCTAGCTGTTAATACTCATAACGTTTAAGTTGCTCCGTTGGTTGAGCTTGGCGGTGCGAACCGGAGATTTATCAATGGGACGCTAGAAGTTACTTGCGCAGGCGTCCCGCTTGTCGAGCTCTCGGGCTGAGACGGCAGGCTCGTTTTTAATTCTCCACTCAATAATGTATAAGTTTCAGGGGTCGCTGCGTTCCCAAAAATACGAATACCCGGCGGCGGTCTCCTATCATGGAAATTATAATCGCACGACGGGTTATAAATTTTTGGGTCGTTCCGCCAATGGTCGGTGGAAGGACAGAATGATAATGCCAAGCAAGATAGTAAGGACTAAACTGCCCTCAATGCAACGATACTCTGGATACTCGTAGCCGCCACTTTTTCGAACTTCTCCTTCTATGCGAGATTAAATCAGATTCTGGGCGCCCATAGGGGAATTAAGAGCATGTAATATTAGCTGAACCGAATAGAAAGATTCACATTTAATTTTGCCCGAGGTCCGTAAGGGCCCTTTCGACAAAGGTCATATTCCTTACAGGTGCCCTAGTACATCCCGGTAGAGGCATATGAAAAATCCGTGTAGGTTCAGTGCCTTAGAGTCAAAAACGGCAATGGAGCGTGGTGGTTCTTCTGAAATAGTAGCATAGCCACGTGCCCCTGGGGGCCTAAAAGCCCCGAGGCGCCTCCACGGTCCGCCGTTCTATAAAACCTAGGTCGGTCAAGAATCTACAAACGCCCCCAGTGGTTTGCATAGCTTTTACGACACCGGAGGACTCACGTGTGGCAGAAGTTGAAATTTTTTGCTATTTTACCGGCTCATACCTCCGCGGTATATAGCCCTATGTGAATAGAAGCGCCGGCTTACTTGTCCGATCGCAAATGGAGGTTAGTATTCGCAGACGTGATCAAAATTTAACTCCCGTAATATAGCAATCTCATCCAACCGGTTCTACAGTAGCGGTTGTGGGGCGTTGGTAGAGTAAAACCAAACACCCCTAGTTCCCTGCCCTTCGTTACAAACTTCTATATCTGTTGTGTCAGGTCAAATCTAAGACTCCCCACTCTGTCTATGATCAACAAGTATTACAGAACCGGCACGGTAAAGCGGTAAAAGAGGCAATTATCGCATTCAGAGTAATGTGTATCGCACCTCCCTCAAACGCCCCCGCTGTCGTTTACAATTCTTCCGCATCTTAATCTTTGTTGTGGTGTGCAGTGTACGCTCGACGTTTTGGCATGTTGACAGTCTATTTGAAAGCCCGTCGACATATAGCGCTTACTCACCCAAACCCCACCGAGCTCGAACACGTTCCAAGAAGTATGGAATGCGGTAAACGCACGCTTGGGGACTCACCCCGATGTCTCGTGCTGCATAAGGCAGAGTCTCTGACAAGCACTCGGATCGCGCCTATTCGCGCTGGCACAGTCCGACCGTCTGAATAGTCGCCGCCCTACGCGCTGATTAGCTTCTGATCGGACCGAGACCTCGTGAGAGCCTGTCGAGGCACCGCCCTTAGTGGGGTACGGCTGGTAGCGCGAATCATTCTCACCAGGGAGTGTGAAATTTTGAGGGATGGCGCCTTTTAACCACCGGGTGAGACGGCCTTCGCTGCTTGGTTGCACGTTGCACACATGAGCTGAGAGCGGGTATATCGTAGACTCGTACCTGCTACTGTACACGGAGCGCAAGAACTTGTGTCGTCCTGTTATCCGGGGTAACGTGATTTAATTGATGTGGTGGTTACGCGTAATCTAACCCTGAATAGTCTATTGCAATGTCTGTAGGAGGCTTAGAGGATGAGATTAAGTCCGGAGCCCGGTGGAGCCTTGCCGATGCATCATGAAAAGGGGTTACGAGATCAGTGGGGGTGTTTGTCCTGTGGAGTGCACCAAGCGGTTAGCAATACAACCCAAGTAGACATCCAAAGCGACTCATACATACACATGCTAGGGACCGTCCTGGCGGTGGAGCAAACGCAATACTTGGAAAAAGCTCCGTTGGATTCGCTTAAAAGTTGCCTCCGCTTGTAACAGACATTGAATGCCCTTTACCGGTAGACTAGCATGAGGCCGGACAAACCAAACGCCAATTAGAACGCTTTATGATTTGCGTAGGGCGAACCCGGACAGCATAGAATCACTTTGGCCCTGTAGGACAGGAGCTGGGCCCCCACTGTCCTTGGGCCGCGGCGTGTCAACAAGAACAACACTGATTCAGGTGTAATAGGGTGGAAGATCTTCTCACCGAGTGACCTTGCTAACTTGTTAGTGCCTTGCCTCTCAGAAACTTTGCGCTGAACCGTATATCAAATTTTGACTATCGCGACCCGAACAGTATAAAGACAGCACACACGCAGTATCGCCCCTTCGGCATTTGGCCTTGAAGTCGTCATCGACCGCCTCAAGGACCTGACGACGGTGTACGTTGTGAGTTTTTCGTTAAAGTGTTATCGTTGGTTAGCCTTGATGATATAGCAATAGTCAGTCCAGTATTTAAGAGGCTTGGAGAGACGTGTTAGTGAATTACATGTGATCCGTGTTCACTAGTTAGACGAGTGCTATTATCTAACCATCCGGGCACTATCCTTAGTGGCTAAAGTTACAGCTACCCGCGAACTAGGGCTGAGCATCTACCGATCCAGTGGCGCTCCTAGTTATGTGGCTGCACAAGGTTATCACCACGGGATAATGGTGCTTGTCAGCTTGTTGCACCTTCTTTATTACAGGACGAATCCCCCAATCGAATACCGTCCAGGCTTCCTGTCTATAACAACATTGTCACTTGTGGGCCGCGTAATGCAACAGAGTTGTTAAGGGCGCAACGCTCCGCTGGCCGCGCGCGGATATAAGTCATGAGGCTCCTGACCAACCAGCCACCGGTAGACTTATATGATTGCCGCGATAGCCTGACGGCGTCAGAGGTCCCTGGACACCGGGCCCTTGCTGTACCCGTGGAGGAAACCAAGAAACTGCCGAGGGATGATCAGTTGGAGGGACTGACCTTTGTCTTGGGCTAGGTGCGCACTACGTGTCCGGCGGAGGGACAATTGTAAGATACCAGCCCTAAAATGCCGTTTTGGTATCATGGGGCCTGACTATAGGATTAATCTACCGCTGGTATAAGCTTGGGGTCGGGGATTGGATGTTAGTCGAGAGAGTCGTCTCAGCGATGTGAATATTGCAATAACCTACGCGTGGTGACTTAGTCGGAGACGCCCTAGCCTCCCCAGCTCTAGCGAACGATTAAGGGACGGTTTGCGGCACCGAAAGAGCCTGCTCTACACACCGAATACGGTAGGCTATATTTTAGAGTTCACTTGCCGCACTCTGGAATCGGGCAACTTGGACGTGAGGTCCCAGATAAAGGCTTACAGGATCCTAGAGTTCCCCCTGGGTAATAAATGCTCCTCGGATTGGCCGGCGGGAAGCAGTGGCAAGCGGCCTCTACCCCACAAGACGGCTCCCCCAGCGAAAGTGTGGAAGGAATTATTTCGGCCCAGAGCTTTATCATTTACTGCCGAAGAATAGCAACGTCCCGATTTAGTTCCGCGGAGTAGGATTATCATGCTCGCTAAGAGGCTGGCCCGACTCCCGATTTTGGCGGCACCATCTTGGGGAGGCTAACTAACAATTACCGGATATATCAGTCAACACCGCGAAGTATAGAGATATCTACTGTTGAGCAAACGCTTGCGTATCAGTACCGTTCTGTGTAAAAAGTCCTTGAACCGGTCACGGAACAATACCAATTAACTATCAATCTGCGCAACGGGCTAAGTTAGACACTGACGGCTGGCAATAGGGCCATTCAAGCGCAGATGGGTGGTCTCCCAGGCAACGGAATTATAAGCCTAGATAGCTGGTAGTATATGAGCTGGTGTGTGCCCCGTAGAAAGAATTAAGCCTCTCGACAATCAGTTGTCCATGCCGATCGTCATTAAGGCTTCCTAGTTATAGGAGAGTTATTATTTGCCTATAAGCAGCGAAGAGAGAGAAAGAAACAGCGCATAGTGTTTAGATCTCCGCGCCCAAAAAAGGACAGATTGGGGAAATCACACAAGGGTGTTTAATGAACTAATAGTATGTATAGCAGGTCGCCCGTTCCGCCGGCCAAGATTTATACCCCTTACTTTGATGGTGCCTGAATCAACAGTGTTAGAGGGTGTGTTTTATATCTGCAAGGGCCTCCGACCTTATCAGCGTCGGGGGGCTGGGGGTCCTTCCAGCTCTACCAAACCAATAAGGTTCTAGTCGGCACAAACAGTAGTCTCACTTAACCTTTGCAATGCATGTATCGTTGGGCGACCTCTACGCTGATTGCCGCTCATGGACGAGACGTGCCCTACTACTGCACGTCATCAGACCTGAACCGGTACATCTCAAACGTTCCTCGCACAAATCGTGGCTGCGTTGGATTAACAACTGTATTGATATTAAGTATGACGTCACTTGACCATTGGCAAAAACTCGTGACGGTGAAAGCAAAGCACATCAACTGAATCTCCGCCCATAGGTACTCGGACTGCCCCGCTCTTTCTTACGTATTGGTTGTAAAAGCAGCACGCGTACGGCACGCATTGGGCATCTACATTCGTAGCGGCTCCGGCGGGATTCCGGCGTTAACCACGATTATTATGGTTGTTGATGCTATAATTAGCGGCTCCCTTCGAATACTACTCTGAATAATATAGTTAAGCGCTGAGCGTATATCCGTTCACACGCTGGCAAGCCGCAGCACAAGTCTGCTCGCCAGGGACTGTACGCTGGGCCAGGAGCTCCCCGTAACTACCGGTTAAGGCGTTCGGATCAATCCTCAATATCTAGGTAATCTACCACATCCCCTTCACGGGGTATGGTTTCGTGTACGCCTCGGGCGCGCACACAGTTGCGCCCTTGGGAACTCTGGCCGAAGCAAGCGTGGCTTGAACATCAGATAGGGTTCGGCTGGCAGACTATCGCTGCGCCTCATGCAATTTATACGAAAACCGAAAAGGCAATAACTCTATCCTCCGCTGGGGAGACACATCGGACATCAGCCGAACTTTGTGCCTTGGTACATAAAGCATTTTCTGCGTCGACCCGACGCCGAGCAGAGACTACAAGCTCAAGGTCTTAATTCTGGAAAAAACGTTGTGCACTCTGATCAACACCTCCCTTGGAGCACGCTTGGACATAGGATAGGCTAATCCAGTAACACACAGCACCAGATCTACCCTCGTCACATGGTGATGCTCAGCTTACCCCCTATCCATGCCCGTGCGGATCTTTCTTCCACGTGGTAGTCCCACTGAAATGGTCTGGGGTGCGTTTGAACAATATACCGTTGAAGTGGAACCTTATGACACGTGACTTAGTACAACAACTTGATCATACGATTCGGGAGTTAAGACCCAAGGGTACCGTCCGGTCCGAATTAAGAGAATATGTGTGCGCTACGTGCCTTATATTTTAATACAGACGTACCCCATTATACCTATTATTAAATTCGGATCCCACCGAGGAACGGGAGGTTTCTAACTTTGGTACACACCATCTTTAGTTGACAGTAAGTGGATCCGATGTTTCTATTGCTTTGTCCGAGGCGATGTTTTAAAATAAGCGCAAATGCATGTGATGGATGCTGATCTCATCGGTAATCTCACAATCGTATCATTTCGTGGGCTAAGGTTCAGATATCCAATAGTGTATTCGATCCGAGCAGATAGACGATCATAGGGACGTGTAGTTGAGGCCAACCACCTTCACGGATAAAGGGCTACCAGCGCAGAGTCCGGTAGTAATCAGCGGTGCATTGGCCGCAACTTTCATTCGTAGTTTCGTTATATAAGGTACCTTGATTAGCCGTTCCAGGATATATAATTTGGACGGCTGTGGTCCTATATGCTACCCGTGTTACTCTCTTTATGGCACACTAAGCTTGGAGAGGAACGAACTCGAAGTGCAAAGTAAGAATGCAAAAACATTAACGTAAATTCATCGACTTCGAGATTCTTTCGTATCGACGACTGCAGGAAGGACGATTCGCTCTCTTGTACTAAGGTAATGGCACGGCTTCTAATCACGTGCTAACGCACGTCATGGCTAAACTCGGGCCCCCTGGGTAGTAACCAGAGGCGGCCACTGACGGAGTAATCTGGCCTCGCAAGTGGCCTCGCGGGGATCCATGGCAACGACCAGATACTAGCAGCTCGGGCTAAGATGGTCCCACCTAGAGTCTCTACATCCTCAGCAGTACAGCGTACCCCGACGCTGTAACCCTCCAACCTCCCGACTATTCGGCGCAAATACATGGGTGAGGCCTCCCGGTCTGCGTTAATTACGCAGCCTGTACAAAAGATTTGTTACAATTACGATAATTGGATCCAACTAACCGTTCTCTCTCGTGTCTCGAAATGTTCGTACGCTACCGCTGTCATTTTTCGCTGGACTGGCTCAAGAAGTCGATGCGGCTTCCTAGCTACCACATGATACAATTCAGGCCCTCCTCGAAACGATCATCTAGAACTGAGCTCTCCACTCAAATAGCGACATTAAAGACTATCGGTAAAGGGAAAAGAATTTTAATCTGACACCAGAGCCTTGTGATTACTCAGTCTGGGCGGGCTACATTGATACGTGTCCTAACTACAAGCAGAACTGGCGAATCTTGGGACTCACCACTACCGGAACAAAAAGTCACCTCACTACATCTTAGTATAATCCTACCTACGCCCGCAACCCTGGATGAAAGACAGATTGCAAACGCGTGAAGTACGAAGGAATCGTGGCGAAGTATTGCGTGTGAAACGTCCGTCAATTTGGGTAATACGTGAGTTCCGCAAGTATGTGAGAAAGGAAATCTTTTGTAAGGCCAGACTTTTCAAGACCTGCTATAGTTTTGAAAACGACCCACTCGATCAAAACGAGTCATATCCCGCTAGACGCAACTGACTTGCCGATGCGTGGAACACACTCTTGGCTTAGCACGAGAGTGGTAGTCCAATGATAGCTAGTGCGGGTCTTCGGGTACGCATTGTATACATTGACCCGGGGTACAATGCGAACCCGCGGCAGAATATTGGGGCGACTATCGGTTGAGCGATAGGCGGTCAATGATTATACATGCTGGCGTTTCGGTGCTTTGACACAGATGTCCTGCGAATGTAGCACAACCGGTCAGGGACAGCCATCCCATATCGTCTGTAGCCACACACTTATCCCGGTGTCCGGCGCAGTAGAAGAATGGCGCCGATACTAACGTTCATCAGTAGGGGCGCGACTGACATTATAGACTTCAGTGAAAGGGCCCCGTGCACATATATATCCCGCAAAGGTGAATCGAGTACGTCCCTGGCAGGAAAATCCCCACTAACATGTGTCCAGTTTCTTCCACACCTTCCAAGGTTGTAGGCTTCTTTTACAACTTTTGAACTGGAGTACAAACAGGAACCGCAGGCCGCAATCTTGCGGGAAGTTGGGATCTTATGCCGATGTCGGGGGTTTTGTTGCCACACCAGTTTGGTCAGATCGGTTAAGATCATTTCCTCAGACATTGGTAACCATCAGAACTATTCATCATCTATGCGCCCAGTCCCTTATTGTGGAGTCTCGTTTCCACTCCGAGTGAGGTATGGATTGTGTGCGTAACAAATTCATTCACGTTCTTACAGGCGTAAATGGCTACAGCCACGCATAGGAAATGTGACCGCCTGCAAGTACAAGCTAGCCGAGTCCACAAAAACTTAGCACGGAGGTGGAGTGGTCAGGCTCGTTTTCATCATTGCATGCAAGGCAGGCGTAGACAGATCTAGTATGATGCGACGCGATTATTCCAGCTCTACCTTCAAAGCCTTCGTTGATGTACGTTGGCGGCACCGCGATACATGACTCTCTCAACGGAGTTCGCACTACTAGATTACGTATTACAGGTCTCTAGCGCAGGGCCCTCCCTCGGTAATGTAGCCATCAACCCCCTAATTTGATTCAGAGGTGGCGTCCTGGGACAGGAGGAGGATTGGCGGGGCGTTTTCCGACAACTGGAAAGGTCTTGTACGATGGAGGATCGCATGGTCACTGCCCGACATCTTGCCTGTTTTCTGAGATGAGGACTGTGTGCCCTATGTATATAGCTCTATGTGGGGTTCCTGTGTTATCATGTCGTCGCGTGGACAGGAATGGTAAGCTTTAACCTCGCGATGTTTAAGGAGATTGTGTTACTTACACCAGTTCAGCGCTTTGAACACTCGCCTCTTAGGCAGGCCGTGAGTAGGTAAAAGGTTTCCAGGCCCAAACAAAACCGAACAGGATCCGTGGGCCCAGGCGAGGAGGGGGGAGCAAGTCCATCAGCGGATGAATAGATAGTCGAGACCAAGAGAAAAGATAGCAAGAAAGCGTTAGCTCTTCACGAAGGGGCAGGTGTCACTGCGTCTAGCAGAAAAGTATCATATGATATCCAGCGCCGTAGTTTGAACGCACCCACAGGCTACTCGAGCCGATAAAGCAATACACTTGCTATTCGATACACTCCAGTTAGAAGCGGGCGAACGTCCTAAGGCTATGGGGGCCCTACTGCGCAAACTGAAATTCAACATCCGCTCAAGCCAATGCAGCTTTAGAGGACCTTCTAAAACTCACGCCCTTATAGCAGCACCGCGCATCCTGCAATGTAGCAGTTGCTCCTACCCAGTAATCCAACGCCGGTTGATAAGATATCTGAAGAGTTAACTCGACTCACGCTAGTTGTGGGAACCTAGTACTGGTGTCTAAACAGGTTGCCTGTACACTAATGCAGTGCTGTAGTTGATATATCCCATGATTCGTGCGTGGGATGCTCATGTCCCTGGTCTCACAGGGTCATTCAGGCATCGCTAATCAGATTGCTGTTCCTCTGTTGTGTCAAGGCAGAGGCTTTTTGGGGGCGACGAGATATATCCAGGTTATAAGCAGTGCATATTCAACAGGATGATTGCCGTACTTTCACCCCGGGGCCTCTTTCACACTGAAATCTGACGTATTAAGATCGGCCGTTGAACAGCCTACAGAAAGAACGGTTGGCTTTCTACCTCCCCACAACGCGGGAGGTCGCCTCGACGATACAACGGTGCAAAAAAACGCTTACCCTACAAGTTCTCGAATTGTGTATAGCGGTTAAGGAAACGTGGCGCTCCCCCGGTCGTCTCCGCCATTCGCCTGATTCCTTGTCAAACCTGCTAGATGAATAAGTCATCTCGATAAAACCGCCACGAGGGCTGGACTGCCGTGAGCTCGTTCTGTCTAGCGATTAGCACAAGGCTAAGAGAGACTTTTCAAACTGACCTCTCCATCGAGCGCGAACGGATACCTCGCACGAGCTGTGTTTTACTGTAGCTCGACTCACGAAATCATAGGAGAGTGACAGAAGGGCTGTCTAGGGCTGCGGAGCCGATCCGTGTTGACGTGATCTATCATCGCAATATAGCCCCCACCATTATTGGCGCAGACTGGGAAGATCGTAATAGCGATCAGAACGCGTTCCCTTAACTACTCGAGAGCAAACGCCGAATCACTACGTACCCATAACTGCCTATATATGAAGAGGAGACTTCAAGAGGAATAAGATGTGCCGATAGAAGGTTGCCTCTTGCAATTTATGCTGGAAACGAAACTGACTCAGTATCATAATGCTCTGCGTGTACCGGGAAATGAGGAGGAGCCAGTATTATAATCTTGCCAATTACAACCCAACGCCGCGTTCCAGTGCTTATTTTTATTGCCCCTCACTGAATGGGTTCTACCGCTGAATCCGCGTTGATTGAGCAGTCCAGTTTGTTTACATTAATTCGGGCCTGACGGCGGCGGTAGTAAATGCGATCATGGGACCTCCCGCGAGGACCCCGCAGTGGCTGTAGTACGATTTCACAAGCGTGCGTGACAGCTTCGCGGCCAACGCCATGGGGAGGTAAAGCGACTGCAGTGACGCGACATGACGTGAAACCGTCCGATACCCTGCATGCTGCATCTTGCATGCCGTACGCGTATACCTTCGTTCTGCCGGCGTTCTTAAGCAAGGCGGTGGATTTGTAAGAACAGTAACGAGTACTACGTGCAGGATGCGGAAGCGCGCTTCACTAGGACCATGTACGGTCATTTCCGCTCCGCGTATGGTTGCACGATGCCGCTACAAAATCATGTCCTCTTCTCATAGCTTCATGTACCTCTCTCTCAAGACAAGGACTATGCTATGACACCATGAAGCCTTCTTCTGAATAGGCACTGCCCACATCGGTCGTAGTGACCCCACTTGCGTTCCTACCCGATTCGCATCAGCGAATCCAGCCCCTACCTGTCGAGCACCGCCCAACGCTTGATTATTACTCGACACGACCCATGTCTTTCCAAGTGTTCAAACGCACCCGTCCTGTGGCTTTATGATTACATGCGGTGCCCCGTGTGACTGGCGTAAACTCCACAAGCTTCTCGCAGTGCTGTAAGGCACTAGCGTCGTTCGTCATCTAGCTTAACGTCGCTACTATGCTGCCAAGAAGCGTAGTACAGAGCCTACATAAGACTGACAGCCACAGCGGCTACGGTGGCAGCAGCCAATCGGTTGCCGGAGTATGAAGTCAACTTGGACTCCGGCAGTAGACCAATAGGCTTCTAGAATTAAACCGTTGGCACGTGCGGAACAGTGACATGTCGTCGAGTGCCTAAAGCCCCGACGGAAGTATCACCTTGACGTCTACCAGTCTCTGTAGTACAAACTAGTAGCCTACCTCGCCTTTAGCCGTCTAGTCAGTCGCTTACCATTAATTCTCATAGCCGCTGACCCGGCCGCTGAGGGGGCCGATAACGCCCGGCGCATACAGTGCAGTTCAGGTCCCGGCGGAATTTACCGGAGCGGTAGTCGTCGGCTAGTGGTTTCAGACAAGGACCCATCGGGAATCCTCCGGATGTAATTTGCCAGTTA"  # Aquí puedes incluir el genoma manualmente
-d = 6  # Maximum number of allowed errors
+# Example usage (runs only when the script is executed directly)
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Approximate pattern matching (up to d mismatches).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (sharded scan, see parallel_scan.py; default: 1)")
+    args = parser.parse_args()
+
+    # Define the pattern and the maximum number of allowed errors
+    Pattern = "TTGCCAGTTA"   # Example pattern
+    Text = "GGCAGCTTTGGTGAGGGACCCACCCTCCGTCTGGTCTGCGTTAGGAATGCGTAGTGTGTCCGCCATCAGTGCGTTCCTCTTATAATTGATGAGGGTCGTAGCGGTGAGGGCACTTGCATAAGATCGGATCTCTCACTCATGCTGGCCGGTCAAGCACAATGCAACTTAAAAGCTTTACGTAGATTCATCGTTCAATCGCAGAGGTTTAATGACTGAGGGCACCAGCGAACGGATAAGTGCGTGCGCACAGTTGGAATCCTGATTTAAAAGGACGTTCTCAACGGTGTTCCAGCTAGCGGTACCAAGTCGTTTCATTTCGAGGCGGTCGCAACACATTGTCTTACAACAACGAAGTGTCGAAGCGTAAATGGTGATGGGGGTAATCCGCGTGATCTTTACGCCTGTCCTGAGGCAAGGTTCACTACTCTGCCGCTACGTGCATGTTTTGTTGACAGGAGACACGTTGCTGTGATCTCGACCTAGAGGGCTTCCCTCAAGTTGTGTCCCGGACTAGCACAACAAACCTTGCCAGGAAGGTGCTATACCAAACATAGTAGAATGCTTGCGTAGGTGAGTCTTCCCCGAGGTCTATATGCCTACTGATTGTTCCGAGCAAGGTGCCCGAGAGGCATTTCGCACTTTTTTTCCGTCTGTAGTTTATGAACCCATCCCCCAATTAGAGATAGACCCCCATGGCGGGCTTTATATGCTTCTGCACTAAGTTGGGCGCGCTTGGGTTGTATAGCTACGGAAATGAATAGGTACGAAGGCGATGACGGGTTGAATGTTTAAAGACGACTAGACCCGTGCAAATCATTTGTGAGATACGGGGCCAGTTATAACTGCGTGATCGCTACTCGGCCAGGAACAGTTGGGTAATGTAGGTTATTCTCTTATGAGGATGACAGTTCAACCATGGGCCAGTCTCGCAGACCAGGGCAGGTAGGTCTCGAGCGGCCCTGGTAACGCGGCGCTTGTTAACGACTCTATATGAACCAGGGGCTTGCACAGGCGGGCAAACCCTCCACGAGGTTGTCCGAATCAGCCTGCCTGGCTAATGCCTAAGTAGATTTACGGAGTCCCTAATAAGCCAAGCCGTAGGGTATGTAGACACGTATCCCTTGTTCCTAAGAGTACGGAGCTTCCGTGCCCTGTTGGTAGAGAGAGTGGTATAGAAGAAATTTCGGCTGTGTTACTCCGCATAGGCAAGGATAAGCCAGTATACCCACTGGAAGCGGTTACTCTGTGCAAGCCTTTCTAGGAGCTCTGCGTGTCAGGCCGATGCCCATTGCGGTCACCTTTGGGGAGATTCGTACACTGAATCACCGTCTGTAGCATATGCACACGCGTATTCGTAACTTAAATTTGTGTTCACTTCGGACGACAGGATAGACAGGCCGTCGGGGGTACGTGGGAGTAACCGTGTGTCTCGTCTCCATCCTGTGCCTTAAGTTCCCAGCAGGAGGGTTGGCCTTTGTACTTGAAAGTTCAAGATACCGGATTTCCTGCTCAACCCCTACCTTCACCTTCGAAGTTGGCCACTGTTAGTAACATAACCGGCTCCGGGGTCGCTAGGTTTCTTGATGGGTACAGGCCTCAGTTAGCTCCCGCTCCGGATGCCAAGATCTGATTTGTTTAGATCGGATCATACCACCCAACTAGCGGTCTCAAAGCTCGTAGTGCACACGGCAAGACGGCTGAGCAAACACTGGCCACTAAAATTATCCTGGAAGAGTGATGGAGCCTAAGCATATGGTGCAATGCGTCGGGTATGATACGAATTGTCACCATGACAGCGCCCGCGCAGATATCTGTCTCCATTCGTGGGTCTGAATAAATATGTACTTGTTGAGTTCCGCGACCCATTGTACACAGTTCTAAGATGGTCGTCACGCGCAATGTCTGAGCAGAAGTAAGATAAGTGGCCACATCTATTTTTACTTACCCCGCCAATATTATAGTCGCCGGTGCCCCGGGCAAAGATGCGGAAGAAAGATCGACATTGGCCGTTATTGCTCGTACGTCACCTGAGAGTGAGGGGAGTCGCGGGTTGCACTCTTACACCGGGACCCAGGTTTCCAAGACAGAACCCCATACGAGAGCGGACCGCAAGTTCGCCACACACTTCCAGGTAAGGCTGCCTGAAAACGGATAAATTCACTACTTAGCAGAATGCCATAAATTCCAAGTTGGCGTACAACCGTAACGCCGCGGCCCCTGCGTATAAACCTTCGACAAGAAAACAGACGATCCACGTATTCGGTCTCTGTAGTCCGTAGTGCACGTGTGAGGGATCCCGATTTCCCTGATAAGTTTTAGGTCTCGCTGGCGTACTCCTGTCACATGCCATGCCCAAGGACGAGTCAACCGATACCATCTCTGCTACTCTGACAAATCTCACGAATGAGCTGAGAAACGCTGATATGTTTCACAGCAAAAAAATATCGCCACTCCCAGTGTCCGTTGTTCTTTTTAGAATTGGGAGATGCATAAGACTTTCCGACCGTATCGAACGGGCGTAGTCGGGGTGAGCAAAATAGGCCATTAACGCTACCAGGGTGCAGCGGGCGCGAAAACACGGGACGCATCATATGATTGGCACCCGGTAGGCACGATATGAGAAACATACTATGCGGAAGACATCCATGCACATCAGTCTCCGTTCGCGGCTTATGAATCGAAACCTGCGTTTTAAAACATAACTCGAGTGGAAGATGGGATCAAAGATAGGCGATAATGACTGGATCACTGGGCGTTTTTATAGTACGCTGTTAAGGTACACCAATGACCACTGTGGCTCATGAGAATCTAATACCTCCTCTCTCACACAAAAGTCTTCCTGCCGGGGGTGGTGGACTCCTTCTACTGGGCTTCTGCTTTAATGCTATAGGATTTGTAGCGAGAACAGTCGCGCCGTAGGGTTCTGCGATCGTCTTTTGATACGCCGTAGGCGTTCCCATACCGATGCGCGTACGATTGCCGATCACGACCACCATACGCTCGGTGACACGATAAAGAACGACATGCTTTTCGGCAAAAGCATTACCCCCTATCACGGGCCCGAGAAAAGGTCTGAAAGCCATAATACGTCTGATTTTATTCGGAGTGTCTCCCGGACCTCACATCATCACATACGAGAATGCTTCGGCGCAAGCCAACTGCGTCGTAGTCTGGGACTGCGTACTTTCTCGAATATCCAACGGTAATGGCGCTCGGAATAATGAAGGAAATCCTCATAGTGCTACCCGTTGCGCCAGAGGGCAGATAATAGTACATGTGATTTATTCGCTATCGTCACGGTCTGGGAAAGTACAGTTCGGAAGCCTTCCATTCCCTGACCGTTAGCCAGTGGGGGTTCCACTGTCTCACCAATACCCATTATGTTATAGGAGGACCAATGTCGCATCGTGTATCATGCCCGAGGACTGTTACTAATTATGCGGCTTCTTATCTGCGGAGATGGCAGAAGACGCTCCCTGGTCGTCTCTCCTTCCTTAGGTCTAGCATCGAGCCGCAAACCAAGAGACGAACCCGAGAGTGATGAAACATTGTCGACCCACAAATCCTATCGGGGGGACAATCTCTAACACTCAGAAGATTGCCAATCCTCCATTCTTCTGAAGGTCCATAAGTATATAACCGTAATGGCTTCGTTTTCGGAGTAGTCAGAAGGGGTCGTAAGGTTGCCTGCGCCCCAGCTGTCCCCTATTCCGTTATCGATGGTCGTTACAAGTGCATCAGCCCGGCATTGCGAGACAAGATGCGTTGCGACAGTAGGGGACACCGCGATTACCCTCTTCAATTCAACCCGTCAGCTTGTAGCGGCATACCATCAAAAGGGAGGAATCGCTAACAGATCCCCGAATGGGGTTCATTCCCCTGGGCGCAGAAAGAACTCATCTCTTTCTCGTACCGCGCAAGAGTGGTTTCGGCCTAGGTCTTGCGCGAGTCAACAAGAGGTAGAAGAAAAGACCGCCTAAATTTCTCTCATAGGCCAAAATCCAGCATAATCGCTATCACAGAGCACAAGACTGGCTCTCCGCTAGAAGTGGTGTTAGAGCGGAGGTTGCTTGGCGGTAGATCCACCCCGACGTCACTCAGTGTTGAAAGCCATGCAAGCCGAACGCCGAGCCAGTTATGGCCCTCCAGCGTAAAGAACCGTTACTTGCAGTCTCCTGTCCCCGCGTCAACATACGAGAAGCTGTAAATTTAATCTGGCGAACAGCAAGCTATCCGGAAGGCATGATGCAACCCTCATTCCGGAGTGTGGTAAGAATAAGCGTTGTTTGAGAACTGGTCGGCTGCTCACACACCAGGACAGAAGGTTGTGTTGCTGGTAGACATAGGATAAAGATAACTTCCTCTACAGAGACGCATATGGATGTGGAATCGTGGGCTCGAGAAAATACGGGCGAATCTTCACAACGCTGTGCGAATGTCAATGTCTGTTCAAACTTAGGTGAGATTGAGACATATCTTTGCTGGTAATGGATTCCTTAAGCCCTGTTCAGCTGAAGCTGTTCACACGATTCTCTAGTCTAATGTTGCCTCTTTTCCGACGGTGCTGGAGAGCGAGGAGTAAATCTATATTGGTTCGAGCTTATATCCTTCCGTAAGCAAATATGTAAGTCACTGGTTAGGTAGCAGTCGGTATAGCCAGACAATTCATGACCTCTTTTCAGGACCTTGCTAGAACGGGACGCCTAAACTACCGTTACAAGACCGAATTTCTGGGTGGTCGTGGACCTTAAATCACTATGCTCGGATGACGGCCAGAACTACCCACTCTAATTTTCTAGCCCCTTCAATCGACTCCAACCGAGCAAGCTGAGCGCATAAAGCTAGCTAGCCTGCGCGAACTGGCTACTGATTATGACAAAAGGTCCCATATTGTGATTGAGCGTTGTGAACTGCTTAGCCCTACCTAAACGCGCATAACGGCAGCATAAGGTAACGTAACCTTCTCGGACGCTCCCGTCATCGCCCACGGGGATTTTTTGGGAATATTCCTGGTGCGATTGAATCTAACGTAAGCGACGCCTTTATTAGGTAATAGTCCTTCGCAAGTCTGCATCCTAAGTCCGGTCTATCCGAGAGTTGCTATGTTTGAGGGCCTCGGCCGCCTCGTTCCTAATCCTCTGGCCATGGGCTACGACAGCGGGCAAAGAGCATCGCCCCACGTCCTCCATAACCGTAAAGCCAAGTCCCTTGCGTCGTCTACAAAGTGCATCTCCCATGACTATAAACAAGACGTTTGACTAATTCATATTCTTAGTATAATGGGACTTCCACTTGGTCTAGAATAGCCCGTAAGTGTCCAGGACCCCCTGGAGTAAGCATGTGATATGCAGGTATGAGGCGGCTCGCGCGGCGAACCTAAAATAGACCTTTTTTAAACTGGAAGATCTTAATCACGACCCATACCGAGCTTTGCTTACCCATGATTTGACTTTATACGGTGAAGGTGCGTAACTGCTCCATACATCCTCCAAGATACCAGCGACGTAAGCCGGAGACACACAGGCTATGTGTGAAATTTGTCGCGGTGGTCTTTGAGCTGTAGAGAGTGTCGCCAACGAGCTTGCGTAGGTGGTGGTTCGGGTCATATGATTTTAAGCAACTATACGGCATGGAGTGCTCGGTTTGATCGGCGTGTGAGACCAGCAGACCTCGGTTGCCTGGTACGTTCGAGTATGGATTTTGCCTTGGGGTGCAAGTGTCGGCCCTACCGATACAGCGTCGATATTGGAAGATCAGTGTCAAGGGCGTACGGGCCGCTGGATAGTGTTCGCTACAGTTCTTTGATTTCAGGTAAGTTGCCAATGGAATCCTACCTTGCGACAGAAATGACCGAATTAGTACGGGTGTACAGCACTAAATTATGACGCACGGAACCGCGCCGCTATATCGACCACACTAACTTGGATCTACCGAATTTATACCAATAAGTTGCGCAATCCACTCTTTGTGCGACATGTCCACCTAGTGGGCCGTGAGATGTTGAATGCGGAACGCTACGGATGTTATCAATCTGTAAGCAAGGTCGTTCAACTCTATCCACGCTTGCTATCTCGGCAATTTCTGTCTATATCAAGAGTTCAACAAGTCAGGTTTATGATATTGCCACGGTAGGAGATTAACGAGGTTCACTTAACCAATGTTCATCGTCGAGCTATTGGGCAAATCTTGTACGTCGAACAGAGGGTACGGTGAGTCGCGGTGACCCTGCAGTATAGGCGGTCGTAATTAAGTCCGTGCTTTATCCTCAAAAGCGTGACTGCGCTCTCCGTGGGGTTCAACGCGTTGCTAAGGGGTTATGGCGCCCGACCTTTGGGGAATGTACGCCGGGTCGTATGATTAGGCCGCAATTATGGGAAGTACTGTGGAGTGACGGAAACGGCCCATATATAGTCAGGGTCATACTCGCCTGCACAATGAGCAACGGCGCGACCGTCCCTGTGTCTAAATACCGTGGCACATGGGGCTCTGAATATTTGGGTAGTCTCCTGGCTCACGGATCGCGTTGGCTGATATAAACATAGAGTAGAATTTCGGGGGGGCACTTGATAAAGAACTCAAGCGACATTACTCTGAAATTGTTATGGCCAAAGACGAACTCGGCAAGGACGCATCTTACGGAACCCAACTCGAGCACAGCTCCGACCGCAGCCGCGCCATTGCTTCTCAGCATAGTCAGAGGGTTGCCAATCTTTTTCATGCTTAGAGAAGTGCAAACCCGAACTATTCGCCAAACACCGTAGTAGACATAGCCCGATCGTAGCAGCGCGGAAAAACATGACGCTAAAAGCTTTGGGACTTTATACAATGGGGCATAAAGGCGCGTAGGGAGATTTCCCACGTGGAAGGGGATAATTATGCCTCATGTCGATGCTCTTCCTACTTCACCGCAAACCGGTCACTCTTTGAGTATTCGAGGTAATTCTGCGAATGGATGCAAACTGAAAGCAGAGAAAGCCATACCCCTAGAACGAGTTGACGGATTTGCTCAGACACATACGGTCGGAGCGACTCCAACTGTGACACAAGAGAAACTTCCAGACAAAAGCCCTCGACTGCCTATCATAAAGCTTGTACTCGAGGGGTGGTATATTCCATAAACGGACCTGCTATTATCTCACTTACGGTCGTCAGTAACGCGTCAAGCATCAAAGACACGCCTTGCCGGGAATGTGCGTAATGCTCCTTGCCATAGTCCTTCTACAATGACCGGGTCTCCAAGGAAGGACCACCATATGGTCATTAAATCTCACATGGGGTGGGGATTGTGAAAGTCATTGTCCTAGCACACGAGACAACACAGGTAACCGACCATTTGTGCTCTGGAGCGACGTCCTCTTACCATCATTAACGTATTAAAATTGTAAAAGGTCGACGAAGAAAGTTGCTTGGGCCCGGCACGAATCGCTGGTTTTCTCCACTACAGGAGGGGTAATGATCAAGACTTGTGTATTCTATAGTTATCGATAGGCCGTCGAAAAAACCTGACATACCTAGGAACGATCATGAACAAACTTGACCGGCCGCTCAAATTAGTGTGTCAGGGCGTATGCCTTCCGCGAGGGCCCTTGCTAAGTATAGGCCGAGAGCCAGCAGATCGGGCCCGAGATAGCTTCGGGAGACGATGTACACGACATCTGGTGGTATTAGGCGACAAGGTCAGGGTTAAGAGGAGCTCTCTGGAACGTTATGTACATCCGAGATGGTCGAGTGACTCAATTGCGCTTGCTCCTCCTGTTTAGACTTAGTTGTAGGCTCGCCCGAGACGCATTTCACGACACGTACTTCCCATAGCACAAGAGCTTCATTAGCTCTGTAGCTTTGAAAAACCGCATTTGTAGTAAGGGCACAGACGGCAACGCATTCCGATTAGGTTTGAGGCCGATCGCTAGCTGTTAATACTCATAACGTTTAAGTTGCTCCGTTGGTTGAGCTTGGCGGTGCGAACCGGAGATTTATCAATGGGACGCTAGAAGTTACTTGCGCAGGCGTCCCGCTTGTCGAGCTCTCGGGCTGAGACGGCAGGCTCGTTTTTAATTCTCCACTCAATAATGTATAAGTTTCAGGGGTCGCTGCGTTCCCAAAAATACGAATACCCGGCGGCGGTCTCCTATCATGGAAATTATAATCGCACGACGGGTTATAAATTTTTGGGTCGTTCCGCCAATGGTCGGTGGAAGGACAGAATGATAATGCCAAGCAAGATAGTAAGGACTAAACTGCCCTCAATGCAACGATACTCTGGATACTCGTAGCCGCCACTTTTTCGAACTTCTCCTTCTATGCGAGATTAAATCAGATTCTGGGCGCCCATAGGGGAATTAAGAGCATGTAATATTAGCTGAACCGAATAGAAAGATTCACATTTAATTTTGCCCGAGGTCCGTAAGGGCCCTTTCGACAAAGGTCATATTCCTTACAGGTGCCCTAGTACATCCCGGTAGAGGCATATGAAAAATCCGTGTAGGTTCAGTGCCTTAGAGTCAAAAACGGCAATGGAGCGTGGTGGTTCTTCTGAAATAGTAGCATAGCCACGTGCCCCTGGGGGCCTAAAAGCCCCGAGGCGCCTCCACGGTCCGCCGTTCTATAAAACCTAGGTCGGTCAAGAATCTACAAACGCCCCCAGTGGTTTGCATAGCTTTTACGACACCGGAGGACTCACGTGTGGCAGAAGTTGAAATTTTTTGCTATTTTACCGGCTCATACCTCCGCGGTATATAGCCCTATGTGAATAGAAGCGCCGGCTTACTTGTCCGATCGCAAATGGAGGTTAGTATTCGCAGACGTGATCAAAATTTAACTCCCGTAATATAGCAATCTCATCCAACCGGTTCTACAGTAGCGGTTGTGGGGCGTTGGTAGAGTAAAACCAAACACCCCTAGTTCCCTGCCCTTCGTTACAAACTTCTATATCTGTTGTGTCAGGTCAAATCTAAGACTCCCCACTCTGTCTATGATCAACAAGTATTACAGAACCGGCACGGTAAAGCGGTAAAAGAGGCAATTATCGCATTCAGAGTAATGTGTATCGCACCTCCCTCAAACGCCCCCGCTGTCGTTTACAATTCTTCCGCATCTTAATCTTTGTTGTGGTGTGCAGTGTACGCTCGACGTTTTGGCATGTTGACAGTCTATTTGAAAGCCCGTCGACATATAGCGCTTACTCACCCAAACCCCACCGAGCTCGAACACGTTCCAAGAAGTATGGAATGCGGTAAACGCACGCTTGGGGACTCACCCCGATGTCTCGTGCTGCATAAGGCAGAGTCTCTGACAAGCACTCGGATCGCGCCTATTCGCGCTGGCACAGTCCGACCGTCTGAATAGTCGCCGCCCTACGCGCTGATTAGCTTCTGATCGGACCGAGACCTCGTGAGAGCCTGTCGAGGCACCGCCCTTAGTGGGGTACGGCTGGTAGCGCGAATCATTCTCACCAGGGAGTGTGAAATTTTGAGGGATGGCGCCTTTTAACCACCGGGTGAGACGGCCTTCGCTGCTTGGTTGCACGTTGCACACATGAGCTGAGAGCGGGTATATCGTAGACTCGTACCTGCTACTGTACACGGAGCGCAAGAACTTGTGTCGTCCTGTTATCCGGGGTAACGTGATTTAATTGATGTGGTGGTTACGCGTAATCTAACCCTGAATAGTCTATTGCAATGTCTGTAGGAGGCTTAGAGGATGAGATTAAGTCCGGAGCCCGGTGGAGCCTTGCCGATGCATCATGAAAAGGGGTTACGAGATCAGTGGGGGTGTTTGTCCTGTGGAGTGCACCAAGCGGTTAGCAATACAACCCAAGTAGACATCCAAAGCGACTCATACATACACATGCTAGGGACCGTCCTGGCGGTGGAGCAAACGCAATACTTGGAAAAAGCTCCGTTGGATTCGCTTAAAAGTTGCCTCCGCTTGTAACAGACATTGAATGCCCTTTACCGGTAGACTAGCATGAGGCCGGACAAACCAAACGCCAATTAGAACGCTTTATGATTTGCGTAGGGCGAACCCGGACAGCATAGAATCACTTTGGCCCTGTAGGACAGGAGCTGGGCCCCCACTGTCCTTGGGCCGCGGCGTGTCAACAAGAACAACACTGATTCAGGTGTAATAGGGTGGAAGATCTTCTCACCGAGTGACCTTGCTAACTTGTTAGTGCCTTGCCTCTCAGAAACTTTGCGCTGAACCGTATATCAAATTTTGACTATCGCGACCCGAACAGTATAAAGACAGCACACACGCAGTATCGCCCCTTCGGCATTTGGCCTTGAAGTCGTCATCGACCGCCTCAAGGACCTGACGACGGTGTACGTTGTGAGTTTTTCGTTAAAGTGTTATCGTTGGTTAGCCTTGATGATATAGCAATAGTCAGTCCAGTATTTAAGAGGCTTGGAGAGACGTGTTAGTGAATTACATGTGATCCGTGTTCACTAGTTAGACGAGTGCTATTATCTAACCATCCGGGCACTATCCTTAGTGGCTAAAGTTACAGCTACCCGCGAACTAGGGCTGAGCATCTACCGATCCAGTGGCGCTCCTAGTTATGTGGCTGCACAAGGTTATCACCACGGGATAATGGTGCTTGTCAGCTTGTTGCACCTTCTTTATTACAGGACGAATCCCCCAATCGAATACCGTCCAGGCTTCCTGTCTATAACAACATTGTCACTTGTGGGCCGCGTAATGCAACAGAGTTGTTAAGGGCGCAACGCTCCGCTGGCCGCGCGCGGATATAAGTCATGAGGCTCCTGACCAACCAGCCACCGGTAGACTTATATGATTGCCGCGATAGCCTGACGGCGTCAGAGGTCCCTGGACACCGGGCCCTTGCTGTACCCGTGGAGGAAACCAAGAAACTGCCGAGGGATGATCAGTTGGAGGGACTGACCTTTGTCTTGGGCTAGGTGCGCACTACGTGTCCGGCGGAGGGACAATTGTAAGATACCAGCCCTAAAATGCCGTTTTGGTATCATGGGGCCTGACTATAGGATTAATCTACCGCTGGTATAAGCTTGGGGTCGGGGATTGGATGTTAGTCGAGAGAGTCGTCTCAGCGATGTGAATATTGCAATAACCTACGCGTGGTGACTTAGTCGGAGACGCCCTAGCCTCCCCAGCTCTAGCGAACGATTAAGGGACGGTTTGCGGCACCGAAAGAGCCTGCTCTACACACCGAATACGGTAGGCTATATTTTAGAGTTCACTTGCCGCACTCTGGAATCGGGCAACTTGGACGTGAGGTCCCAGATAAAGGCTTACAGGATCCTAGAGTTCCCCCTGGGTAATAAATGCTCCTCGGATTGGCCGGCGGGAAGCAGTGGCAAGCGGCCTCTACCCCACAAGACGGCTCCCCCAGCGAAAGTGTGGAAGGAATTATTTCGGCCCAGAGCTTTATCATTTACTGCCGAAGAATAGCAACGTCCCGATTTAGTTCCGCGGAGTAGGATTATCATGCTCGCTAAGAGGCTGGCCCGACTCCCGATTTTGGCGGCACCATCTTGGGGAGGCTAACTAACAATTACCGGATATATCAGTCAACACCGCGAAGTATAGAGATATCTACTGTTGAGCAAACGCTTGCGTATCAGTACCGTTCTGTGTAAAAAGTCCTTGAACCGGTCACGGAACAATACCAATTAACTATCAATCTGCGCAACGGGCTAAGTTAGACACTGACGGCTGGCAATAGGGCCATTCAAGCGCAGATGGGTGGTCTCCCAGGCAACGGAATTATAAGCCTAGATAGCTGGTAGTATATGAGCTGGTGTGTGCCCCGTAGAAAGAATTAAGCCTCTCGACAATCAGTTGTCCATGCCGATCGTCATTAAGGCTTCCTAGTTATAGGAGAGTTATTATTTGCCTATAAGCAGCGAAGAGAGAGAAAGAAACAGCGCATAGTGTTTAGATCTCCGCGCCCAAAAAAGGACAGATTGGGGAAATCACACAAGGGTGTTTAATGAACTAATAGTATGTATAGCAGGTCGCCCGTTCCGCCGGCCAAGATTTATACCCCTTACTTTGATGGTGCCTGAATCAACAGTGTTAGAGGGTGTGTTTTATATCTGCAAGGGCCTCCGACCTTATCAGCGTCGGGGGGCTGGGGGTCCTTCCAGCTCTACCAAACCAATAAGGTTCTAGTCGGCACAAACAGTAGTCTCACTTAACCTTTGCAATGCATGTATCGTTGGGCGACCTCTACGCTGATTGCCGCTCATGGACGAGACGTGCCCTACTACTGCACGTCATCAGACCTGAACCGGTACATCTCAAACGTTCCTCGCACAAATCGTGGCTGCGTTGGATTAACAACTGTATTGATATTAAGTATGACGTCACTTGACCATTGGCAAAAACTCGTGACGGTGAAAGCAAAGCACATCAACTGAATCTCCGCCCATAGGTACTCGGACTGCCCCGCTCTTTCTTACGTATTGGTTGTAAAAGCAGCACGCGTACGGCACGCATTGGGCATCTACATTCGTAGCGGCTCCGGCGGGATTCCGGCGTTAACCACGATTATTATGGTTGTTGATGCTATAATTAGCGGCTCCCTTCGAATACTACTCTGAATAATATAGTTAAGCGCTGAGCGTATATCCGTTCACACGCTGGCAAGCCGCAGCACAAGTCTGCTCGCCAGGGACTGTACGCTGGGCCAGGAGCTCCCCGTAACTACCGGTTAAGGCGTTCGGATCAATCCTCAATATCTAGGTAATCTACCACATCCCCTTCACGGGGTATGGTTTCGTGTACGCCTCGGGCGCGCACACAGTTGCGCCCTTGGGAACTCTGGCCGAAGCAAGCGTGGCTTGAACATCAGATAGGGTTCGGCTGGCAGACTATCGCTGCGCCTCATGCAATTTATACGAAAACCGAAAAGGCAATAACTCTATCCTCCGCTGGGGAGACACATCGGACATCAGCCGAACTTTGTGCCTTGGTACATAAAGCATTTTCTGCGTCGACCCGACGCCGAGCAGAGACTACAAGCTCAAGGTCTTAATTCTGGAAAAAACGTTGTGCACTCTGATCAACACCTCCCTTGGAGCACGCTTGGACATAGGATAGGCTAATCCAGTAACACACAGCACCAGATCTACCCTCGTCACATGGTGATGCTCAGCTTACCCCCTATCCATGCCCGTGCGGATCTTTCTTCCACGTGGTAGTCCCACTGAAATGGTCTGGGGTGCGTTTGAACAATATACCGTTGAAGTGGAACCTTATGACACGTGACTTAGTACAACAACTTGATCATACGATTCGGGAGTTAAGACCCAAGGGTACCGTCCGGTCCGAATTAAGAGAATATGTGTGCGCTACGTGCCTTATATTTTAATACAGACGTACCCCATTATACCTATTATTAAATTCGGATCCCACCGAGGAACGGGAGGTTTCTAACTTTGGTACACACCATCTTTAGTTGACAGTAAGTGGATCCGATGTTTCTATTGCTTTGTCCGAGGCGATGTTTTAAAATAAGCGCAAATGCATGTGATGGATGCTGATCTCATCGGTAATCTCACAATCGTATCATTTCGTGGGCTAAGGTTCAGATATCCAATAGTGTATTCGATCCGAGCAGATAGACGATCATAGGGACGTGTAGTTGAGGCCAACCACCTTCACGGATAAAGGGCTACCAGCGCAGAGTCCGGTAGTAATCAGCGGTGCATTGGCCGCAACTTTCATTCGTAGTTTCGTTATATAAGGTACCTTGATTAGCCGTTCCAGGATATATAATTTGGACGGCTGTGGTCCTATATGCTACCCGTGTTACTCTCTTTATGGCACACTAAGCTTGGAGAGGAACGAACTCGAAGTGCAAAGTAAGAATGCAAAAACATTAACGTAAATTCATCGACTTCGAGATTCTTTCGTATCGACGACTGCAGGAAGGACGATTCGCTCTCTTGTACTAAGGTAATGGCACGGCTTCTAATCACGTGCTAACGCACGTCATGGCTAAACTCGGGCCCCCTGGGTAGTAACCAGAGGCGGCCACTGACGGAGTAATCTGGCCTCGCAAGTGGCCTCGCGGGGATCCATGGCAACGACCAGATACTAGCAGCTCGGGCTAAGATGGTCCCACCTAGAGTCTCTACATCCTCAGCAGTACAGCGTACCCCGACGCTGTAACCCTCCAACCTCCCGACTATTCGGCGCAAATACATGGGTGAGGCCTCCCGGTCTGCGTTAATTACGCAGCCTGTACAAAAGATTTGTTACAATTACGATAATTGGATCCAACTAACCGTTCTCTCTCGTGTCTCGAAATGTTCGTACGCTACCGCTGTCATTTTTCGCTGGACTGGCTCAAGAAGTCGATGCGGCTTCCTAGCTACCACATGATACAATTCAGGCCCTCCTCGAAACGATCATCTAGAACTGAGCTCTCCACTCAAATAGCGACATTAAAGACTATCGGTAAAGGGAAAAGAATTTTAATCTGACACCAGAGCCTTGTGATTACTCAGTCTGGGCGGGCTACATTGATACGTGTCCTAACTACAAGCAGAACTGGCGAATCTTGGGACTCACCACTACCGGAACAAAAAGTCACCTCACTACATCTTAGTATAATCCTACCTACGCCCGCAACCCTGGATGAAAGACAGATTGCAAACGCGTGAAGTACGAAGGAATCGTGGCGAAGTATTGCGTGTGAAACGTCCGTCAATTTGGGTAATACGTGAGTTCCGCAAGTATGTGAGAAAGGAAATCTTTTGTAAGGCCAGACTTTTCAAGACCTGCTATAGTTTTGAAAACGACCCACTCGATCAAAACGAGTCATATCCCGCTAGACGCAACTGACTTGCCGATGCGTGGAACACACTCTTGGCTTAGCACGAGAGTGGTAGTCCAATGATAGCTAGTGCGGGTCTTCGGGTACGCATTGTATACATTGACCCGGGGTACAATGCGAACCCGCGGCAGAATATTGGGGCGACTATCGGTTGAGCGATAGGCGGTCAATGATTATACATGCTGGCGTTTCGGTGCTTTGACACAGATGTCCTGCGAATGTAGCACAACCGGTCAGGGACAGCCATCCCATATCGTCTGTAGCCACACACTTATCCCGGTGTCCGGCGCAGTAGAAGAATGGCGCCGATACTAACGTTCATCAGTAGGGGCGCGACTGACATTATAGACTTCAGTGAAAGGGCCCCGTGCACATATATATCCCGCAAAGGTGAATCGAGTACGTCCCTGGCAGGAAAATCCCCACTAACATGTGTCCAGTTTCTTCCACACCTTCCAAGGTTGTAGGCTTCTTTTACAACTTTTGAACTGGAGTACAAACAGGAACCGCAGGCCGCAATCTTGCGGGAAGTTGGGATCTTATGCCGATGTCGGGGGTTTTGTTGCCACACCAGTTTGGTCAGATCGGTTAAGATCATTTCCTCAGACATTGGTAACCATCAGAACTATTCATCATCTATGCGCCCAGTCCCTTATTGTGGAGTCTCGTTTCCACTCCGAGTGAGGTATGGATTGTGTGCGTAACAAATTCATTCACGTTCTTACAGGCGTAAATGGCTACAGCCACGCATAGGAAATGTGACCGCCTGCAAGTACAAGCTAGCCGAGTCCACAAAAACTTAGCACGGAGGTGGAGTGGTCAGGCTCGTTTTCATCATTGCATGCAAGGCAGGCGTAGACAGATCTAGTATGATGCGACGCGATTATTCCAGCTCTACCTTCAAAGCCTTCGTTGATGTACGTTGGCGGCACCGCGATACATGACTCTCTCAACGGAGTTCGCACTACTAGATTACGTATTACAGGTCTCTAGCGCAGGGCCCTCCCTCGGTAATGTAGCCATCAACCCCCTAATTTGATTCAGAGGTGGCGTCCTGGGACAGGAGGAGGATTGGCGGGGCGTTTTCCGACAACTGGAAAGGTCTTGTACGATGGAGGATCGCATGGTCACTGCCCGACATCTTGCCTGTTTTCTGAGATGAGGACTGTGTGCCCTATGTATATAGCTCTATGTGGGGTTCCTGTGTTATCATGTCGTCGCGTGGACAGGAATGGTAAGCTTTAACCTCGCGATGTTTAAGGAGATTGTGTTACTTACACCAGTTCAGCGCTTTGAACACTCGCCTCTTAGGCAGGCCGTGAGTAGGTAAAAGGTTTCCAGGCCCAAACAAAACCGAACAGGATCCGTGGGCCCAGGCGAGGAGGGGGGAGCAAGTCCATCAGCGGATGAATAGATAGTCGAGACCAAGAGAAAAGATAGCAAGAAAGCGTTAGCTCTTCACGAAGGGGCAGGTGTCACTGCGTCTAGCAGAAAAGTATCATATGATATCCAGCGCCGTAGTTTGAACGCACCCACAGGCTACTCGAGCCGATAAAGCAATACACTTGCTATTCGATACACTCCAGTTAGAAGCGGGCGAACGTCCTAAGGCTATGGGGGCCCTACTGCGCAAACTGAAATTCAACATCCGCTCAAGCCAATGCAGCTTTAGAGGACCTTCTAAAACTCACGCCCTTATAGCAGCACCGCGCATCCTGCAATGTAGCAGTTGCTCCTACCCAGTAATCCAACGCCGGTTGATAAGATATCTGAAGAGTTAACTCGACTCACGCTAGTTGTGGGAACCTAGTACTGGTGTCTAAACAGGTTGCCTGTACACTAATGCAGTGCTGTAGTTGATATATCCCATGATTCGTGCGTGGGATGCTCATGTCCCTGGTCTCACAGGGTCATTCAGGCATCGCTAATCAGATTGCTGTTCCTCTGTTGTGTCAAGGCAGAGGCTTTTTGGGGGCGACGAGATATATCCAGGTTATAAGCAGTGCATATTCAACAGGATGATTGCCGTACTTTCACCCCGGGGCCTCTTTCACACTGAAATCTGACGTATTAAGATCGGCCGTTGAACAGCCTACAGAAAGAACGGTTGGCTTTCTACCTCCCCACAACGCGGGAGGTCGCCTCGACGATACAACGGTGCAAAAAAACGCTTACCCTACAAGTTCTCGAATTGTGTATAGCGGTTAAGGAAACGTGGCGCTCCCCCGGTCGTCTCCGCCATTCGCCTGATTCCTTGTCAAACCTGCTAGATGAATAAGTCATCTCGATAAAACCGCCACGAGGGCTGGACTGCCGTGAGCTCGTTCTGTCTAGCGATTAGCACAAGGCTAAGAGAGACTTTTCAAACTGACCTCTCCATCGAGCGCGAACGGATACCTCGCACGAGCTGTGTTTTACTGTAGCTCGACTCACGAAATCATAGGAGAGTGACAGAAGGGCTGTCTAGGGCTGCGGAGCCGATCCGTGTTGACGTGATCTATCATCGCAATATAGCCCCCACCATTATTGGCGCAGACTGGGAAGATCGTAATAGCGATCAGAACGCGTTCCCTTAACTACTCGAGAGCAAACGCCGAATCACTACGTACCCATAACTGCCTATATATGAAGAGGAGACTTCAAGAGGAATAAGATGTGCCGATAGAAGGTTGCCTCTTGCAATTTATGCTGGAAACGAAACTGACTCAGTATCATAATGCTCTGCGTGTACCGGGAAATGAGGAGGAGCCAGTATTATAATCTTGCCAATTACAACCCAACGCCGCGTTCCAGTGCTTATTTTTATTGCCCCTCACTGAATGGGTTCTACCGCTGAATCCGCGTTGATTGAGCAGTCCAGTTTGTTTACATTAATTCGGGCCTGACGGCGGCGGTAGTAAATGCGATCATGGGACCTCCCGCGAGGACCCCGCAGTGGCTGTAGTACGATTTCACAAGCGTGCGTGACAGCTTCGCGGCCAACGCCATGGGGAGGTAAAGCGACTGCAGTGACGCGACATGACGTGAAACCGTCCGATACCCTGCATGCTGCATCTTGCATGCCGTACGCGTATACCTTCGTTCTGCCGGCGTTCTTAAGCAAGGCGGTGGATTTGTAAGAACAGTAACGAGTACTACGTGCAGGATGCGGAAGCGCGCTTCACTAGGACCATGTACGGTCATTTCCGCTCCGCGTATGGTTGCACGATGCCGCTACAAAATCATGTCCTCTTCTCATAGCTTCATGTACCTCTCTCTCAAGACAAGGACTATGCTATGACACCATGAAGCCTTCTTCTGAATAGGCACTGCCCACATCGGTCGTAGTGACCCCACTTGCGTTCCTACCCGATTCGCATCAGCGAATCCAGCCCCTACCTGTCGAGCACCGCCCAACGCTTGATTATTACTCGACACGACCCATGTCTTTCCAAGTGTTCAAACGCACCCGTCCTGTGGCTTTATGATTACATGCGGTGCCCCGTGTGACTGGCGTAAACTCCACAAGCTTCTCGCAGTGCTGTAAGGCACTAGCGTCGTTCGTCATCTAGCTTAACGTCGCTACTATGCTGCCAAGAAGCGTAGTACAGAGCCTACATAAGACTGACAGCCACAGCGGCTACGGTGGCAGCAGCCAATCGGTTGCCGGAGTATGAAGTCAACTTGGACTCCGGCAGTAGACCAATAGGCTTCTAGAATTAAACCGTTGGCACGTGCGGAACAGTGACATGTCGTCGAGTGCCTAAAGCCCCGACGGAAGTATCACCTTGACGTCTACCAGTCTCTGTAGTACAAACTAGTAGCCTACCTCGCCTTTAGCCGTCTAGTCAGTCGCTTACCATTAATTCTCATAGCCGCTGACCCGGCCGCTGAGGGGGCCGATAACGCCCGGCGCATACAGTGCAGTTCAGGTCCCGGCGGAATTTACCGGAGCGGTAGTCGTCGGCTAGTGGTTTCAGACAAGGACCCATCGGGAATCCTCCGGATGTAATTTGCCAGTTA"  # Aquí puedes incluir el genoma manualmente
+    d = 6  # Maximum number of allowed errors
 
-# Execute the function and get the formatted output
-output = ApproximatePatternMatching(Pattern, Text, d)
-print(output)
+    # Execute the function and get the formatted output
+    if args.workers > 1:
+        from parallel_scan import parallel_approximate_positions
+        output = ' '.join(map(str, parallel_approximate_positions(Pattern, Text, d, args.workers)))
+    else:
+        output = ApproximatePatternMatching(Pattern, Text, d)
+    print(output)
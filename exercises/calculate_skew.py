@@ -14,17 +14,24 @@ def calculate_skew(sequence):
     return skew
 
 # Function to find the position where the skew reaches its maximum value
-def find_max_skew_position(sequence):
+def find_max_skew_position(sequence, backend="python"):
+    if backend == "numpy":
+        # np.cumsum over a lookup table of per-base steps (see skew_engine.py)
+        import skew_engine
+        return skew_engine.find_max_skew_position(sequence)
+
     skew = calculate_skew(sequence)
     max_skew_value = max(skew)  # Find the maximum skew value
     max_positions = [i for i, value in enumerate(skew) if value == max_skew_value]  # Positions where the skew is maximum
     return max_positions, max_skew_value
 
-# Example sequence
-sequence = "CATTCCAGTACTTCGATGATGGCGTGAAGA"
+# Example usage (runs only when the script is executed directly)
+if __name__ == "__main__":
+    # Example sequence
+    sequence = "CATTCCAGTACTTCGATGATGGCGTGAAGA"
 
-# Find the position where the skew reaches the maximum value
-max_positions, max_skew_value = find_max_skew_position(sequence)
+    # Find the position where the skew reaches the maximum value
+    max_positions, max_skew_value = find_max_skew_position(sequence)
 
 
-print(f"Maximum skew value: {max_skew_value}in the positions: {max_positions}")
+    print(f"Maximum skew value: {max_skew_value}in the positions: {max_positions}")
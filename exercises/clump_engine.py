@@ -0,0 +1,257 @@
+# exercises/clump_engine.py
+# Run:
+#   python exercises/clump_engine.py --file data/raw/Genomes/e_coli.txt --k 9 --L 500 --t 3
+#   python exercises/clump_engine.py --file data/raw/Genomes/e_coli.txt --method positions --intervals
+
+"""
+Clump finding on integer k-mer codes: incremental sliding window and sorted position lists.
+
+find_clumps() in clump_finding.py / clump_finding2.py rebuilds a frequency
+dict for each of the n - L + 1 windows, slicing L - k + 1 k-mer strings per
+window (about 2.3 billion slices for E. coli with L = 500). Here:
+
+- the genome is encoded once and the code of every k-mer is computed in a
+  few vector passes (see packed_sequence.py),
+- the counts of the first window are built once; moving the window one base
+  to the right decrements the k-mer that leaves it and increments the one
+  that enters it, so each step costs O(1),
+- a k-mer is recorded as soon as an increment brings its count to t.
+
+Counts live in a flat list indexed by code for k <= DENSE_MAX_K (4^k entries)
+and in a dict for larger k.
+
+method="positions" needs no per-window state: one stable argsort groups the
+positions of every k-mer code, and a k-mer is clumped when t consecutive
+occurrences fit in a window, pos[i + t - 1] - pos[i] <= L - k, which is
+checked for all k-mers at once. The same arrays give the clump intervals
+(maximal unions of such windows per k-mer), and the work can be split by
+k-mer code range.
+
+Both methods return the same pattern set as find_clumps() for genomes over
+A/C/G/T; k-mers containing other characters (e.g. N) are never reported.
+
+kmer_gaps() reuses the sorted occurrence arrays for estimate_L(): the
+distances between consecutive occurrences of every repeated k-mer are the
+position differences inside runs of equal codes. occurrence_gaps() and
+occurrence_clump_codes() take the arrays directly, e.g. from a saved
+KmerDatabase (kmer_database.py), so a stored genome is not recounted.
+
+window_max_counts() slides the same window for estimate_t() in
+estimate_ktl.py: next to the k-mer counts it keeps a histogram of count
+values (how many k-mers occur c times), so the highest count in the window
+is maintained in O(1) per step. When the last k-mer holding the maximum is
+decremented, the maximum drops by exactly one.
+"""
+
+import argparse
+from collections import defaultdict
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from packed_sequence import as_packed_sequence, decode_kmer
+
+DENSE_MAX_K = 11  # 4^11 list entries = 32 MB
+
+
+def kmer_code_list(genome, k: int) -> List[int]:
+    """Code of every k-mer of 'genome' as a Python list, -1 for k-mers with non-ACGT bases."""
+    seq = as_packed_sequence(genome)
+    codes = seq.kmer_codes(k).astype(np.int64)
+    codes[~seq.valid_kmers(k)] = -1
+    return codes.tolist()
+
+
+def sliding_clump_codes(codes: List[int], k: int, L: int, t: int) -> Set[int]:
+    """Codes of the k-mers occurring at least t times in some window of L bases (codes from kmer_code_list)."""
+    span = L - k + 1  # k-mers per window
+    if span <= 0 or len(codes) < span or t > span:
+        return set()
+    counts = [0] * (4 ** k) if k <= DENSE_MAX_K else defaultdict(int)
+    clumped = set()
+
+    for code in codes[:span]:
+        if code >= 0:
+            counts[code] += 1
+            if counts[code] >= t:
+                clumped.add(code)
+
+    for leaving, entering in zip(codes, codes[span:]):
+        if leaving >= 0:
+            counts[leaving] -= 1
+        if entering >= 0:
+            counts[entering] += 1
+            if counts[entering] >= t:
+                clumped.add(entering)
+    return clumped
+
+
+def window_max_counts(genome, k: int, L: int) -> np.ndarray:
+    """
+    Highest k-mer count in each of the n - L + 1 windows of L bases (0 for windows without
+    an A/C/G/T k-mer), as an int64 array; same values as the per-window maxima of estimate_t().
+    """
+    seq = as_packed_sequence(genome)
+    n_windows = len(seq) - L + 1
+    span = L - k + 1  # k-mers per window
+    if n_windows <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if span <= 0 or k <= 0:
+        return np.zeros(n_windows, dtype=np.int64)
+
+    codes = kmer_code_list(seq, k)
+    counts = [0] * (4 ** k) if k <= DENSE_MAX_K else defaultdict(int)
+    histogram = [0] * (span + 1)  # histogram[c] = number of k-mers with count c (index 0 unused)
+    best = 0
+    maxima = [0] * n_windows
+
+    for code in codes[:span]:
+        if code >= 0:
+            c = counts[code] + 1
+            counts[code] = c
+            histogram[c - 1] -= 1
+            histogram[c] += 1
+            if c > best:
+                best = c
+    maxima[0] = best
+
+    for i, (leaving, entering) in enumerate(zip(codes, codes[span:]), start=1):
+        if leaving >= 0:
+            c = counts[leaving]
+            counts[leaving] = c - 1
+            histogram[c] -= 1
+            histogram[c - 1] += 1
+            if c == best and not histogram[c]:
+                best = c - 1
+        if entering >= 0:
+            c = counts[entering] + 1
+            counts[entering] = c
+            histogram[c - 1] -= 1
+            histogram[c] += 1
+            if c > best:
+                best = c
+        maxima[i] = best
+    return np.array(maxima, dtype=np.int64)
+
+
+def kmer_occurrences(genome, k: int,
+                     code_range: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (codes, positions) of the A/C/G/T k-mers of 'genome', sorted by code and, within a code,
+    by position; code_range=(lo, hi) keeps only codes in [lo, hi).
+    """
+    seq = as_packed_sequence(genome)
+    positions = np.flatnonzero(seq.valid_kmers(k))
+    codes = seq.kmer_codes(k)[positions]
+    if code_range is not None:
+        keep = (codes >= np.uint64(code_range[0])) & (codes < np.uint64(code_range[1]))
+        codes, positions = codes[keep], positions[keep]
+    order = np.argsort(codes, kind="stable")
+    return codes[order], positions[order]
+
+
+def occurrence_gaps(codes: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Distances between consecutive occurrences of every repeated k-mer, from sorted occurrence arrays."""
+    return np.diff(positions)[codes[1:] == codes[:-1]]
+
+
+def kmer_gaps(genome, k: int) -> np.ndarray:
+    """Distances between consecutive occurrences of every repeated A/C/G/T k-mer, grouped by k-mer."""
+    return occurrence_gaps(*kmer_occurrences(genome, k))
+
+
+def _clump_runs(codes: np.ndarray, positions: np.ndarray, k: int, L: int,
+                t: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices i (into the sorted occurrence arrays) where occurrences i .. i+t-1 of one k-mer fit in L bases."""
+    t = max(t, 1)
+    if len(codes) < t or L < k:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    first = np.arange(len(codes) - t + 1)
+    last = first + t - 1
+    clumped = (codes[first] == codes[last]) & (positions[last] - positions[first] <= L - k)
+    return first[clumped], last[clumped]
+
+
+def position_clump_codes(genome, k: int, L: int, t: int,
+                         code_range: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """Sorted codes of the k-mers forming (L, t)-clumps, from sorted occurrence lists."""
+    genome = as_packed_sequence(genome)
+    if len(genome) < L:
+        return np.zeros(0, dtype=np.uint64)
+    return occurrence_clump_codes(*kmer_occurrences(genome, k, code_range), k, L, t)
+
+
+def occurrence_clump_codes(codes: np.ndarray, positions: np.ndarray, k: int, L: int, t: int) -> np.ndarray:
+    """
+    Sorted codes of the k-mers forming (L, t)-clumps, from occurrence arrays sorted by code then
+    position (kmer_occurrences() or a saved KmerDatabase, see kmer_database.py).
+    """
+    first, _ = _clump_runs(codes, positions, k, L, t)
+    return np.unique(codes[first])
+
+
+def clump_intervals(genome, k: int, L: int, t: int,
+                    code_range: Optional[Tuple[int, int]] = None) -> List[Tuple[str, int, int]]:
+    """
+    Clump intervals as (k-mer, start, end), 0-based half-open, sorted by k-mer then start.
+    Each interval is a maximal union of overlapping stretches that hold t occurrences of
+    the k-mer within L bases, so it starts and ends on an occurrence of the k-mer.
+    """
+    genome = as_packed_sequence(genome)
+    if len(genome) < L:
+        return []
+    codes, positions = kmer_occurrences(genome, k, code_range)
+    first, last = _clump_runs(codes, positions, k, L, t)
+    if not len(first):
+        return []
+    run_codes, starts, ends = codes[first], positions[first], positions[last] + k
+    # Within one k-mer both starts and ends increase, so a run opens a new interval
+    # when the k-mer changes or it starts after the previous run ended
+    new = np.ones(len(first), dtype=bool)
+    new[1:] = (run_codes[1:] != run_codes[:-1]) | (starts[1:] > ends[:-1])
+    heads = np.flatnonzero(new)
+    tails = np.append(heads[1:], len(first)) - 1
+    return [(decode_kmer(int(code), k), int(start), int(end))
+            for code, start, end in zip(run_codes[heads], starts[heads], ends[tails])]
+
+
+def find_clumps(genome, k: int, L: int, t: int, method: str = "sliding") -> Set[str]:
+    """Distinct k-mers forming (L, t)-clumps; same result as clump_finding2.find_clumps."""
+    if k <= 0 or k > L:
+        return set()
+    if method == "positions":
+        clumped = position_clump_codes(genome, k, L, t).tolist()
+    elif method == "sliding":
+        clumped = sliding_clump_codes(kmer_code_list(genome, k), k, L, t)
+    else:
+        raise ValueError(f"Unknown clump method: {method}")
+    return {decode_kmer(code, k) for code in clumped}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Find (L, t)-clumps of k-mers on integer k-mer codes.")
+    ap.add_argument("--file", "-f", required=True, help="Path to a FASTA or plain sequence file.")
+    ap.add_argument("--k", type=int, default=9, help="k-mer length (default: 9).")
+    ap.add_argument("--L", type=int, default=500, help="Window length (default: 500).")
+    ap.add_argument("--t", type=int, default=3, help="Minimum occurrences in a window (default: 3).")
+    ap.add_argument("--method", choices=["sliding", "positions"], default="sliding",
+                    help="Sliding-window counts or sorted position lists (default: sliding).")
+    ap.add_argument("--intervals", action="store_true",
+                    help="Print the clump intervals (k-mer, start, end) instead of the k-mers.")
+    args = ap.parse_args()
+
+    from fasta_index import FastaIndex
+    with FastaIndex(args.file) as fasta:
+        genome = fasta.region_packed(fasta.names[0])
+    if args.intervals:
+        print("kmer\tstart\tend")
+        for kmer, start, end in clump_intervals(genome, args.k, args.L, args.t):
+            print(f"{kmer}\t{start}\t{end}")
+        return
+    clumps = find_clumps(genome, args.k, args.L, args.t, args.method)
+    print(f"Number of distinct {args.k}-mers forming ({args.L},{args.t})-clumps: {len(clumps)}")
+    print(" ".join(sorted(clumps)))
+
+
+if __name__ == "__main__":
+    main()
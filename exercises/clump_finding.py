@@ -4,7 +4,14 @@
 # The idea behind the origin of replication (ori) is that certain sequences, such as DNAA boxes,
 # appear multiple times in a relatively short region of the genome.
 
-def frequency_table(text, k):
+# backend="numpy" counts rolling 2-bit codes with KmerCounter (kmer_counter.py);
+# same table for an upper-case A/C/G/T text (windows with other characters are skipped).
+# A dense 4^k table is only used when the text has at least 4^k windows; shorter texts sort their codes
+def frequency_table(text, k, backend="python"):
+    if backend == "numpy":
+        from kmer_counter import KmerCounter
+        return KmerCounter(text, k, dense=4 ** k <= len(text)).to_dict()
+
     frequency_map = {}
     # Iterate through the text and generate k-mers
     for i in range(len(text) - k + 1):
@@ -17,7 +24,13 @@ def frequency_table(text, k):
     return frequency_map
 
 # Function to find patterns that form "clumps" in a genome
-def find_clumps(genome, k, L, t):
+# backend="numpy" slides one window of k-mer code counts along the genome (clump_engine.py)
+# instead of rebuilding a table per window; same set for an upper-case A/C/G/T genome
+def find_clumps(genome, k, L, t, backend="python"):
+    if backend == "numpy":
+        from clump_engine import find_clumps as find_clumps_sliding
+        return find_clumps_sliding(genome, k, L, t)
+
     patterns = set()  # Use a set to store distinct k-mers that form clumps
     n = len(genome)   # Length of the genome
 
@@ -34,15 +47,15 @@ def find_clumps(genome, k, L, t):
 
     return patterns
 
-# Example dataset
-genome = ""  # Insert the genome sequence here
-k = 10       # Length of the k-mer
-L = 100      # Window size
-t = 4        # Threshold for k-mer repetitions within the window
-
-# Find the clumps in the genome
-clumps = find_clumps(genome, k, L, t)
+if __name__ == "__main__":
+    # Example dataset
+    genome = ""  # Insert the genome sequence here
+    k = 10       # Length of the k-mer
+    L = 100      # Window size
+    t = 4        # Threshold for k-mer repetitions within the window
 
-# Print the result as a space-separated list of k-mers
-print(" ".join(clumps))
+    # Find the clumps in the genome
+    clumps = find_clumps(genome, k, L, t)
 
+    # Print the result as a space-separated list of k-mers
+    print(" ".join(clumps))
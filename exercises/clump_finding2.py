@@ -3,13 +3,30 @@
 # appear at least 3 times within any 500-nucleotide window.
 # The result is the number of distinct 9-mers that meet the criterion.
 
+import fasta_index
+
+
 def read_genome(file_path):
-    # Read the file content and remove newline characters
-    with open(file_path, 'r') as file:
-        return file.read().replace('\n', '')
+    # Fetch the genome through its .fai index and a memory map (see fasta_index.py)
+    # instead of reading the whole file and copying it again without newline characters
+    return fasta_index.read_genome(file_path)
+
 
+def find_clumps(genome, k, L, t, backend="python", database=None):
+    if database is not None and database.matches(k, with_positions=True):
+        # Saved position lists of the genome's k-mers (see kmer_database.py): no recounting
+        from clump_engine import occurrence_clump_codes
+        from packed_sequence import decode_kmer
+        if k <= 0 or k > L or len(genome) < L:
+            return set()
+        clumped = occurrence_clump_codes(*database.occurrences(), k, L, t)
+        return {decode_kmer(code, k) for code in clumped.tolist()}
+
+    if backend in ("sliding", "positions"):
+        # Integer k-mer codes: incremental window counts or sorted position lists (see clump_engine.py)
+        import clump_engine
+        return clump_engine.find_clumps(genome, k, L, t, method=backend)
 
-def find_clumps(genome, k, L, t):
     # Create a set to store k-mers that form clumps
     patterns = set()
     n = len(genome)
@@ -35,15 +52,36 @@ def find_clumps(genome, k, L, t):
     return patterns
 
 
-# Path to the E. coli genome file
-genome_file_path = '/Users/Olivermop/Documents/bioinformatics_portfolio/data/Genomes/e_coli.txt'
-genome = read_genome(genome_file_path)
+# Example usage (runs only when the script is executed directly)
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Find (L, t)-clumps of k-mers in the E. coli genome.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (shards overlapping by L - 1 bases, see parallel_scan.py; default: 1)")
+    parser.add_argument("--db", default=None,
+                        help="k-mer database directory with positions, reused when it matches the genome file and k "
+                             "and (re)built otherwise (see kmer_database.py)")
+    args = parser.parse_args()
+    if args.db and args.workers > 1:
+        parser.error("--db reads the saved position lists and cannot be combined with --workers")
+
+    # Path to the E. coli genome file
+    genome_file_path = '/Users/Olivermop/Documents/bioinformatics_portfolio/data/Genomes/e_coli.txt'
+    genome = read_genome(genome_file_path)
 
-# Parameters: k=9, L=500, t=3
-k = 9
-L = 500
-t = 3
+    # Parameters: k=9, L=500, t=3
+    k = 9
+    L = 500
+    t = 3
 
-# Find clumps and print the number of distinct 9-mers forming clumps
-clumps = find_clumps(genome, k, L, t)
-print(f"Number of distinct 9-mers forming (500,3)-clumps: {len(clumps)}")
+    # Find clumps and print the number of distinct 9-mers forming clumps
+    if args.db:
+        from kmer_database import KmerDatabase
+        database = KmerDatabase.open_or_build(args.db, genome_file_path, k, with_positions=True)
+        clumps = find_clumps(genome, k, L, t, database=database)
+    elif args.workers > 1:
+        from parallel_scan import parallel_find_clumps
+        clumps = parallel_find_clumps(genome, k, L, t, args.workers)
+    else:
+        clumps = find_clumps(genome, k, L, t)
+    print(f"Number of distinct 9-mers forming (500,3)-clumps: {len(clumps)}")
@@ -0,0 +1,156 @@
+# exercises/dnaa_scan.py
+# Run:
+#   python exercises/dnaa_scan.py data/raw/Genomes/e_coli.txt --d 1
+#   python exercises/dnaa_scan.py genomes/*.fasta --box TTATCCACA TTATCAACA --d 2 --out dnaa_hits.tsv
+
+"""
+Mismatch-tolerant DnaA box scan on both strands.
+
+find_dnaA_box_positions() builds a regex with one wildcard at a fixed
+position and only looks at the forward strand. Here every window of the
+packed genome is compared with every consensus box at once:
+
+- the k-mer codes of all windows are computed once (PackedSequence),
+- the mismatches between a window code w and a box code b are the number of
+  2-bit digits where w XOR b is non-zero: ((x | x >> 1) & 0x55..55) counted
+  with np.bitwise_count,
+- a window is a reverse-strand hit when it is within d mismatches of the
+  reverse complement of a box, so both strands come from the same codes,
+- for each window and strand only the closest box is kept.
+
+A collection of genomes is scanned as one batch: their base codes are joined
+with an N between them (windows across the join are invalid) and the hit
+positions are mapped back to (genome, position) with np.searchsorted.
+
+Positions are 0-based window starts on the forward strand; strand is +1 or -1.
+"""
+
+import argparse
+import os
+from collections import namedtuple
+from typing import List, Sequence, Union
+
+import numpy as np
+
+from packed_sequence import N_CODE, PackedSequence, as_packed_sequence, encode_kmer, reverse_complement_codes
+
+DNAA_CONSENSUS = ("TTATCCACA",)  # E. coli R-box
+BLOCK_SIZE = 1 << 22  # windows per block; bounds the temporary arrays
+_LOW_BITS = np.uint64(0x5555555555555555)
+
+DnaAHits = namedtuple("DnaAHits", ["genome", "position", "strand", "mismatches", "box"])
+
+Genome = Union[str, PackedSequence]
+
+
+def box_codes(boxes: Sequence[str]) -> np.ndarray:
+    """uint64 codes of the consensus boxes (all of the same length, A/C/G/T only)."""
+    boxes = [box.upper() for box in boxes]
+    if not boxes:
+        raise ValueError("At least one consensus box is needed.")
+    if len({len(box) for box in boxes}) != 1:
+        raise ValueError("All consensus boxes must have the same length.")
+    if any(set(box) - set("ACGT") for box in boxes):
+        raise ValueError("Consensus boxes must contain only A, C, G and T.")
+    return np.array([encode_kmer(box) for box in boxes], dtype=np.uint64)
+
+
+def digit_mismatches(codes: np.ndarray, target: np.uint64) -> np.ndarray:
+    """Number of bases that differ between each k-mer code and 'target'."""
+    x = codes ^ target
+    return np.bitwise_count((x | (x >> np.uint64(1))) & _LOW_BITS).astype(np.int8)
+
+
+def _closest_box(codes: np.ndarray, targets: np.ndarray):
+    """Fewest mismatches of each code to any of the targets, and the index of that target."""
+    best = digit_mismatches(codes, targets[0])
+    which = np.zeros(len(codes), dtype=np.int16)
+    for i in range(1, len(targets)):
+        mm = digit_mismatches(codes, targets[i])
+        closer = mm < best
+        best[closer] = mm[closer]
+        which[closer] = i
+    return best, which
+
+
+def _scan_codes(symbols: np.ndarray, targets: np.ndarray, k: int, d: int):
+    """(position, strand, mismatches, box) arrays of all hits in one array of base codes."""
+    seq = PackedSequence(symbols)
+    codes = seq.kmer_codes(k)
+    valid = seq.valid_kmers(k)
+    rc_targets = reverse_complement_codes(targets, k)
+    parts = []
+    for start in range(0, len(codes), BLOCK_SIZE):
+        block = codes[start:start + BLOCK_SIZE]
+        ok = valid[start:start + BLOCK_SIZE]
+        for strand, strand_targets in ((1, targets), (-1, rc_targets)):
+            mm, which = _closest_box(block, strand_targets)
+            hit = np.flatnonzero(ok & (mm <= d))
+            parts.append((hit + start, np.full(len(hit), strand, dtype=np.int8), mm[hit], which[hit]))
+    if not parts:
+        return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int8),
+                np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.int16))
+    position, strand, mismatches, box = (np.concatenate(column) for column in zip(*parts))
+    # Sort by position, forward strand first
+    order = np.lexsort((-strand, position))
+    return position[order].astype(np.int64), strand[order], mismatches[order], box[order]
+
+
+def scan_genomes(genomes: Sequence[Genome], boxes: Sequence[str] = DNAA_CONSENSUS, d: int = 1) -> DnaAHits:
+    """
+    All windows within d mismatches of a consensus box, on either strand, in a batch of genomes.
+    Arrays are ordered by genome, then position, then strand.
+    """
+    targets = box_codes(boxes)
+    k = len(boxes[0])
+    packed = [as_packed_sequence(g).codes for g in genomes]
+    if not packed:
+        empty = np.zeros(0, dtype=np.int64)
+        return DnaAHits(empty, empty, empty.astype(np.int8), empty.astype(np.int8), empty.astype(np.int16))
+
+    # Join the genomes with one N between neighbours; offsets[i] is where genome i starts
+    lengths = np.array([len(codes) for codes in packed], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+    separator = np.array([N_CODE], dtype=np.uint8)
+    joined = np.concatenate([part for codes in packed for part in (codes, separator)][:-1])
+
+    position, strand, mismatches, box = _scan_codes(joined, targets, k, d)
+    genome = np.searchsorted(offsets, position, side="right") - 1
+    return DnaAHits(genome, position - offsets[genome], strand, mismatches, box)
+
+
+def scan_genome(genome: Genome, boxes: Sequence[str] = DNAA_CONSENSUS, d: int = 1) -> DnaAHits:
+    """scan_genomes() for a single genome (the genome column is all zeros)."""
+    return scan_genomes([genome], boxes, d)
+
+
+def hit_positions(genome: Genome, boxes: Sequence[str] = DNAA_CONSENSUS, d: int = 1) -> List[int]:
+    """Sorted distinct start positions of hits on either strand."""
+    return np.unique(scan_genome(genome, boxes, d).position).tolist()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Find DnaA boxes with up to d mismatches on both strands.")
+    ap.add_argument("genomes", nargs="+", help="Genome files (first record of each is used).")
+    ap.add_argument("--box", nargs="+", default=list(DNAA_CONSENSUS),
+                    help="DnaA box consensus sequences (default: TTATCCACA).")
+    ap.add_argument("--d", type=int, default=1, help="Maximum mismatches (default: 1).")
+    ap.add_argument("--out", "-o", type=str, default=None, help="Output TSV (default: stdout).")
+    args = ap.parse_args()
+
+    from fasta_index import read_genome
+    hits = scan_genomes([read_genome(path) for path in args.genomes], args.box, args.d)
+    names = [os.path.basename(path) for path in args.genomes]
+    lines = ["genome\tposition\tstrand\tmismatches\tbox"]
+    for g, pos, strand, mm, box in zip(*(column.tolist() for column in hits)):
+        lines.append(f"{names[g]}\t{pos}\t{'+' if strand > 0 else '-'}\t{mm}\t{args.box[box].upper()}")
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        print(f"{len(hits.position)} hits in {len(names)} genomes written to {args.out}")
+    else:
+        print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,35 @@
 # Use this before clump finding to detect regions with high concentrations of repeated patterns (clumps).
 import collections
 
+K_VALUES = range(4, 13)  # Range of k to test (from 4 to 12)
+
 
 # Function to calculate k-mer diversity in the genome
-def estimate_k(genome):
-    k_values = range(4, 13)  # Range of k to test (from 4 to 12)
+# databases: optional {k: KmerDatabase} of saved counts (see kmer_database.py); the distinct
+# counts are read from them instead of recounting when every k is there
+def estimate_k(genome, approximate=False, error=0.005, suffix_stats=None, databases=None):
+    k_values = K_VALUES
     diversity = {}
 
+    if databases is not None and all(k in databases and databases[k].matches(k) for k in k_values):
+        diversity = {k: len(databases[k]) for k in k_values}
+        optimal_k = max(diversity, key=diversity.get)
+        return optimal_k, diversity
+
+    if suffix_stats is not None:
+        # Distinct counts of every k from one pass over a prebuilt LCP array (see suffix_stats.py)
+        diversity = suffix_stats.distinct_kmer_counts(k_values)
+        optimal_k = max(diversity, key=diversity.get)
+        return optimal_k, diversity
+
+    if approximate:
+        # One streaming pass with a fixed-size HyperLogLog sketch per k (see kmer_sketch.py);
+        # 'genome' may also be an iterable of chunks
+        from kmer_sketch import approximate_diversity
+        diversity = approximate_diversity(genome, k_values, error)
+        optimal_k = max(diversity, key=diversity.get)
+        return optimal_k, diversity
+
     for k in k_values:
         k_mer_set = set()
         for i in range(len(genome) - k + 1):
@@ -21,7 +44,19 @@ def estimate_k(genome):
 
 
 # Function to calculate the average distance between k-mer repeats and estimate the window size L
-def estimate_L(genome, k):
+# database: optional KmerDatabase with positions for this k (see kmer_database.py)
+def estimate_L(genome, k, suffix_stats=None, backend="python", database=None):
+    if database is not None and database.matches(k, with_positions=True):
+        # Repeat spacing from the saved position lists, without recounting
+        gaps = repeat_gaps(genome, k, database)
+        return int(gaps.sum()) // len(gaps) if len(gaps) else None
+
+    if suffix_stats is not None or backend == "numpy":
+        # Repeat spacing from the runs of a prebuilt suffix array (see suffix_stats.py) or
+        # from a stable argsort of the k-mer codes (see clump_engine.py)
+        gaps = suffix_stats.repeat_gaps(k) if suffix_stats is not None else repeat_gaps(genome, k)
+        return int(gaps.sum()) // len(gaps) if len(gaps) else None
+
     distances = []
     k_mer_positions = collections.defaultdict(list)
 
@@ -44,8 +79,38 @@ def estimate_L(genome, k):
         return None  # Not enough repeats found to estimate L
 
 
+# Distances between consecutive occurrences of every repeated k-mer, as a NumPy array
+def repeat_gaps(genome, k, database=None):
+    from clump_engine import kmer_gaps, occurrence_gaps
+    if database is not None and database.matches(k, with_positions=True):
+        return occurrence_gaps(*database.occurrences())
+    return kmer_gaps(genome, k)
+
+
+# Summary of the repeat distance distribution (instead of only the integer mean used for L)
+def gap_distribution(gaps, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95), bins=20):
+    import numpy as np
+    if not len(gaps):
+        return None
+    histogram, edges = np.histogram(gaps, bins=bins)
+    return {
+        "count": int(len(gaps)),
+        "mean": float(np.mean(gaps)),
+        "median": float(np.median(gaps)),
+        "quantiles": dict(zip(quantiles, np.quantile(gaps, quantiles).tolist())),
+        "histogram": (histogram.tolist(), edges.tolist()),
+    }
+
+
 # Function to estimate t based on the number of repeats in each window
-def estimate_t(genome, k, L):
+def estimate_t(genome, k, L, backend="python"):
+    if backend == "numpy":
+        # Incremental window counts with a histogram of count values (see clump_engine.py):
+        # O(1) per window instead of a new frequency map per window
+        from clump_engine import window_max_counts
+        maxima = window_max_counts(genome, k, L)
+        return int(maxima.sum()) // len(maxima) if len(maxima) else None
+
     repetition_counts = []
 
     # Slide windows of length L
@@ -70,14 +135,22 @@ def estimate_t(genome, k, L):
 
 
 # Main function to estimate k, L, and t
-def estimate_clump_parameters(genome):
+# databases: optional {k: KmerDatabase} with positions, used for k and L (see kmer_database.py)
+def estimate_clump_parameters(genome, approximate=False, error=0.005, backend="python", databases=None):
+    # backend="suffix": one suffix array + LCP build serves both k and L (see suffix_stats.py)
+    stats = None
+    if backend == "suffix":
+        from suffix_stats import SuffixStats
+        stats = SuffixStats.from_text(genome)
+        backend = "numpy"
+
     # Estimate k
-    k, diversity = estimate_k(genome)
+    k, diversity = estimate_k(genome, approximate, error, stats, databases)
     print(f"Estimated optimal k: {k}")
     print(f"Diversity of k-mers for each k: {diversity}")
 
     # Estimate L
-    L = estimate_L(genome, k)
+    L = estimate_L(genome, k, stats, backend, (databases or {}).get(k))
     if L:
         print(f"Estimated window size L: {L}")
     else:
@@ -85,7 +158,7 @@ def estimate_clump_parameters(genome):
 
     # Estimate t
     if L:
-        t = estimate_t(genome, k, L)
+        t = estimate_t(genome, k, L, backend)
         if t:
             print(f"Estimated repetition threshold t: {t}")
         else:
@@ -96,8 +169,49 @@ def estimate_clump_parameters(genome):
     return k, L, t
 
 
-# Example usage
-genome = ""  # Insert the genome sequence here
-k, L, t = estimate_clump_parameters(genome)
-
-print(f"Estimated parameters: k = {k}, L = {L}, t = {t}")
+# Example usage (runs only when the script is executed directly)
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Estimate clump-finding parameters k, L and t from a genome.")
+    parser.add_argument("--file", "-f", default=None, help="Genome file (FASTA or plain sequence)")
+    parser.add_argument("--approximate", action="store_true",
+                        help="Estimate k-mer diversity with HyperLogLog sketches in one pass (see kmer_sketch.py)")
+    parser.add_argument("--error", type=float, default=0.005,
+                        help="Relative standard error of the approximate diversity (default: 0.005)")
+    parser.add_argument("--backend", choices=["python", "numpy", "suffix"], default="python",
+                        help="'numpy' uses the integer-code engines (see clump_engine.py); 'suffix' also "
+                             "derives k and L from one suffix array + LCP build (see suffix_stats.py; default: python)")
+    parser.add_argument("--gaps", action="store_true",
+                        help="Also print the distribution of repeat distances for the estimated k")
+    parser.add_argument("--db", default=None,
+                        help="Directory of k-mer databases with positions (one per k, see kmer_database.py), "
+                             "reused when they match --file and (re)built otherwise")
+    args = parser.parse_args()
+    if args.db and not args.file:
+        parser.error("--db needs --file")
+
+    genome = ""  # Insert the genome sequence here
+    if args.file:
+        from fasta_index import read_genome
+        genome = read_genome(args.file)
+    databases = None
+    if args.db:
+        import os
+        from kmer_database import KmerDatabase
+        databases = {k: KmerDatabase.open_or_build(os.path.join(args.db, f"k{k}"), args.file, k, with_positions=True)
+                     for k in K_VALUES}
+    k, L, t = estimate_clump_parameters(genome, args.approximate, args.error, args.backend, databases)
+
+    print(f"Estimated parameters: k = {k}, L = {L}, t = {t}")
+
+    if args.gaps:
+        summary = gap_distribution(repeat_gaps(genome, k, (databases or {}).get(k)))
+        if summary:
+            quantiles = ", ".join(f"{q:g}: {v:g}" for q, v in summary["quantiles"].items())
+            print(f"Repeat distances ({summary['count']}): mean {summary['mean']:.1f}, "
+                  f"median {summary['median']:g}, quantiles {{{quantiles}}}")
+            counts, edges = summary["histogram"]
+            for count, lo, hi in zip(counts, edges, edges[1:]):
+                print(f"  [{lo:.0f}, {hi:.0f})\t{count}")
+        else:
+            print("No repeated k-mers.")
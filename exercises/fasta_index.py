@@ -0,0 +1,258 @@
+# exercises/fasta_index.py
+# Run:
+#   python exercises/fasta_index.py data/raw/Genomes/e_coli.fasta                  # build/show the .fai index
+#   python exercises/fasta_index.py data/raw/Genomes/e_coli.fasta --region NC_000913.3:1000-1100
+
+"""
+Indexed FASTA reader with random access (samtools faidx compatible).
+
+read_genome()-style helpers load the whole file and then call
+.replace('\\n', ''), which keeps two full copies of the genome in memory and
+gives no random access. FastaIndex instead:
+- builds (or reuses) a samtools-compatible .fai index
+  (NAME, LENGTH, OFFSET, LINEBASES, LINEWIDTH per record); it is only saved
+  next to the file with save_index=True (the CLI does this),
+- memory-maps the FASTA file, so only the bytes that are requested are read,
+- fetches region(name, start, end) directly from the mapped bytes,
+- streams whole records in fixed-size chunks with iter_chunks().
+
+Coordinates are 0-based and half-open, like Python slices. The CLI --region
+option uses the samtools 1-based inclusive "name:start-end" syntax.
+
+Plain sequence files without a '>' header (as used by the exercises) are
+treated as one record named after the file.
+
+An index needs every line of a record but the last to have the same length.
+read_genome() falls back to parse_record(), a line-by-line parse that
+accepts any line lengths, when build_fai() rejects a file.
+"""
+
+import argparse
+import mmap
+import os
+from collections import OrderedDict, namedtuple
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from packed_sequence import PackedSequence
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # bases per chunk in iter_chunks()
+
+FaiRecord = namedtuple("FaiRecord", ["name", "length", "offset", "linebases", "linewidth"])
+
+
+def build_fai(fasta_path: str) -> List[FaiRecord]:
+    """Scan a FASTA file once (line by line, never loading it whole) and return its index records."""
+    records = []
+    default_name = os.path.splitext(os.path.basename(fasta_path))[0]
+    name, length, offset, linebases, linewidth = None, 0, 0, 0, 0
+    short_line_seen = False
+    pos = 0
+
+    def close_record():
+        if name is not None:
+            records.append(FaiRecord(name, length, offset, linebases, linewidth))
+
+    with open(fasta_path, "rb") as f:
+        for line_no, line in enumerate(f, start=1):
+            line_start = pos
+            pos += len(line)
+            if line.startswith(b">"):
+                close_record()
+                name = line[1:].split()[0].decode("ascii") if line[1:].split() else ""
+                length, offset, linebases, linewidth = 0, pos, 0, 0
+                short_line_seen = False
+                continue
+            if name is None:
+                # Headerless plain sequence file: one record starting at the first line
+                name, offset = default_name, line_start
+            bases = len(line.rstrip(b"\r\n").rstrip())
+            if bases and short_line_seen:
+                # Only the last line of a record may be shorter than the others
+                raise ValueError(f"{fasta_path}:{line_no}: different line length in record '{name}'")
+            if linebases == 0:
+                linebases, linewidth = bases, len(line)
+            elif bases > linebases:
+                raise ValueError(f"{fasta_path}:{line_no}: different line length in record '{name}'")
+            if bases < linebases or bases == 0:
+                short_line_seen = True
+            length += bases
+    close_record()
+    return records
+
+
+def write_fai(records: List[FaiRecord], fai_path: str) -> None:
+    with open(fai_path, "w") as f:
+        for r in records:
+            f.write(f"{r.name}\t{r.length}\t{r.offset}\t{r.linebases}\t{r.linewidth}\n")
+
+
+def read_fai(fai_path: str) -> List[FaiRecord]:
+    with open(fai_path, "r") as f:
+        rows = [line.rstrip("\n").split("\t") for line in f if line.strip()]
+    return [FaiRecord(row[0], *map(int, row[1:5])) for row in rows]
+
+
+class FastaIndex:
+    """Random access to the records of a (memory-mapped) FASTA file through its .fai index."""
+
+    def __init__(self, fasta_path: str, fai_path: Optional[str] = None, save_index: bool = False):
+        self.fasta_path = fasta_path
+        self.fai_path = fai_path or fasta_path + ".fai"
+        self.save_index = save_index
+        self.records = OrderedDict((r.name, r) for r in self._load_or_build_fai())
+
+        self._file = open(fasta_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._bytes = np.frombuffer(self._mm, dtype=np.uint8)
+
+    def _load_or_build_fai(self) -> List[FaiRecord]:
+        """Reuse an up-to-date .fai; otherwise build it (and with save_index=True try to save it)."""
+        if os.path.exists(self.fai_path) and \
+                os.path.getmtime(self.fai_path) >= os.path.getmtime(self.fasta_path):
+            return read_fai(self.fai_path)
+        records = build_fai(self.fasta_path)
+        if not self.save_index:
+            return records
+        try:
+            write_fai(records, self.fai_path)
+        except OSError:
+            pass  # read-only location: keep the index in memory only
+        return records
+
+    def close(self) -> None:
+        self._bytes = None
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "FastaIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.records)
+
+    def length(self, name: str) -> int:
+        return self.records[name].length
+
+    def _region_bytes(self, name: str, start: int, end: int) -> np.ndarray:
+        """Bases [start, end) of a record as a uint8 array (one copy, line breaks removed)."""
+        r = self.records[name]
+        start, end = max(0, start), min(r.length, end)
+        if start >= end:
+            return np.zeros(0, dtype=np.uint8)
+
+        first_line, first_col = divmod(start, r.linebases)
+        last_line = (end - 1) // r.linebases
+        rows = last_line - first_line + 1
+        base = r.offset + first_line * r.linewidth
+        # Whole rows are viewed as a (rows, linewidth) matrix and the line-break columns dropped;
+        # the record's last row may be shorter when the file does not end with a newline.
+        full_rows = min(rows, (len(self._bytes) - base) // r.linewidth)
+        block = self._bytes[base:base + full_rows * r.linewidth]
+        parts = [block.reshape(full_rows, r.linewidth)[:, :r.linebases].ravel()]
+        if full_rows < rows:
+            tail = base + full_rows * r.linewidth
+            parts.append(self._bytes[tail:tail + r.linebases])
+        seq = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        return seq[first_col:first_col + (end - start)]
+
+    def region(self, name: str, start: int = 0, end: Optional[int] = None) -> str:
+        """Bases [start, end) (0-based, half-open) of record 'name'; end=None means to the end."""
+        if end is None:
+            end = self.records[name].length
+        return self._region_bytes(name, start, end).tobytes().decode("ascii")
+
+    def region_packed(self, name: str, start: int = 0, end: Optional[int] = None) -> PackedSequence:
+        """Same as region() but returned as a PackedSequence, without building a str."""
+        if end is None:
+            end = self.records[name].length
+        return PackedSequence.from_ascii(self._region_bytes(name, start, end))
+
+    def iter_chunks(self, name: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+        """Stream bases [start, end) of record 'name' as strings of at most chunk_size bases."""
+        if end is None:
+            end = self.records[name].length
+        for chunk_start in range(start, end, chunk_size):
+            yield self.region(name, chunk_start, min(chunk_start + chunk_size, end))
+
+
+def parse_record(file_path: str, name: Optional[str] = None) -> str:
+    """
+    Sequence of one record (the first one by default) of a FASTA or plain sequence file,
+    streamed line by line; lines may have any length.
+    """
+    default_name = os.path.splitext(os.path.basename(file_path))[0]
+    current, selected, lines = None, False, []
+    with open(file_path, "r") as f:
+        for line in f:
+            if line.startswith(">"):
+                if selected:
+                    break
+                fields = line[1:].split()
+                current = fields[0] if fields else ""
+                selected = name is None or current == name
+                continue
+            if current is None:
+                # Headerless plain sequence file: one record named after the file
+                current = default_name
+                selected = name is None or current == name
+            if selected:
+                lines.append(line.strip())
+    if name is not None and not selected:
+        raise KeyError(name)
+    return "".join(lines)
+
+
+def read_genome(file_path: str, name: Optional[str] = None, save_index: bool = False) -> str:
+    """
+    Sequence of one record (the first one by default) of a FASTA or plain sequence file,
+    read through the .fai index so only that record is decoded. Files that cannot be
+    indexed (lines of varying length) are parsed with parse_record() instead.
+    """
+    try:
+        fasta = FastaIndex(file_path, save_index=save_index)
+    except ValueError:
+        return parse_record(file_path, name)
+    with fasta:
+        if not fasta.records:
+            return ""
+        return fasta.region(name or fasta.names[0])
+
+
+def parse_region(region: str):
+    """samtools-style 'name:start-end' (1-based, inclusive) -> (name, start, end) 0-based half-open."""
+    name, _, span = region.rpartition(":")
+    if not name:
+        return region, 0, None
+    start, _, end = span.replace(",", "").partition("-")
+    return name, int(start) - 1, int(end) if end else None
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Build a .fai index and fetch regions from a FASTA file.")
+    ap.add_argument("fasta", help="Path to a FASTA (or plain sequence) file.")
+    ap.add_argument("--region", "-r", action="append", default=[],
+                    help="Region to print as name:start-end (1-based, inclusive); repeatable.")
+    args = ap.parse_args()
+
+    with FastaIndex(args.fasta, save_index=True) as fasta:
+        if not args.region:
+            for r in fasta.records.values():
+                print(f"{r.name}\t{r.length}\t{r.offset}\t{r.linebases}\t{r.linewidth}")
+            return
+        for region in args.region:
+            name, start, end = parse_region(region)
+            print(f">{region}")
+            print(fasta.region(name, start, end))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,35 @@
 import re
 import os
 
-def find_origin_in_genome(genome_sequence, dnaA_box_pattern="TTATCCACA"):
+import fasta_index
+
+def find_dnaA_box_positions(genome_sequence, dnaA_box_pattern="TTATCCACA"):
     """
-    Finds the origin of replication in a genome by locating multiple occurrences of the DnaA box pattern.
-    :param genome_sequence: Full genome sequence as a string
+    Finds the start positions of the DnaA box pattern in a genome.
+    :param genome_sequence: Genome sequence (or a shard of it) as a string
     :param dnaA_box_pattern: The DnaA box consensus pattern to search for
-    :return: The start and end positions of the predicted origin region, or a message if none found
+    :return: List of match start positions
     """
     # Build a regex that allows a single variation at the last position of the DnaA box
     pattern = re.compile(f"({dnaA_box_pattern[:7]}.{dnaA_box_pattern[8]})")
 
     # Collect all match start positions
-    positions = [match.start() for match in pattern.finditer(genome_sequence)]
+    return [match.start() for match in pattern.finditer(genome_sequence)]
+
+def find_origin_in_genome(genome_sequence, dnaA_box_pattern="TTATCCACA", d=None):
+    """
+    Finds the origin of replication in a genome by locating multiple occurrences of the DnaA box pattern.
+    :param genome_sequence: Full genome sequence as a string
+    :param dnaA_box_pattern: The DnaA box consensus pattern to search for
+    :param d: If given, count boxes with up to d mismatches on both strands (see dnaa_scan.py)
+              instead of the single-wildcard forward-strand regex
+    :return: The start and end positions of the predicted origin region, or a message if none found
+    """
+    if d is None:
+        positions = find_dnaA_box_positions(genome_sequence, dnaA_box_pattern)
+    else:
+        from dnaa_scan import hit_positions
+        positions = hit_positions(genome_sequence, [dnaA_box_pattern], d)
 
     if not positions:
         return "No DnaA box found."
@@ -27,11 +44,12 @@ def find_origin_in_genome(genome_sequence, dnaA_box_pattern="TTATCCACA"):
 def read_genome_file(file_path):
     """
     Reads a genome sequence from a file.
-    :param file_path: Path to the genome file
+    The first record is fetched through a .fai index and a memory map (see fasta_index.py),
+    so FASTA headers are skipped and no second newline-free copy is made.
+    :param file_path: Path to the genome file (FASTA or plain sequence)
     :return: Genome sequence as a single string
     """
-    with open(file_path, 'r') as file:
-        return file.read().replace('\n', '')
+    return fasta_index.read_genome(file_path)
 
 def save_origin_to_file(origin_info, result_file_path):
     """
@@ -43,6 +61,16 @@ def save_origin_to_file(origin_info, result_file_path):
         file.write(f"Estimated origin position: {origin_info}\n")
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Estimate the origin of replication from DnaA box occurrences.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for the DnaA box scan (see parallel_scan.py; default: 1)")
+    parser.add_argument("--d", type=int, default=None,
+                        help="Allow up to d mismatches and search both strands (see dnaa_scan.py)")
+    args = parser.parse_args()
+    if args.d is not None and args.workers > 1:
+        parser.error("--workers applies to the regex scan only; the --d scan is a single vectorized pass")
+
     # Input genome file and output result paths
     genome_file_path = "/Users/Olivermop/Documents/bioinformatics_portfolio/data/DnaABoxes/vibrio_cholerae.txt"
     result_file_path = "/Users/Olivermop/Documents/bioinformatics_portfolio/results/ori_estimation.txt"
@@ -51,7 +79,13 @@ if __name__ == "__main__":
     genome_sequence = read_genome_file(genome_file_path)
 
     # Find the origin region
-    origin_position = find_origin_in_genome(genome_sequence)
+    if args.d is not None:
+        origin_position = find_origin_in_genome(genome_sequence, d=args.d)
+    elif args.workers > 1:
+        from parallel_scan import parallel_find_origin
+        origin_position = parallel_find_origin(genome_sequence, workers=args.workers)
+    else:
+        origin_position = find_origin_in_genome(genome_sequence)
 
     # Write the result to a file
     save_origin_to_file(origin_position, result_file_path)
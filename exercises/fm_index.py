@@ -0,0 +1,223 @@
+# exercises/fm_index.py
+# Run:
+#   python exercises/fm_index.py build --genome data/raw/Genomes/e_coli.txt --out e_coli.fmi.npz
+#   python exercises/fm_index.py query --index e_coli.fmi.npz CTTGATCAT TTATCCACA
+#   python exercises/fm_index.py query --index e_coli.fmi.npz --count TTATCCACA
+
+"""
+FM-index (suffix array + BWT) for repeated exact pattern queries.
+
+Build the index once per genome, save it to disk, and answer every query in
+time proportional to the pattern length (count) plus the number of hits
+(locate), independently of the genome length.
+
+Implementation notes:
+- The suffix array is built by prefix doubling on NumPy arrays. The first
+  round packs as many characters as fit in an int64 key, so only a handful of
+  doubling rounds are needed on real genomes.
+- The BWT keeps occurrence checkpoints every OCC_STEP rows; a rank query scans
+  at most OCC_STEP BWT symbols.
+- The full suffix array is stored, so `locate` is a single slice.
+- Positions are 0-based and sorted, exactly like pattern_matching().
+"""
+
+import argparse
+from typing import List, Tuple
+
+import numpy as np
+
+OCC_STEP = 128  # BWT rows between occurrence checkpoints
+SENTINEL = 0    # code of the end-of-text symbol '$' (smaller than any character)
+
+
+def read_genome(file_path: str) -> str:
+    """Read a plain genome file, dropping line breaks and whitespace."""
+    with open(file_path, "r") as f:
+        return "".join(f.read().split())
+
+
+def encode_text(text: str) -> Tuple[np.ndarray, str]:
+    """
+    Map the characters of 'text' to dense codes 1..sigma and append the sentinel.
+    Returns (codes, alphabet) where alphabet[c - 1] is the character of code c.
+    """
+    raw = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    symbols = np.unique(raw)
+    lookup = np.zeros(256, dtype=np.uint8)
+    lookup[symbols] = np.arange(1, len(symbols) + 1, dtype=np.uint8)
+    codes = np.empty(len(raw) + 1, dtype=np.uint8)
+    codes[:-1] = lookup[raw]
+    codes[-1] = SENTINEL
+    return codes, bytes(symbols.tolist()).decode("ascii")
+
+
+def _group_starts(flags: np.ndarray) -> np.ndarray:
+    """For every row, the index of the row that opened its group ('flags' marks openers)."""
+    rows = np.arange(len(flags))
+    return np.maximum.accumulate(np.where(flags, rows, 0))
+
+
+def _singletons(starts: np.ndarray) -> np.ndarray:
+    """Rows that form a group of their own, given the group-opener flags."""
+    ends = np.empty_like(starts)
+    ends[:-1] = starts[1:]
+    ends[-1:] = True
+    return starts & ends
+
+
+def build_suffix_array(codes: np.ndarray, sigma: int) -> np.ndarray:
+    """
+    Suffix array of 'codes' (which must end with the unique SENTINEL) by prefix doubling.
+    'sigma' is the number of non-sentinel symbols.
+
+    The rank of a suffix is the first suffix-array row of its group, so each
+    round only re-sorts the suffixes that still share a group (Larsson-Sadakane).
+    """
+    n = len(codes)
+    base = max(sigma + 1, 2)
+
+    # Round 0: pack the first q characters of every suffix into one int64 key.
+    q = max(1, min(n, int(62 // np.log2(base))))
+    padded = np.zeros(n + q, dtype=np.int64)
+    padded[:n] = codes
+    key = np.zeros(n, dtype=np.int64)
+    for j in range(q):
+        key = key * base + padded[j:j + n]
+    order = np.argsort(key)
+    sorted_key = key[order]
+    del key, padded
+
+    starts = np.ones(n, dtype=bool)
+    starts[1:] = sorted_key[1:] != sorted_key[:-1]
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = _group_starts(starts)
+    unresolved = order[~_singletons(starts)]
+
+    # Sort the remaining groups by (rank of i, rank of i + h), doubling h each round.
+    h = q
+    while len(unresolved):
+        first = rank[unresolved]
+        ahead = unresolved + h
+        second = np.where(ahead < n, rank[np.minimum(ahead, n - 1)], -1)
+        by_key = np.lexsort((second, first))
+        unresolved, first, second = unresolved[by_key], first[by_key], second[by_key]
+
+        old_starts = np.ones(len(unresolved), dtype=bool)
+        old_starts[1:] = first[1:] != first[:-1]
+        rows = first + np.arange(len(unresolved)) - _group_starts(old_starts)
+        order[rows] = unresolved
+
+        starts = old_starts.copy()
+        starts[1:] |= second[1:] != second[:-1]
+        rank[unresolved] = np.maximum.accumulate(np.where(starts, rows, 0))
+        unresolved = unresolved[~_singletons(starts)]
+        h *= 2
+
+    return order.astype(np.int32 if n < 2 ** 31 else np.int64)
+
+
+class FMIndex:
+    """FM-index over a single text with count() and locate() queries."""
+
+    def __init__(self, sa: np.ndarray, bwt: np.ndarray, alphabet: str):
+        self.sa = sa
+        self.bwt = bwt
+        self.alphabet = alphabet
+        self._code = {ch: i + 1 for i, ch in enumerate(alphabet)}
+
+        sigma = len(alphabet) + 1
+        symbol_counts = np.bincount(bwt, minlength=sigma)
+        # C[c] = number of text symbols (sentinel included) smaller than c
+        self.C = np.concatenate(([0], np.cumsum(symbol_counts)[:-1])).astype(np.int64)
+
+        # occ[b, c] = occurrences of c in bwt[:b * OCC_STEP]
+        n_blocks = len(bwt) // OCC_STEP + 1
+        self.occ = np.zeros((n_blocks, sigma), dtype=np.int64)
+        for c in range(sigma):
+            running = np.concatenate(([0], np.cumsum(bwt == c)))
+            self.occ[:, c] = running[::OCC_STEP][:n_blocks]
+
+    @classmethod
+    def from_text(cls, text: str) -> "FMIndex":
+        """Build the index for 'text'."""
+        codes, alphabet = encode_text(text)
+        sa = build_suffix_array(codes, len(alphabet))
+        bwt = codes[sa - 1]  # sa == 0 wraps to the sentinel
+        return cls(sa, bwt, alphabet)
+
+    def __len__(self) -> int:
+        """Length of the indexed text (without the sentinel)."""
+        return len(self.sa) - 1
+
+    def _rank(self, c: int, i: int) -> int:
+        """Occurrences of code c in bwt[:i]."""
+        block = i // OCC_STEP
+        start = block * OCC_STEP
+        return int(self.occ[block, c]) + int(np.count_nonzero(self.bwt[start:i] == c))
+
+    def interval(self, pattern: str) -> Tuple[int, int]:
+        """Suffix-array interval [lo, hi) of the suffixes starting with 'pattern'."""
+        lo, hi = 0, len(self.sa)
+        for ch in reversed(pattern):
+            c = self._code.get(ch)
+            if c is None:
+                return 0, 0
+            lo = int(self.C[c]) + self._rank(c, lo)
+            hi = int(self.C[c]) + self._rank(c, hi)
+            if lo >= hi:
+                return 0, 0
+        return lo, hi
+
+    def count(self, pattern: str) -> int:
+        """Number of (overlapping) occurrences of 'pattern'."""
+        lo, hi = self.interval(pattern)
+        return hi - lo
+
+    def locate(self, pattern: str) -> List[int]:
+        """Sorted 0-based start positions of 'pattern'."""
+        lo, hi = self.interval(pattern)
+        return sorted(self.sa[lo:hi].tolist())
+
+    def save(self, path: str) -> None:
+        """Write the index to an uncompressed .npz file."""
+        np.savez(path, sa=self.sa, bwt=self.bwt,
+                 alphabet=np.frombuffer(self.alphabet.encode("ascii"), dtype=np.uint8))
+
+    @classmethod
+    def load(cls, path: str) -> "FMIndex":
+        """Load an index written by save()."""
+        with np.load(path) as data:
+            alphabet = data["alphabet"].tobytes().decode("ascii")
+            return cls(data["sa"], data["bwt"], alphabet)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Build or query an FM-index for exact pattern matching.")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    b = sub.add_parser("build", help="Build an index from a genome file.")
+    b.add_argument("--genome", "-g", required=True, help="Path to the genome file.")
+    b.add_argument("--out", "-o", required=True, help="Output index path (.npz).")
+
+    q = sub.add_parser("query", help="Query a saved index.")
+    q.add_argument("--index", "-i", required=True, help="Path to an index built with 'build'.")
+    q.add_argument("--count", action="store_true", help="Print only the number of occurrences.")
+    q.add_argument("patterns", nargs="+", help="Patterns to search for.")
+    args = ap.parse_args()
+
+    if args.command == "build":
+        index = FMIndex.from_text(read_genome(args.genome))
+        index.save(args.out)
+        print(f"Indexed {len(index)} bases into {args.out}")
+        return
+
+    index = FMIndex.load(args.index)
+    for pattern in args.patterns:
+        if args.count:
+            print(f"{pattern}\t{index.count(pattern)}")
+        else:
+            print(f"{pattern}\t{' '.join(map(str, index.locate(pattern)))}")
+
+
+if __name__ == "__main__":
+    main()
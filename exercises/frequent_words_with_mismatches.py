@@ -1,65 +1,64 @@
 # /bioinformatics-portfolio/exercises/frequent_words_with_mismatches.py
 # This script finds the most frequent k-mers with up to d mismatches in a given DNA string.
 
-from itertools import product
+import numpy as np
 
-# Function to generate all possible neighbors within d mismatches
-def neighbors(pattern, d):
-    nucleotides = ['A', 'C', 'G', 'T']
-    if d == 0:
-        return {pattern}
-    if len(pattern) == 1:
-        return set(nucleotides)
+# d-neighborhoods are enumerated on 2-bit k-mer codes (see kmer_neighbors.py):
+# substitution_masks(k, d) XOR-ed with a block of window codes gives their neighborhoods as integer codes
+from kmer_neighbors import decode_codes, substitution_masks
+from mismatch_counter import DENSE_MAX_K, frequent_words_with_mismatches_sorted
+from packed_sequence import PackedSequence
 
-    neighborhood = set()
-    suffix_neighbors = neighbors(pattern[1:], d)
-    for text in suffix_neighbors:
-        # If the suffix has fewer than d differences, substitute the first character
-        if hamming_distance(pattern[1:], text) < d:
-            for nucleotide in nucleotides:
-                neighborhood.add(nucleotide + text)
-        else:
-            neighborhood.add(pattern[0] + text)
+NEIGHBOR_BLOCK = 1 << 20  # neighbor codes expanded per step
 
-    return neighborhood
+# Function to get the integer codes of the windows of a DNA string
+# (case-insensitive; windows containing a non-ACGT character are skipped)
+def window_codes(Text, k):
+    seq = PackedSequence.from_string(Text)
+    return seq.kmer_codes(k)[seq.valid_kmers(k)]
 
-# Function to calculate the Hamming distance between two sequences
-def hamming_distance(p, q):
-    # Count the positions where the sequences differ
-    return sum(1 for i in range(len(p)) if p[i] != q[i])
+# Function to count the d-neighborhoods of all windows in a 4^k array,
+# expanding one block of windows at a time so memory does not grow with the text
+def neighborhood_counts(codes, k, d):
+    masks = substitution_masks(k, d)
+    counts = np.zeros(4 ** k, dtype=np.int64)
+    windows_per_block = max(1, NEIGHBOR_BLOCK // len(masks))
+    for start in range(0, len(codes), windows_per_block):
+        neighbors = codes[start:start + windows_per_block, None] ^ masks[None, :]
+        block_codes, block_counts = np.unique(neighbors, return_counts=True)
+        counts[block_codes.astype(np.int64)] += block_counts
+    return counts
 
 # Function to find the most frequent k-mers with mismatches in a DNA string
-def frequent_words_with_mismatches(Text, k, d):
-    freq_map = {}  # Dictionary to store frequency of each k-mer
-    n = len(Text)
+# backend="numpy" spreads exact k-mer counts over a dense 4^k array for k <= 12 and
+# sorts/reduces neighbor codes in memory-bounded chunks for larger k (mismatch_counter.py)
+def frequent_words_with_mismatches(Text, k, d, backend="python"):
+    if backend == "numpy":
+        from mismatch_counter import frequent_words_with_mismatches_fast
+        return frequent_words_with_mismatches_fast(Text, k, d)
 
-    # Iterate over all k-mers in the text
-    for i in range(n - k + 1):
-        pattern = Text[i:i + k]
-        neighborhood = neighbors(pattern, d)  # Get the d-neighborhood of the pattern
+    # Above DENSE_MAX_K a 4^k array no longer fits: count with the sorted runs spilled to disk
+    if k > DENSE_MAX_K:
+        return frequent_words_with_mismatches_sorted(Text, k, d)[0]
 
-        # Count each k-mer in the neighborhood
-        for neighbor in neighborhood:
-            if neighbor not in freq_map:
-                freq_map[neighbor] = 1
-            else:
-                freq_map[neighbor] += 1
-
-    # Determine the maximum frequency
-    max_count = max(freq_map.values())
+    # Count every k-mer of the d-neighborhoods of all windows
+    counts = neighborhood_counts(window_codes(Text, k), k, d)
+    if not counts.any():
+        return []
 
     # Collect all k-mers with the maximum frequency
-    most_frequent_kmers = [pattern for pattern, count in freq_map.items() if count == max_count]
+    most_frequent_kmers = decode_codes(np.flatnonzero(counts == counts.max()), k)
 
     return most_frequent_kmers
 
-# Example input
-Text = "GATGAGCTACTACGATGTGTTACAGCTGTTCCTCCGATGTCCGATGTGTTCCAGCAGCTACAGCAGCTGTTGTTGTTCCTGTTGTTACTCCGATGGATGTACTCCTACTACTCCAGCTGTTGTGATGTCCGATGTACGATGTCCTGTGATGTGTTACTGTTCCTACTCCAGCTACTCCAGCGATGTGTAGCAGCGATGTACAGCAGCTGTTGTGATGGATGTCCTACGATGTGTTGTTACGATGTACAGCTACTCCTCCAGCTGTGATGTGTGATGAGCAGCGATGTCCTGTTACTACTGTTGTAGCTCCTCCTCCTCCTCCAGCTCCAGCTACTGTTGTAGCTCCAGCTACTCCTAC"
-k = 7
-d = 2
+if __name__ == "__main__":
+    # Example input
+    Text = "GATGAGCTACTACGATGTGTTACAGCTGTTCCTCCGATGTCCGATGTGTTCCAGCAGCTACAGCAGCTGTTGTTGTTCCTGTTGTTACTCCGATGGATGTACTCCTACTACTCCAGCTGTTGTGATGTCCGATGTACGATGTCCTGTGATGTGTTACTGTTCCTACTCCAGCTACTCCAGCGATGTGTAGCAGCGATGTACAGCAGCTGTTGTGATGGATGTCCTACGATGTGTTGTTACGATGTACAGCTACTCCTCCAGCTGTGATGTGTGATGAGCAGCGATGTCCTGTTACTACTGTTGTAGCTCCTCCTCCTCCTCCAGCTCCAGCTACTGTTGTAGCTCCAGCTACTCCTAC"
+    k = 7
+    d = 2
 
-# Compute the most frequent k-mers with mismatches
-result = frequent_words_with_mismatches(Text, k, d)
+    # Compute the most frequent k-mers with mismatches
+    result = frequent_words_with_mismatches(Text, k, d)
 
-# Print the result
-print(" ".join(result))
+    # Print the result
+    print(" ".join(result))
@@ -0,0 +1,96 @@
+# exercises/hamming_scan.py
+# Run:
+#   python exercises/hamming_scan.py --file data/raw/Genomes/e_coli.txt --pattern ATGATCAAG --d 3
+#   python exercises/hamming_scan.py --file genome.txt --pattern ATGATCAAG --d 3 --count
+
+"""
+Vectorized Hamming-bounded pattern search.
+
+Same results as ApproximatePatternMatching / approximate_pattern_count, but
+instead of comparing one window at a time, the mismatch counts of all windows
+are accumulated column by column on the byte array of the text:
+
+    mismatches[i] = sum_j (text[i + j] != pattern[j])
+
+That is len(pattern) vector operations over the text. Windows are processed in
+blocks of BLOCK_SIZE, and inside a block only windows still within d
+mismatches are carried to the next column, so the work drops quickly once
+most windows are ruled out.
+
+Characters are compared byte for byte, exactly like the string versions
+(no case folding, any symbol allowed).
+"""
+
+import argparse
+
+import numpy as np
+
+BLOCK_SIZE = 1 << 22  # windows per block; bounds the temporary arrays
+
+
+def as_bytes(text: str) -> np.ndarray:
+    """View a text as a uint8 array (one element per character)."""
+    return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+
+
+def _block_matches(t: np.ndarray, p: np.ndarray, start: int, stop: int, d: int) -> np.ndarray:
+    """Windows in [start, stop) within d mismatches, dropping windows as soon as they exceed d."""
+    candidates = np.arange(start, stop)
+    counts = np.zeros(stop - start, dtype=np.int32)
+    pruned = False
+    for j, base in enumerate(p):
+        if pruned:
+            counts += t[candidates + j] != base
+        else:
+            counts += t[start + j:stop + j] != base
+        alive = counts <= d
+        if not alive.all():
+            candidates = candidates[alive]
+            counts = counts[alive]
+            pruned = True
+            if not len(candidates):
+                break
+    return candidates
+
+
+def approximate_match_positions(pattern: str, text: str, d: int) -> np.ndarray:
+    """0-based start positions where 'pattern' occurs in 'text' with at most d mismatches."""
+    m = len(pattern)
+    n_windows = len(text) - m + 1
+    if n_windows <= 0 or d < 0:
+        return np.zeros(0, dtype=np.int64)
+    if d >= m:
+        return np.arange(n_windows, dtype=np.int64)
+
+    t = as_bytes(text)
+    p = as_bytes(pattern)
+    hits = [_block_matches(t, p, start, min(start + BLOCK_SIZE, n_windows), d)
+            for start in range(0, n_windows, BLOCK_SIZE)]
+    return np.concatenate(hits).astype(np.int64)
+
+
+def approximate_count(text: str, pattern: str, d: int) -> int:
+    """Number of windows of 'text' within d mismatches of 'pattern' (argument order of approximate_pattern_count)."""
+    return len(approximate_match_positions(pattern, text, d))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Vectorized approximate pattern matching (Hamming distance <= d).")
+    ap.add_argument("--file", "-f", required=True, help="Path to the genome/text file.")
+    ap.add_argument("--pattern", "-p", required=True, help="Pattern to search for.")
+    ap.add_argument("--d", type=int, default=0, help="Maximum number of mismatches (default: 0).")
+    ap.add_argument("--count", action="store_true", help="Print only the number of matches.")
+    args = ap.parse_args()
+
+    with open(args.file, "r") as f:
+        text = "".join(f.read().split())
+
+    positions = approximate_match_positions(args.pattern, text, args.d)
+    if args.count:
+        print(len(positions))
+    else:
+        print(" ".join(map(str, positions.tolist())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# exercises/kmer_counter.py
+# Run:
+#   python exercises/kmer_counter.py --file data/raw/Genomes/e_coli.txt --k 9 --top 10
+#   python exercises/kmer_counter.py --file genome.txt --k 21 --query ATGATCAAGATGATCAAGATG
+#   python exercises/kmer_counter.py --file genome.txt --k 9 --canonical --top 10
+
+"""
+k-mer counting on rolling 2-bit codes.
+
+frequency_table() and most_frequent_kmer() slice every k-mer into a new string
+and count it in a dict. KmerCounter encodes the sequence once
+(see packed_sequence.py), computes the code of every window in a few vector
+passes, and counts the codes:
+
+- k <= DENSE_MAX_K: np.bincount into a dense table of 4^k counts
+  (8 * 4^k bytes: 2 MB for k = 9, 512 MB for k = 13),
+- larger k: sort/unique on the uint64 codes, queried by binary search.
+
+Windows containing non-ACGT bases are skipped. Results are reported in
+lexicographic k-mer order, which is the order of the codes.
+
+With canonical=True every window is counted under its canonical code,
+min(forward, reverse complement), so a k-mer and its reverse complement share
+one strand-symmetric count from a single pass. Queries accept either strand
+and results are reported under the canonical (lexicographically smaller) k-mer.
+"""
+
+import argparse
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from fasta_index import FastaIndex
+from packed_sequence import as_packed_sequence, decode_kmer, encode_kmer, reverse_complement_codes
+
+DENSE_MAX_K = 13
+
+
+class KmerCounter:
+    """Counts of all k-mers of a sequence, with most_frequent/top_n/counts_for queries."""
+
+    def __init__(self, seq, k: int, dense: bool = None, canonical: bool = False):
+        seq = as_packed_sequence(seq)
+        self.k = k
+        self.canonical = canonical
+        self.dense = k <= DENSE_MAX_K if dense is None else dense
+        codes = seq.canonical_kmer_codes(k) if canonical else seq.kmer_codes(k)
+        codes = codes[seq.valid_kmers(k)]
+        self.total = len(codes)
+
+        if self.dense:
+            self.table = np.bincount(codes.astype(np.int64), minlength=4 ** k)
+        else:
+            self.codes, self.counts = np.unique(codes, return_counts=True)
+
+    def nonzero(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(codes, counts) of the k-mers that occur, in increasing code order."""
+        if self.dense:
+            codes = np.flatnonzero(self.table)
+            return codes.astype(np.uint64), self.table[codes]
+        return self.codes, self.counts
+
+    def distinct(self) -> int:
+        """Number of distinct k-mers."""
+        return int(np.count_nonzero(self.table)) if self.dense else len(self.codes)
+
+    def count_codes(self, codes: np.ndarray) -> np.ndarray:
+        """Counts of an array of k-mer codes."""
+        codes = np.asarray(codes, dtype=np.uint64)
+        if self.canonical:
+            codes = np.minimum(codes, reverse_complement_codes(codes, self.k))
+        if self.dense:
+            return self.table[codes.astype(np.int64)]
+        if not len(self.codes):
+            return np.zeros(len(codes), dtype=np.int64)
+        idx = np.minimum(np.searchsorted(self.codes, codes), len(self.codes) - 1)
+        return np.where(self.codes[idx] == codes, self.counts[idx], 0)
+
+    def counts_for(self, patterns: Iterable[str]) -> List[int]:
+        """Counts of the given k-mers (0 for k-mers that do not occur or contain non-ACGT bases)."""
+        patterns = list(patterns)
+        codes, usable = [], []
+        for p in patterns:
+            ok = len(p) == self.k and set(p) <= set("ACGT")
+            usable.append(ok)
+            codes.append(encode_kmer(p) if ok else 0)
+        counts = self.count_codes(np.array(codes, dtype=np.uint64))
+        return [int(c) if ok else 0 for c, ok in zip(counts.tolist(), usable)]
+
+    def count(self, pattern: str) -> int:
+        return self.counts_for([pattern])[0]
+
+    def most_frequent(self) -> Tuple[List[str], int]:
+        """All k-mers with the highest count (lexicographic order) and that count."""
+        codes, counts = self.nonzero()
+        if not len(counts):
+            return [], 0
+        best = int(counts.max())
+        return [decode_kmer(int(c), self.k) for c in codes[counts == best]], best
+
+    def top_n(self, n: int) -> List[Tuple[str, int]]:
+        """The n most frequent k-mers as (k-mer, count), by decreasing count then lexicographically."""
+        codes, counts = self.nonzero()
+        n = min(n, len(counts))
+        if n <= 0:
+            return []
+        if n < len(counts):
+            # Everything tied with the n-th largest count is kept so the tie-break stays lexicographic
+            threshold = np.partition(counts, len(counts) - n)[len(counts) - n]
+            keep = counts >= threshold
+            codes, counts = codes[keep], counts[keep]
+        order = np.lexsort((codes, -counts.astype(np.int64)))[:n]
+        return [(decode_kmer(int(c), self.k), int(x)) for c, x in zip(codes[order], counts[order])]
+
+    def to_dict(self) -> Dict[str, int]:
+        """Same content as frequency_table(text, k) for an A/C/G/T text."""
+        codes, counts = self.nonzero()
+        return {decode_kmer(int(c), self.k): int(x) for c, x in zip(codes, counts)}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Count k-mers on rolling 2-bit codes.")
+    ap.add_argument("--file", "-f", required=True, help="Path to a FASTA or plain sequence file.")
+    ap.add_argument("--k", type=int, default=9, help="k-mer length (default: 9).")
+    ap.add_argument("--top", type=int, default=10, help="Number of most frequent k-mers to print (default: 10).")
+    ap.add_argument("--query", nargs="*", default=[], help="k-mers whose counts should be printed.")
+    ap.add_argument("--canonical", action="store_true",
+                    help="Count k-mers and their reverse complements together.")
+    args = ap.parse_args()
+
+    with FastaIndex(args.file) as fasta:
+        counter = KmerCounter(fasta.region_packed(fasta.names[0]), args.k, canonical=args.canonical)
+
+    print(f"{counter.total} {args.k}-mers, {counter.distinct()} distinct")
+    for kmer, count in counter.top_n(args.top):
+        print(f"{kmer}\t{count}")
+    for kmer, count in zip(args.query, counter.counts_for(args.query)):
+        print(f"{kmer}\t{count}")
+
+
+if __name__ == "__main__":
+    main()
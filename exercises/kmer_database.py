@@ -0,0 +1,334 @@
+# exercises/kmer_database.py
+# Run:
+#   python exercises/kmer_database.py build --genome data/raw/Genomes/e_coli.txt --k 9 --out e_coli.k9.kdb
+#   python exercises/kmer_database.py query --db e_coli.k9.kdb ATGATCAAG CTTGATCAT --positions
+#   python exercises/kmer_database.py scan --db e_coli.k9.kdb --prefix ATGATC
+#   python exercises/kmer_database.py merge --out all.k9.kdb e_coli.k9.kdb v_cholerae.k9.kdb
+
+"""
+Persistent on-disk k-mer count database.
+
+estimate_ktl.py, clump_finding2.py and questionnaire1.py recount every k-mer
+of the genome on each run. A KmerDatabase stores the counts once, in a
+directory that can be memory-mapped back instantly:
+
+    header.json      format version, k, canonical flag, totals and the
+                     source files with their SHA-256
+    codes.npy        sorted distinct uint64 k-mer codes (see packed_sequence.py)
+    counts.npy       int64 count of each code
+    offsets.npy      optional: positions of codes[i] are
+    positions.npy    positions[offsets[i]:offsets[i + 1]], ascending
+
+Lookups are binary searches on codes.npy; a code range (e.g. every k-mer with
+a given prefix) is a contiguous slice of the arrays. open_or_build() reuses a
+database when its header matches the requested k/mode and the source file
+hash, and rebuilds it otherwise. merge() adds up the counts of databases built
+from different genomes (position lists are per genome and are not merged).
+
+estimate_ktl.py, clump_finding2.py and questionnaire1.py take an opened
+database (database=, or --db on the command line, through open_or_build())
+and use it instead of recounting when matches(k) holds.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from fasta_index import FastaIndex
+from kmer_counter import KmerCounter
+from packed_sequence import as_packed_sequence, decode_kmer, encode_kmer, reverse_complement_codes
+
+FORMAT_VERSION = 1
+HEADER_FILE = "header.json"
+
+
+def file_sha256(file_path: str, block_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class KmerDatabase:
+    """Sorted k-mer codes with counts (and optionally positions), stored as .npy arrays."""
+
+    def __init__(self, header: Dict, codes: np.ndarray, counts: np.ndarray,
+                 offsets: Optional[np.ndarray] = None, positions: Optional[np.ndarray] = None):
+        self.header = header
+        self.k = header["k"]
+        self.canonical = header["canonical"]
+        self.codes = codes
+        self.counts = counts
+        self.offsets = offsets
+        self.positions = positions
+
+    @property
+    def has_positions(self) -> bool:
+        return self.positions is not None
+
+    @classmethod
+    def build(cls, seq, k: int, canonical: bool = False, with_positions: bool = False,
+              sources: Optional[List[Dict]] = None) -> "KmerDatabase":
+        """Count the k-mers of a DNA string or PackedSequence (windows with non-ACGT bases are skipped)."""
+        seq = as_packed_sequence(seq)
+        offsets = positions = None
+        if with_positions:
+            valid = seq.valid_kmers(k)
+            all_codes = seq.canonical_kmer_codes(k) if canonical else seq.kmer_codes(k)
+            positions = np.flatnonzero(valid)
+            order = np.argsort(all_codes[positions], kind="stable")
+            positions = positions[order]
+            codes, counts = np.unique(all_codes[positions], return_counts=True)
+            offsets = np.concatenate(([0], np.cumsum(counts)))
+        else:
+            codes, counts = KmerCounter(seq, k, canonical=canonical).nonzero()
+        header = {
+            "format": FORMAT_VERSION,
+            "k": k,
+            "canonical": canonical,
+            "total": int(counts.sum()),
+            "distinct": len(codes),
+            "positions": with_positions,
+            "sources": sources or [],
+        }
+        return cls(header, codes.astype(np.uint64), counts.astype(np.int64), offsets, positions)
+
+    @classmethod
+    def from_file(cls, genome_path: str, k: int, record: Optional[str] = None,
+                  canonical: bool = False, with_positions: bool = False) -> "KmerDatabase":
+        """Build from one record (the first by default) of a FASTA or plain sequence file."""
+        with FastaIndex(genome_path) as fasta:
+            name = record or fasta.names[0]
+            seq = fasta.region_packed(name)
+        source = {"path": os.path.abspath(genome_path), "record": name, "sha256": file_sha256(genome_path)}
+        return cls.build(seq, k, canonical, with_positions, [source])
+
+    def save(self, path: str) -> None:
+        """Write the database directory (created if needed)."""
+        os.makedirs(path, exist_ok=True)
+        # Drop an existing header first, so an interrupted rewrite is never taken for a complete database
+        header_path = os.path.join(path, HEADER_FILE)
+        if os.path.exists(header_path):
+            os.remove(header_path)
+        np.save(os.path.join(path, "codes.npy"), self.codes)
+        np.save(os.path.join(path, "counts.npy"), self.counts)
+        if self.has_positions:
+            np.save(os.path.join(path, "offsets.npy"), self.offsets)
+            np.save(os.path.join(path, "positions.npy"), self.positions)
+        # The header is written last, so a directory without one is an interrupted build
+        with open(header_path, "w") as f:
+            json.dump(self.header, f, indent=2)
+
+    @classmethod
+    def open(cls, path: str, mmap: bool = True) -> "KmerDatabase":
+        """Open a database directory; with mmap=True the arrays are paged in on demand."""
+        with open(os.path.join(path, HEADER_FILE), "r") as f:
+            header = json.load(f)
+        if header.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported k-mer database format {header.get('format')}")
+        mode = "r" if mmap else None
+
+        def load(name):
+            return np.load(os.path.join(path, name), mmap_mode=mode)
+
+        offsets = positions = None
+        if header["positions"]:
+            offsets, positions = load("offsets.npy"), load("positions.npy")
+        return cls(header, load("codes.npy"), load("counts.npy"), offsets, positions)
+
+    @classmethod
+    def open_or_build(cls, path: str, genome_path: str, k: int, record: Optional[str] = None,
+                      canonical: bool = False, with_positions: bool = False) -> "KmerDatabase":
+        """
+        Open the database at 'path' if it was built from the current contents of genome_path
+        with the same k, mode and record (the first record by default); otherwise (re)build it there first.
+        """
+        header_path = os.path.join(path, HEADER_FILE)
+        if os.path.exists(header_path):
+            if record is None:
+                with FastaIndex(genome_path) as fasta:
+                    record = fasta.names[0]
+            with open(header_path, "r") as f:
+                header = json.load(f)
+            sources = header.get("sources", [])
+            if (header.get("format") == FORMAT_VERSION and header["k"] == k
+                    and header["canonical"] == canonical
+                    and (header["positions"] or not with_positions)
+                    and len(sources) == 1
+                    and sources[0]["record"] == record
+                    and sources[0]["sha256"] == file_sha256(genome_path)):
+                return cls.open(path)
+        cls.from_file(genome_path, k, record, canonical, with_positions).save(path)
+        return cls.open(path)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def matches(self, k: int, with_positions: bool = False) -> bool:
+        """Whether this database holds the plain (not canonical) counts of k-mers, with positions if asked."""
+        return self.k == k and not self.canonical and (self.has_positions or not with_positions)
+
+    def occurrences(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (codes, positions) of every stored occurrence, sorted by code then position;
+        same arrays as clump_engine.kmer_occurrences() of the source genome.
+        """
+        if not self.has_positions:
+            raise ValueError("This database was built without positions (with_positions=False).")
+        return np.repeat(np.asarray(self.codes), np.diff(self.offsets)), np.asarray(self.positions)
+
+    def first_positions(self) -> np.ndarray:
+        """Position of the first occurrence of each stored code."""
+        if not self.has_positions:
+            raise ValueError("This database was built without positions (with_positions=False).")
+        return np.asarray(self.positions)[np.asarray(self.offsets[:-1])]
+
+    def _canonicalize(self, codes: np.ndarray) -> np.ndarray:
+        codes = np.asarray(codes, dtype=np.uint64)
+        if self.canonical:
+            codes = np.minimum(codes, reverse_complement_codes(codes, self.k))
+        return codes
+
+    def _find(self, codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Index of each code in self.codes and whether it is present."""
+        codes = self._canonicalize(codes)
+        if not len(self.codes):
+            return np.zeros(len(codes), dtype=np.int64), np.zeros(len(codes), dtype=bool)
+        idx = np.minimum(np.searchsorted(self.codes, codes), len(self.codes) - 1)
+        return idx, self.codes[idx] == codes
+
+    def count_codes(self, codes: np.ndarray) -> np.ndarray:
+        """Counts of an array of k-mer codes (0 for absent codes)."""
+        idx, found = self._find(codes)
+        return np.where(found, self.counts[idx], 0)
+
+    def counts_for(self, patterns: Iterable[str]) -> List[int]:
+        """Counts of the given k-mers (0 for k-mers that do not occur or contain non-ACGT bases)."""
+        patterns = list(patterns)
+        usable = [len(p) == self.k and set(p) <= set("ACGT") for p in patterns]
+        codes = [encode_kmer(p) if ok else 0 for p, ok in zip(patterns, usable)]
+        counts = self.count_codes(np.array(codes, dtype=np.uint64))
+        return [int(c) if ok else 0 for c, ok in zip(counts.tolist(), usable)]
+
+    def count(self, kmer: str) -> int:
+        return self.counts_for([kmer])[0]
+
+    def positions_of(self, kmer: str) -> np.ndarray:
+        """Start positions of 'kmer' (of either strand in canonical mode), ascending."""
+        if not self.has_positions:
+            raise ValueError("This database was built without positions (with_positions=False).")
+        if len(kmer) != self.k or set(kmer) - set("ACGT"):
+            return np.zeros(0, dtype=np.int64)
+        idx, found = self._find(np.array([encode_kmer(kmer)], dtype=np.uint64))
+        if not found[0]:
+            return np.zeros(0, dtype=np.int64)
+        return np.asarray(self.positions[self.offsets[idx[0]]:self.offsets[idx[0] + 1]])
+
+    def code_range(self, lo_code: int, hi_code: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(codes, counts) of the stored codes in [lo_code, hi_code], as array slices."""
+        lo = np.searchsorted(self.codes, np.uint64(lo_code), side="left")
+        hi = np.searchsorted(self.codes, np.uint64(hi_code), side="right")
+        return self.codes[lo:hi], self.counts[lo:hi]
+
+    def prefix(self, prefix: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(codes, counts) of the stored k-mers starting with 'prefix'."""
+        shift = 2 * (self.k - len(prefix))
+        lo_code = encode_kmer(prefix) << shift
+        return self.code_range(lo_code, lo_code + (1 << shift) - 1)
+
+    def items(self, prefix: str = "") -> Iterator[Tuple[str, int]]:
+        """(k-mer, count) in lexicographic order for the stored k-mers starting with 'prefix'."""
+        codes, counts = self.prefix(prefix)
+        for code, count in zip(codes.tolist(), counts.tolist()):
+            yield decode_kmer(code, self.k), count
+
+    def most_frequent(self) -> Tuple[List[str], int]:
+        """All k-mers with the highest count (lexicographic order) and that count."""
+        if not len(self.counts):
+            return [], 0
+        best = int(self.counts.max())
+        return [decode_kmer(int(c), self.k) for c in self.codes[self.counts == best]], best
+
+
+def merge(databases: List[KmerDatabase]) -> KmerDatabase:
+    """Sum the counts of databases with the same k and mode (e.g. one per genome)."""
+    if not databases:
+        raise ValueError("Nothing to merge.")
+    k, canonical = databases[0].k, databases[0].canonical
+    if any(db.k != k or db.canonical != canonical for db in databases):
+        raise ValueError("Only databases with the same k and canonical mode can be merged.")
+    all_codes = np.concatenate([np.asarray(db.codes) for db in databases])
+    all_counts = np.concatenate([np.asarray(db.counts, dtype=np.int64) for db in databases])
+    # Sort the codes and sum the counts of equal codes, staying in int64
+    order = np.argsort(all_codes, kind="stable")
+    all_codes, all_counts = all_codes[order], all_counts[order]
+    if len(all_codes):
+        starts = np.flatnonzero(np.concatenate(([True], all_codes[1:] != all_codes[:-1])))
+        codes, counts = all_codes[starts], np.add.reduceat(all_counts, starts)
+    else:
+        codes, counts = all_codes, all_counts
+    header = {
+        "format": FORMAT_VERSION,
+        "k": k,
+        "canonical": canonical,
+        "total": int(sum(db.header["total"] for db in databases)),
+        "distinct": len(codes),
+        "positions": False,
+        "sources": [source for db in databases for source in db.header["sources"]],
+    }
+    return KmerDatabase(header, codes.astype(np.uint64), counts.astype(np.int64))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Build, query and merge on-disk k-mer count databases.")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    b = sub.add_parser("build", help="Count the k-mers of a genome into a database directory.")
+    b.add_argument("--genome", "-g", required=True, help="Path to a FASTA or plain sequence file.")
+    b.add_argument("--out", "-o", required=True, help="Output database directory.")
+    b.add_argument("--k", type=int, default=9, help="k-mer length (default: 9).")
+    b.add_argument("--record", type=str, default=None, help="Record name (default: first record).")
+    b.add_argument("--canonical", action="store_true", help="Count k-mers and their reverse complements together.")
+    b.add_argument("--positions", action="store_true", help="Also store the position list of every k-mer.")
+
+    q = sub.add_parser("query", help="Print the counts (and positions) of k-mers.")
+    q.add_argument("--db", required=True, help="Database directory.")
+    q.add_argument("--positions", action="store_true", help="Also print positions.")
+    q.add_argument("kmers", nargs="+")
+
+    s = sub.add_parser("scan", help="Print every k-mer starting with a prefix.")
+    s.add_argument("--db", required=True, help="Database directory.")
+    s.add_argument("--prefix", default="", help="k-mer prefix (default: all k-mers).")
+
+    m = sub.add_parser("merge", help="Add up databases built from several genomes.")
+    m.add_argument("--out", "-o", required=True, help="Output database directory.")
+    m.add_argument("dbs", nargs="+", help="Database directories to merge.")
+    args = ap.parse_args()
+
+    if args.command == "build":
+        db = KmerDatabase.open_or_build(args.out, args.genome, args.k, args.record,
+                                        args.canonical, args.positions)
+        print(f"{db.header['total']} {db.k}-mers, {len(db)} distinct -> {args.out}")
+    elif args.command == "query":
+        db = KmerDatabase.open(args.db)
+        for kmer, count in zip(args.kmers, db.counts_for(args.kmers)):
+            extra = f"\t{' '.join(map(str, db.positions_of(kmer).tolist()))}" if args.positions else ""
+            print(f"{kmer}\t{count}{extra}")
+    elif args.command == "scan":
+        db = KmerDatabase.open(args.db)
+        for kmer, count in db.items(args.prefix):
+            print(f"{kmer}\t{count}")
+    else:
+        db = merge([KmerDatabase.open(path) for path in args.dbs])
+        db.save(args.out)
+        print(f"Merged {len(args.dbs)} databases: {db.header['total']} {db.k}-mers, {len(db)} distinct -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# exercises/kmer_neighbors.py
+# Run:
+#   python exercises/kmer_neighbors.py --pattern ACGTTGCA --d 2
+#   python exercises/kmer_neighbors.py --pattern ACGTTGCA --d 2 --count
+
+"""
+d-neighbourhoods of k-mers on 2-bit integer codes.
+
+The recursive neighbors(pattern, d) in the frequent-words and motif scripts
+rebuilds the neighbourhood of every suffix, recomputes
+hamming_distance(pattern[1:], text) for each suffix neighbour at every level
+and allocates a new string for each one. Here a neighbourhood is one
+vectorized XOR:
+
+- a k-mer code (see packed_sequence.py) has one 2-bit digit per base;
+  XOR-ing a digit with 1, 2 or 3 turns the base into each of the other three,
+- substitution_masks(k, d) lists every mask with at most d non-zero digits
+  (sum_{i<=d} C(k, i) * 3^i of them, all giving different neighbours),
+  built once per (k, d) without recursion,
+- neighbor_codes(code, k, d) = code XOR masks, computed on demand; only the
+  masks are cached, so memory does not grow with the number of k-mers seen,
+- strings are only built when asked for, with decode_codes() decoding a whole
+  array of codes at once.
+
+Masks are ordered by number of substitutions, so neighbours come out
+closest first.
+"""
+
+import argparse
+from functools import lru_cache
+from itertools import combinations, product
+from typing import Iterator, List, Set
+
+import numpy as np
+
+from packed_sequence import encode_kmer
+
+DECODE_BLOCK = 1 << 16  # codes decoded per vectorized step in decode_codes()
+
+_BASE_BYTES = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def substitution_masks(k: int, d: int) -> np.ndarray:
+    """XOR masks turning a k-mer code into each of its neighbours with at most d substitutions."""
+    masks = [0]
+    for n_subs in range(1, min(d, k) + 1):
+        for positions in combinations(range(k), n_subs):
+            for deltas in product((1, 2, 3), repeat=n_subs):
+                mask = 0
+                for pos, delta in zip(positions, deltas):
+                    mask |= delta << (2 * pos)
+                masks.append(mask)
+    masks = np.array(masks, dtype=np.uint64)
+    masks.flags.writeable = False
+    return masks
+
+
+def neighborhood_size(k: int, d: int) -> int:
+    """Number of k-mers within Hamming distance d of a k-mer."""
+    return len(substitution_masks(k, d))
+
+
+def neighbor_codes(code: int, k: int, d: int) -> np.ndarray:
+    """Codes of all k-mers within d mismatches of the k-mer 'code' (closest first)."""
+    return np.uint64(code) ^ substitution_masks(k, d)
+
+
+def decode_codes(codes: np.ndarray, k: int) -> List[str]:
+    """k-mer strings of an array of codes."""
+    codes = np.asarray(codes, dtype=np.uint64)
+    if k == 0:
+        return [""] * len(codes)
+    shifts = np.arange(2 * (k - 1), -1, -2, dtype=np.uint64)
+    kmers = []
+    for start in range(0, len(codes), DECODE_BLOCK):
+        digits = (codes[start:start + DECODE_BLOCK, None] >> shifts[None, :]) & np.uint64(3)
+        text = _BASE_BYTES[digits].tobytes().decode("ascii")
+        kmers.extend(text[i:i + k] for i in range(0, len(text), k))
+    return kmers
+
+
+def neighbors(pattern: str, d: int) -> Set[str]:
+    """d-neighbourhood of 'pattern' as a set of strings (same result as the recursive neighbors())."""
+    k = len(pattern)
+    return set(decode_codes(neighbor_codes(encode_kmer(pattern), k, d), k))
+
+
+def iter_neighbors(pattern: str, d: int) -> Iterator[str]:
+    """Neighbours of 'pattern' one at a time, closest first, without building the whole set."""
+    k = len(pattern)
+    code = encode_kmer(pattern)
+    masks = substitution_masks(k, d)
+    for start in range(0, len(masks), 4096):
+        yield from decode_codes(np.uint64(code) ^ masks[start:start + 4096], k)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="d-neighbourhood of a k-mer from 2-bit codes.")
+    ap.add_argument("--pattern", "-p", required=True, help="k-mer over A/C/G/T.")
+    ap.add_argument("--d", type=int, default=1, help="Maximum number of mismatches (default: 1).")
+    ap.add_argument("--count", action="store_true", help="Print only the size of the neighbourhood.")
+    args = ap.parse_args()
+
+    if args.count:
+        print(neighborhood_size(len(args.pattern), args.d))
+    else:
+        print(" ".join(sorted(neighbors(args.pattern.upper(), args.d))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+# exercises/kmer_sketch.py
+# Run:
+#   python exercises/kmer_sketch.py --file data/raw/Genomes/e_coli.txt
+#   python exercises/kmer_sketch.py --file genome.fasta --kmin 4 --kmax 12 --error 0.005 --query 9:ATGATCAAG
+
+"""
+Fixed-memory k-mer sketches: HyperLogLog (distinct k-mers) and count-min (abundance).
+
+estimate_k() builds a Python set of string k-mers for every k from 4 to 12,
+i.e. nine passes over the genome and sets that grow with it. sketch_kmers()
+instead reads the genome once, in chunks, and feeds the 2-bit codes of every
+k (see packed_sequence.py) into one sketch per k:
+
+- HyperLogLog: 2^p one-byte registers; each code is hashed (splitmix64), the
+  top p bits pick a register, which keeps the maximum rank (position of the
+  first 1-bit) of the remaining bits. The relative standard error of the
+  distinct count is about 1.04 / sqrt(2^p), so error=0.005 gives p = 16
+  (64 KB per k).
+- Count-min: depth x width counters with one hash per row; a count is never
+  under-estimated and exceeds the true count by more than epsilon * total
+  with probability at most delta (width = e / epsilon, depth = ln(1 / delta);
+  about 1 MB per k with the defaults). It is only built for the k values
+  whose abundances are queried.
+
+Distinct estimates are capped by the exact number of windows and by 4^k, so
+the ranking of k values matches the exact one except where two k differ by
+less than the sketch error. Memory depends only on the error settings, not
+on the genome length. Windows containing non-ACGT bases are skipped, and
+each window is added exactly once even when it spans two chunks.
+"""
+
+import argparse
+import math
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from fasta_index import FastaIndex
+from packed_sequence import PackedSequence, encode_kmer
+
+DEFAULT_ERROR = 0.005
+DEFAULT_CM_EPSILON = 1e-4
+DEFAULT_CM_DELTA = 0.01
+SKETCH_CHUNK_SIZE = 1 << 16  # bases per chunk; bounds the per-k code arrays to about 0.5 MB
+
+_U64 = np.uint64
+
+
+def splitmix64(x: np.ndarray, seed: int = 0) -> np.ndarray:
+    """splitmix64 finalizer: a fast, well-mixed 64-bit hash of each uint64 value."""
+    with np.errstate(over="ignore"):
+        z = np.asarray(x, dtype=_U64) + _U64((0x9E3779B97F4A7C15 * (seed + 1)) & 0xFFFFFFFFFFFFFFFF)
+        z = (z ^ (z >> _U64(30))) * _U64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> _U64(27))) * _U64(0x94D049BB133111EB)
+        return z ^ (z >> _U64(31))
+
+
+class HyperLogLog:
+    """Distinct-count estimator over uint64 codes with 2^p registers."""
+
+    def __init__(self, p: int = 14):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18.")
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    @classmethod
+    def for_error(cls, error: float) -> "HyperLogLog":
+        """Smallest sketch whose relative standard error is at most 'error'."""
+        return cls(min(18, max(4, math.ceil(math.log2((1.04 / error) ** 2)))))
+
+    @property
+    def standard_error(self) -> float:
+        return 1.04 / math.sqrt(self.m)
+
+    def add_codes(self, codes: np.ndarray) -> None:
+        h = splitmix64(codes)
+        index = (h >> _U64(64 - self.p)).astype(np.int64)
+        # Rank = leading zeros + 1 of the next 32 bits (exact in float64; 32 bits are plenty
+        # for the register ranks of any genome-sized input)
+        rest = ((h << _U64(self.p)) >> _U64(32)).astype(np.float64)
+        rank = (33 - np.frexp(rest)[1]).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Union with a sketch of the same size."""
+        if other.p != self.p:
+            raise ValueError("Only sketches with the same p can be merged.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m * self.m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * self.m and zeros:
+            # Small-range correction: linear counting on the empty registers
+            return int(round(self.m * math.log(self.m / zeros)))
+        return int(round(raw))
+
+
+class CountMinSketch:
+    """Approximate counts of uint64 codes: never under-estimated, over by at most epsilon * total w.p. 1 - delta."""
+
+    def __init__(self, width: int, depth: int):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    @classmethod
+    def for_error(cls, epsilon: float = DEFAULT_CM_EPSILON, delta: float = DEFAULT_CM_DELTA) -> "CountMinSketch":
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+    def _columns(self, codes: np.ndarray, row: int) -> np.ndarray:
+        return (splitmix64(codes, seed=row + 1) % _U64(self.width)).astype(np.int64)
+
+    def add_codes(self, codes: np.ndarray) -> None:
+        for row in range(self.depth):
+            self.table[row] += np.bincount(self._columns(codes, row), minlength=self.width)
+        self.total += len(codes)
+
+    def query_codes(self, codes: np.ndarray) -> np.ndarray:
+        codes = np.asarray(codes, dtype=_U64)
+        estimates = [self.table[row][self._columns(codes, row)] for row in range(self.depth)]
+        return np.min(estimates, axis=0) if estimates else np.zeros(len(codes), dtype=np.int64)
+
+    def query(self, kmer: str) -> int:
+        return int(self.query_codes(np.array([encode_kmer(kmer)], dtype=_U64))[0])
+
+
+class KmerSketch:
+    """HyperLogLog (and optionally count-min) sketch of the k-mers of one k."""
+
+    def __init__(self, k: int, error: float = DEFAULT_ERROR, abundance: bool = False,
+                 cm_epsilon: float = DEFAULT_CM_EPSILON, cm_delta: float = DEFAULT_CM_DELTA):
+        self.k = k
+        self.total = 0  # number of windows added
+        self.hll = HyperLogLog.for_error(error)
+        self.cms = CountMinSketch.for_error(cm_epsilon, cm_delta) if abundance else None
+
+    def add_codes(self, codes: np.ndarray) -> None:
+        self.total += len(codes)
+        self.hll.add_codes(codes)
+        if self.cms is not None:
+            self.cms.add_codes(codes)
+
+    def distinct(self) -> int:
+        """Estimated distinct k-mers, capped by the (exact) number of windows and by 4^k."""
+        return min(self.hll.estimate(), self.total, 4 ** self.k)
+
+    def count(self, kmer: str) -> int:
+        if self.cms is None:
+            raise ValueError("This sketch was built without abundance=True.")
+        return self.cms.query(kmer)
+
+
+def sketch_kmers(chunks: Iterable[str], ks: Iterable[int] = range(4, 13), error: float = DEFAULT_ERROR,
+                 abundance: Iterable[int] = (), cm_epsilon: float = DEFAULT_CM_EPSILON,
+                 cm_delta: float = DEFAULT_CM_DELTA) -> Dict[int, KmerSketch]:
+    """
+    One pass over a sequence given as chunks (or a single string): a KmerSketch for every k,
+    with count-min abundances for the k values listed in 'abundance'.
+    Each chunk is prefixed with the last max(k) - 1 bases so k-mers spanning a boundary are counted once.
+    """
+    ks = sorted(set(ks))
+    abundance = set(abundance)
+    sketches = {k: KmerSketch(k, error, k in abundance, cm_epsilon, cm_delta) for k in ks}
+    if not ks:
+        return sketches
+    if isinstance(chunks, str):
+        # Sketch a whole genome chunk by chunk too, so memory stays independent of its length
+        # (the max(k) - 1 overlap is carried by 'tail' below)
+        text = chunks
+        chunks = (text[start:start + SKETCH_CHUNK_SIZE] for start in range(0, len(text), SKETCH_CHUNK_SIZE))
+
+    overlap = ks[-1] - 1
+    tail = np.zeros(0, dtype=np.uint8)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        seq = PackedSequence(np.concatenate((tail, PackedSequence.from_string(chunk).codes)))
+        for k in ks:
+            # Windows starting before this point were complete in the previous chunk
+            first_new = max(0, len(tail) - (k - 1))
+            valid = seq.valid_kmers(k)[first_new:]
+            sketches[k].add_codes(seq.kmer_codes(k)[first_new:][valid])
+        tail = seq.codes[max(0, len(seq) - overlap):]
+    return sketches
+
+
+def approximate_diversity(genome, ks: Iterable[int] = range(4, 13),
+                          error: float = DEFAULT_ERROR) -> Dict[int, int]:
+    """Estimated number of distinct k-mers for each k (the 'diversity' of estimate_k), in one pass."""
+    return {k: sketch.distinct() for k, sketch in sketch_kmers(genome, ks, error).items()}
+
+
+def read_chunks(file_path: str, chunk_size: int = SKETCH_CHUNK_SIZE) -> Iterator[str]:
+    """Stream the first record of a FASTA/plain file in chunks."""
+    with FastaIndex(file_path) as fasta:
+        if fasta.records:
+            yield from fasta.iter_chunks(fasta.names[0], chunk_size)
+
+
+def _parse_query(text: str) -> Tuple[int, str]:
+    k, _, kmer = text.partition(":")
+    return int(k), kmer
+
+
+def main():
+    ap = argparse.ArgumentParser(description="One-pass k-mer sketches: distinct counts (HyperLogLog) and abundance (count-min).")
+    ap.add_argument("--file", "-f", required=True, help="Path to a FASTA or plain sequence file.")
+    ap.add_argument("--kmin", type=int, default=4, help="Smallest k (default: 4).")
+    ap.add_argument("--kmax", type=int, default=12, help="Largest k (default: 12).")
+    ap.add_argument("--error", type=float, default=DEFAULT_ERROR,
+                    help=f"Relative standard error of the distinct counts (default: {DEFAULT_ERROR}).")
+    ap.add_argument("--query", nargs="*", default=[],
+                    help="k:KMER abundance queries (enables the count-min sketches), e.g. 9:ATGATCAAG.")
+    args = ap.parse_args()
+
+    queries = [_parse_query(q) for q in args.query]
+    sketches = sketch_kmers(read_chunks(args.file), range(args.kmin, args.kmax + 1), args.error,
+                            abundance={k for k, _ in queries})
+    for k, sketch in sketches.items():
+        print(f"k={k}\t~{sketch.distinct()} distinct (+/- {100 * sketch.hll.standard_error:.2f}%)")
+    for k, kmer in queries:
+        if k in sketches:
+            print(f"{kmer}\t<= {sketches[k].count(kmer)}")
+
+
+if __name__ == "__main__":
+    main()
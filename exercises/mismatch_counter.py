@@ -0,0 +1,269 @@
+# exercises/mismatch_counter.py
+# Run:
+#   python exercises/mismatch_counter.py --file data/raw/Genomes/e_coli.txt --k 9 --d 1
+#   python exercises/mismatch_counter.py --file data/raw/Genomes/e_coli.txt --k 20 --d 1 --max-memory 512
+
+"""
+Frequent words with mismatches (optionally with reverse complements) from k-mer counts.
+
+frequent_words_with_mismatches() expands every window into its whole
+d-neighbourhood, so a k-mer that occurs c times is expanded c times. Here:
+
+1. the exact k-mers are counted once (np.bincount of the packed k-mer codes),
+2. the count of every distinct k-mer x is spread to its neighbours x XOR m,
+   for every substitution mask m with at most d changes (kmer_neighbors.py),
+   with np.add.at on a 4^k array,
+3. the k-mers with the largest count are taken from the array.
+
+Each distinct k-mer's neighbourhood is enumerated once, so the work depends
+on the number of distinct k-mers, not on the length of the text. The array
+has 4^k entries, so this path is limited to k <= DENSE_MAX_K.
+
+For larger k (up to 32) the counts are built by sort and reduce instead:
+
+1. the distinct k-mers and their exact counts come from np.unique,
+2. (k-mer, mask) pairs are expanded in chunks bounded by 'max_memory';
+   each chunk of neighbour codes is sorted and reduced by key
+   (np.add.reduceat of the exact counts) into a sorted run,
+3. if there is more than one run, the runs are written to disk and merged
+   (at most MAX_MERGE_FAN_IN at a time): every merge step loads the next
+   slice of each memory-mapped run up to a common key, so only about
+   'max_memory' bytes are held at a time.
+
+Only the running maximum and its k-mers are kept while the merged counts
+stream past, so k up to 31 works on whole bacterial chromosomes.
+
+With reverse_complements=True the count of x also includes the windows
+within d mismatches of its reverse complement,
+Count_d(text, x) + Count_d(text, reverse_complement(x)). The dense path
+builds the single-strand array once and adds it to itself permuted by
+revcomp_permutation(k) (the reverse-complement code of every code, from one
+vectorized call), so both strands cost about the same as one. The sorted
+path uses Count_d(text, rc(x)) = Count_d(rc(text), x): the exact k-mers of
+both strands are pooled before the neighbourhoods are expanded.
+
+Windows containing a non-ACGT base are skipped.
+"""
+
+import argparse
+import os
+import tempfile
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from kmer_neighbors import decode_codes, substitution_masks
+from packed_sequence import MAX_K, PackedSequence, as_packed_sequence, reverse_complement_codes
+
+DENSE_MAX_K = 12                 # 4^12 counters = 64 MB (int32)
+SPREAD_BLOCK = 1 << 22           # (k-mer, mask) pairs handled per np.add.at call
+DEFAULT_MAX_MEMORY = 1 << 30     # bytes for the sort-and-reduce path
+BYTES_PER_PAIR = 40              # code + count + argsort index + sorted copies
+MAX_MERGE_FAN_IN = 64            # sorted runs merged in one pass
+
+
+def exact_counts(seq: PackedSequence, k: int) -> np.ndarray:
+    """Dense 4^k array of exact k-mer counts (N-containing windows skipped)."""
+    codes = seq.kmer_codes(k)[seq.valid_kmers(k)]
+    return np.bincount(codes.astype(np.int64), minlength=4 ** k)
+
+
+@lru_cache(maxsize=None)
+def revcomp_permutation(k: int) -> np.ndarray:
+    """Reverse-complement code of every k-mer code 0 .. 4^k - 1, as indices (read-only)."""
+    perm = reverse_complement_codes(np.arange(4 ** k, dtype=np.uint64), k).astype(np.int64)
+    perm.flags.writeable = False
+    return perm
+
+
+def dense_mismatch_counts(text, k: int, d: int, reverse_complements: bool = False) -> np.ndarray:
+    """
+    Count_d(text, x) for every k-mer code x: the number of windows of 'text'
+    within d mismatches of x, as a dense 4^k array.
+    With reverse_complements=True, Count_d(text, x) + Count_d(text, reverse_complement(x)).
+    """
+    if not 1 <= k <= DENSE_MAX_K:
+        raise ValueError(f"The dense path needs 1 <= k <= {DENSE_MAX_K}.")
+    exact = exact_counts(as_packed_sequence(text), k)
+    # A window adds at most one to each count (two with both strands)
+    strands = 2 if reverse_complements else 1
+    dtype = np.int32 if strands * exact.sum() < 2 ** 31 else np.int64
+    present = np.flatnonzero(exact)
+    weights = exact[present].astype(dtype)
+    masks = substitution_masks(k, d).astype(np.int64)
+
+    counts = np.zeros(4 ** k, dtype=dtype)
+    # Spread blocks of masks so the (k-mers x masks) index array stays bounded
+    masks_per_block = max(1, SPREAD_BLOCK // max(1, len(present)))
+    for start in range(0, len(masks), masks_per_block):
+        block = masks[start:start + masks_per_block]
+        targets = present[:, None] ^ block[None, :]
+        np.add.at(counts, targets.ravel(), np.repeat(weights, len(block)))
+    if reverse_complements:
+        counts += counts[revcomp_permutation(k)]
+    return counts
+
+
+def most_frequent_codes(counts: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Codes with the largest count (ascending) and that count."""
+    if not len(counts):
+        return np.zeros(0, dtype=np.uint64), 0
+    best = int(counts.max())
+    return np.flatnonzero(counts == best).astype(np.uint64), best
+
+
+def frequent_words_with_mismatches_dense(text, k: int, d: int, reverse_complements: bool = False) -> List[str]:
+    """Most frequent k-mers with up to d mismatches (optionally counting both strands), in lexicographic order."""
+    codes, best = most_frequent_codes(dense_mismatch_counts(text, k, d, reverse_complements))
+    return decode_codes(codes, k) if best > 0 else []
+
+
+def _reduce_by_key(codes: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted distinct codes and the sum of the weights of each."""
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    if not len(codes):
+        return codes, weights[:0]
+    starts = np.flatnonzero(np.concatenate(([True], codes[1:] != codes[:-1])))
+    return codes[starts], np.add.reduceat(weights[order], starts)
+
+
+def _sorted_runs(present: np.ndarray, weights: np.ndarray, masks: np.ndarray,
+                 chunk_pairs: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Sorted, reduced (code, count) runs of the neighbour codes, chunk_pairs (k-mer, mask) pairs at a time."""
+    masks_per_chunk = max(1, min(len(masks), chunk_pairs))
+    kmers_per_chunk = max(1, chunk_pairs // masks_per_chunk)
+    for m_start in range(0, len(masks), masks_per_chunk):
+        block = masks[m_start:m_start + masks_per_chunk]
+        for p_start in range(0, len(present), kmers_per_chunk):
+            kmers = present[p_start:p_start + kmers_per_chunk]
+            codes = (kmers[:, None] ^ block[None, :]).ravel()
+            counts = np.repeat(weights[p_start:p_start + kmers_per_chunk], len(block))
+            yield _reduce_by_key(codes, counts)
+
+
+def _write_run(prefix: str, blocks: Iterable[Tuple[np.ndarray, np.ndarray]]) -> Tuple[str, str, int]:
+    """Append sorted (code, count) blocks to prefix.codes / prefix.counts; returns the paths and the length."""
+    length = 0
+    with open(prefix + ".codes", "wb") as codes_file, open(prefix + ".counts", "wb") as counts_file:
+        for codes, counts in blocks:
+            codes_file.write(codes.astype(np.uint64).tobytes())
+            counts_file.write(counts.astype(np.int64).tobytes())
+            length += len(codes)
+    return prefix + ".codes", prefix + ".counts", length
+
+
+def _merge_runs(runs: List[Tuple[str, str, int]], batch: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Merge sorted runs stored as (codes file, counts file, length) into sorted, reduced blocks.
+    Each step takes up to 'batch' items in total from the runs, but only up to the smallest
+    last key among them, so no key is split between two blocks.
+    """
+    runs = [(np.memmap(c, dtype=np.uint64, mode="r", shape=(n,)), np.memmap(w, dtype=np.int64, mode="r", shape=(n,)))
+            for c, w, n in runs if n]
+    if not runs:
+        return
+    pos = [0] * len(runs)
+    per_run = max(1, batch // len(runs))
+    while True:
+        active = [i for i, (codes, _) in enumerate(runs) if pos[i] < len(codes)]
+        if not active:
+            return
+        upper = min(runs[i][0][min(pos[i] + per_run, len(runs[i][0])) - 1] for i in active)
+        code_parts, count_parts = [], []
+        for i in active:
+            codes, counts = runs[i]
+            end = pos[i] + int(np.searchsorted(codes[pos[i]:pos[i] + per_run], upper, side="right"))
+            code_parts.append(np.asarray(codes[pos[i]:end]))
+            count_parts.append(np.asarray(counts[pos[i]:end]))
+            pos[i] = end
+        yield _reduce_by_key(np.concatenate(code_parts), np.concatenate(count_parts))
+
+
+def iter_mismatch_counts(text, k: int, d: int, max_memory: int = DEFAULT_MAX_MEMORY,
+                         tmp_dir: Optional[str] = None,
+                         reverse_complements: bool = False) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    (codes, counts) blocks of Count_d(text, x) for every k-mer x with a non-zero count,
+    in increasing code order, using about 'max_memory' bytes (any k up to 32).
+    With reverse_complements=True the counts are Count_d(text, x) + Count_d(text, reverse_complement(x)).
+    """
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}.")
+    seq = as_packed_sequence(text)
+    codes = seq.kmer_codes(k)[seq.valid_kmers(k)]
+    if reverse_complements:
+        codes = np.concatenate((codes, reverse_complement_codes(codes, k)))
+    present, weights = np.unique(codes, return_counts=True)
+    weights = weights.astype(np.int64)
+    masks = substitution_masks(k, d)
+    chunk_pairs = max(1, max_memory // BYTES_PER_PAIR)
+
+    if len(present) * len(masks) <= chunk_pairs:
+        yield from _sorted_runs(present, weights, masks, chunk_pairs)
+        return
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work:
+        runs = [_write_run(os.path.join(work, f"run{i}"), [block])
+                for i, block in enumerate(_sorted_runs(present, weights, masks, chunk_pairs))]
+        # Each open run holds two memory maps, so very many runs are merged in several passes
+        merge_pass = 0
+        while len(runs) > MAX_MERGE_FAN_IN:
+            merge_pass += 1
+            runs = [_write_run(os.path.join(work, f"merge{merge_pass}_{i}"),
+                               _merge_runs(runs[start:start + MAX_MERGE_FAN_IN], chunk_pairs))
+                    for i, start in enumerate(range(0, len(runs), MAX_MERGE_FAN_IN))]
+        yield from _merge_runs(runs, chunk_pairs)
+
+
+def frequent_words_with_mismatches_sorted(text, k: int, d: int, max_memory: int = DEFAULT_MAX_MEMORY,
+                                          tmp_dir: Optional[str] = None,
+                                          reverse_complements: bool = False) -> Tuple[List[str], int]:
+    """Most frequent k-mers with up to d mismatches (lexicographic order) and their count, for any k."""
+    best, winners = 0, []
+    for codes, counts in iter_mismatch_counts(text, k, d, max_memory, tmp_dir, reverse_complements):
+        if not len(counts):
+            continue
+        top = int(counts.max())
+        if top > best:
+            best, winners = top, []
+        if top == best:
+            winners.append(codes[counts == top])
+    codes = np.concatenate(winners) if winners else np.zeros(0, dtype=np.uint64)
+    return decode_codes(codes, k), best
+
+
+def frequent_words_with_mismatches_fast(text, k: int, d: int, max_memory: int = DEFAULT_MAX_MEMORY,
+                                        reverse_complements: bool = False) -> List[str]:
+    """Dense path for k <= DENSE_MAX_K, sort-and-reduce path above it."""
+    if k <= DENSE_MAX_K:
+        return frequent_words_with_mismatches_dense(text, k, d, reverse_complements)
+    return frequent_words_with_mismatches_sorted(text, k, d, max_memory, reverse_complements=reverse_complements)[0]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Most frequent k-mers with up to d mismatches.")
+    ap.add_argument("--file", "-f", required=True, help="Path to the genome/text file.")
+    ap.add_argument("--k", type=int, required=True, help=f"k-mer length (at most {MAX_K}).")
+    ap.add_argument("--d", type=int, default=1, help="Maximum number of mismatches (default: 1).")
+    ap.add_argument("--max-memory", type=int, default=DEFAULT_MAX_MEMORY >> 20,
+                    help=f"MB for the sort-and-reduce path, used when k > {DENSE_MAX_K} "
+                         f"(default: {DEFAULT_MAX_MEMORY >> 20}).")
+    ap.add_argument("--tmp-dir", type=str, default=None, help="Directory for sorted runs (default: system temp).")
+    ap.add_argument("--reverse-complements", "--rc", action="store_true",
+                    help="Count each k-mer together with its reverse complement.")
+    args = ap.parse_args()
+
+    seq = PackedSequence.from_file(args.file)
+    if args.k <= DENSE_MAX_K:
+        codes, best = most_frequent_codes(dense_mismatch_counts(seq, args.k, args.d, args.reverse_complements))
+        kmers = decode_codes(codes, args.k)
+    else:
+        kmers, best = frequent_words_with_mismatches_sorted(seq, args.k, args.d, args.max_memory << 20, args.tmp_dir,
+                                                            args.reverse_complements)
+    print(f"count={best}")
+    print(" ".join(kmers))
+
+
+if __name__ == "__main__":
+    main()
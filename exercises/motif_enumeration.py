@@ -20,37 +20,12 @@ A single line with space-separated motifs in lexicographic order (duplicates rem
 import argparse
 from typing import List, Set
 
+from kmer_neighbors import neighbors
+
 def hamming_distance(a: str, b: str) -> int:
     """Return the Hamming distance between equal-length strings a and b."""
     return sum(x != y for x, y in zip(a, b))
 
-def neighbors(pattern: str, d: int) -> Set[str]:
-    """
-    Generate the d-neighborhood of 'pattern': all strings whose Hamming distance
-    from pattern is <= d (over alphabet {A,C,G,T}).
-    """
-    if d == 0:
-        return {pattern}
-    if len(pattern) == 0:
-        return {""}
-
-    alphabet = ["A", "C", "G", "T"]
-    suffix_neighbors = neighbors(pattern[1:], d)
-    neighborhood = set()
-
-    for sn in suffix_neighbors:
-        # Count mismatches in suffix
-        dist = hamming_distance(pattern[1:], sn)
-        if dist < d:
-            # We can change the first character to any base
-            for base in alphabet:
-                neighborhood.add(base + sn)
-        else:
-            # Must keep the first character
-            neighborhood.add(pattern[0] + sn)
-
-    return neighborhood
-
 def appears_with_mismatches(pattern: str, text: str, d: int) -> bool:
     """Check if pattern appears in text with at most d mismatches (overlapping allowed)."""
     k = len(pattern)
@@ -66,13 +41,16 @@ def motif_enumeration(dna: List[str], k: int, d: int) -> Set[str]:
     - For each k-mer, enumerate its d-neighborhood.
     - Keep those neighbors that appear (<= d mismatches) in every string in dna.
     """
+    dna = [s.upper() for s in dna]
     first = dna[0]
     candidates = set()
 
     # 1) Collect all neighbors of every k-mer in the first string
+    #    (d-neighborhoods come from 2-bit codes, see kmer_neighbors.py; k-mers with non-ACGT characters are skipped)
     for i in range(len(first) - k + 1):
         kmer = first[i:i+k]
-        candidates |= neighbors(kmer, d)
+        if set(kmer) <= set("ACGT"):
+            candidates |= neighbors(kmer, d)
 
     # 2) Filter candidates by checking presence (<= d mismatches) in all strings
     motifs = set()
@@ -0,0 +1,199 @@
+# exercises/ori_pipeline.py
+# Run:
+#   python exercises/ori_pipeline.py data/raw/Genomes/e_coli.txt
+#   python exercises/ori_pipeline.py --dir assemblies/ --workers 16 --k 9 --d 1 --window 1000 --out ori_predictions.tsv
+
+"""
+Origin of replication (ori) prediction: skew minimum -> DnaA box candidates.
+
+find_origin_in_genome() reports the span between the first and last exact
+hits of one DnaA box, which on real genomes covers most of the chromosome.
+This pipeline follows the usual ori-finding recipe instead:
+
+1. The skew minimum (skew_engine.py) marks where the leading and lagging
+   half-strands meet; the median minimum position is taken as the centre.
+2. A window of 'window' bases around it (wrapping around the end of the
+   circular chromosome if needed) is searched for the most frequent k-mers
+   with up to d mismatches, counting both strands:
+   count(P) = Count_d(window, P) + Count_d(window, reverse_complement(P)).
+   Every window k-mer x adds one to each code x XOR m, where m runs over
+   the substitution masks of at most d positions, so all candidates are
+   counted at once with np.bincount (or np.unique for large k).
+3. Candidates are scored by that count and by their distance to known DnaA
+   box consensus sequences (either strand); the top ones are reported.
+
+Genomes (first record of each file) are processed in parallel and written
+to one tab-separated table.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from kmer_neighbors import substitution_masks
+from packed_sequence import PackedSequence, decode_kmer, reverse_complement_codes
+from skew_engine import skew_array, skew_extrema
+
+DNAA_CONSENSUS = ("TTATCCACA",)  # E. coli R-box
+DEFAULT_WINDOW = 1000
+DENSE_MAX_K = 10
+GENOME_EXTENSIONS = (".fa", ".fasta", ".fna", ".fas", ".txt")
+_COMPLEMENT = str.maketrans("ACGT", "TGCA")
+
+COLUMNS = ["genome", "length", "skew_min", "window_start", "window_end",
+           "rank", "kmer", "reverse_complement", "count", "consensus_mismatches"]
+
+
+def frequent_words_both_strands(text: str, k: int, d: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Codes of all k-mers P with count(P) = Count_d(text, P) + Count_d(text, rc(P)) > 0 and their counts,
+    sorted by decreasing count (then code).
+    """
+    seq = PackedSequence.from_string(text)
+    codes = seq.kmer_codes(k)[seq.valid_kmers(k)]
+    if not len(codes):
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+    neighbours = (codes[:, None] ^ substitution_masks(k, d)[None, :]).ravel()
+
+    if k <= DENSE_MAX_K:
+        forward = np.bincount(neighbours.astype(np.int64), minlength=4 ** k)
+        all_codes = np.arange(4 ** k, dtype=np.uint64)
+        total = forward + forward[reverse_complement_codes(all_codes, k).astype(np.int64)]
+        candidates = np.flatnonzero(total).astype(np.uint64)
+        counts = total[candidates.astype(np.int64)]
+    else:
+        observed, forward = np.unique(neighbours, return_counts=True)
+        # Candidates are the observed codes and their reverse complements
+        candidates = np.union1d(observed, reverse_complement_codes(observed, k))
+
+        def lookup(query):
+            idx = np.minimum(np.searchsorted(observed, query), len(observed) - 1)
+            return np.where(observed[idx] == query, forward[idx], 0)
+
+        counts = lookup(candidates) + lookup(reverse_complement_codes(candidates, k))
+    order = np.lexsort((candidates, -counts))
+    return candidates[order], counts[order]
+
+
+def hamming(p: str, q: str) -> int:
+    return sum(a != b for a, b in zip(p, q))
+
+
+def reverse_complement(pattern: str) -> str:
+    return pattern[::-1].translate(_COMPLEMENT)
+
+
+def consensus_mismatches(kmer: str, consensus: Sequence[str] = DNAA_CONSENSUS) -> int:
+    """Fewest mismatches between 'kmer' and any consensus box, on either strand (-1 if no box has its length)."""
+    rc = reverse_complement(kmer)
+    scores = [min(hamming(kmer, box), hamming(rc, box)) for box in consensus if len(box) == len(kmer)]
+    return min(scores) if scores else -1
+
+
+def circular_window(genome: str, center: int, size: int) -> Tuple[str, int, int]:
+    """Bases [center - size/2, center + size/2) of a circular genome, with the start and end coordinates."""
+    n = len(genome)
+    if size >= n:
+        return genome, 0, n
+    start = (center - size // 2) % n
+    end = (start + size) % n
+    text = genome[start:start + size] if start < end else genome[start:] + genome[:end]
+    return text, start, end
+
+
+def predict_ori(genome: str, k: int = 9, d: int = 1, window: int = DEFAULT_WINDOW, top: int = 5,
+                consensus: Sequence[str] = DNAA_CONSENSUS) -> Dict:
+    """Skew minimum, the window around it and the top DnaA box candidates of one genome."""
+    skew = skew_array(genome)
+    _, min_positions, _, _ = skew_extrema(skew)
+    center = int(min_positions[len(min_positions) // 2])
+    text, start, end = circular_window(genome, center, window)
+
+    codes, counts = frequent_words_both_strands(text, k, d)
+    candidates, seen = [], set()
+    rc_codes = reverse_complement_codes(codes, k)
+    for code, rc_code, count in zip(codes.tolist(), rc_codes.tolist(), counts.tolist()):
+        pair = min(code, rc_code)
+        if pair in seen:
+            continue
+        seen.add(pair)
+        kmer = decode_kmer(pair, k)
+        candidates.append({
+            "kmer": kmer,
+            "reverse_complement": decode_kmer(max(code, rc_code), k),
+            "count": count,
+            "consensus_mismatches": consensus_mismatches(kmer, consensus),
+        })
+        if len(candidates) >= 50 * top:
+            break  # enough to rank; the list is already sorted by count
+    # Rank by count, then by closeness to a known DnaA box (boxes of another length rank last)
+    candidates.sort(key=lambda c: (-c["count"], c["consensus_mismatches"] if c["consensus_mismatches"] >= 0 else k + 1,
+                                   c["kmer"]))
+    return {"length": len(genome), "skew_min": center, "window_start": start, "window_end": end,
+            "candidates": candidates[:top]}
+
+
+def _genome_rows(job: Tuple[str, int, int, int, int, Tuple[str, ...]]) -> List[List]:
+    """Worker entry point: all table rows of one genome file."""
+    path, k, d, window, top, consensus = job
+    from fasta_index import read_genome
+    genome = read_genome(path)
+    name = os.path.basename(path)
+    if not genome:
+        return [[name, 0, "", "", "", "", "", "", "", ""]]
+    result = predict_ori(genome, k, d, window, top, consensus)
+    return [[name, result["length"], result["skew_min"], result["window_start"], result["window_end"],
+             rank, c["kmer"], c["reverse_complement"], c["count"], c["consensus_mismatches"]]
+            for rank, c in enumerate(result["candidates"], start=1)]
+
+
+def genome_files(directory: str) -> List[str]:
+    """Sequence files of a directory, sorted by name."""
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.lower().endswith(GENOME_EXTENSIONS))
+
+
+def run_pipeline(paths: List[str], k: int = 9, d: int = 1, window: int = DEFAULT_WINDOW, top: int = 5,
+                 consensus: Sequence[str] = DNAA_CONSENSUS, workers: int = 1) -> List[List]:
+    """Table rows (see COLUMNS) for every genome, in input order."""
+    jobs = [(path, k, d, window, top, tuple(consensus)) for path in paths]
+    if workers <= 1:
+        results = map(_genome_rows, jobs)
+        return [row for rows in results for row in rows]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [row for rows in pool.map(_genome_rows, jobs) for row in rows]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Predict ori regions: skew minimum, then DnaA box candidates.")
+    ap.add_argument("genomes", nargs="*", help="Genome files (first record of each is used).")
+    ap.add_argument("--dir", type=str, default=None, help="Directory of assemblies to process.")
+    ap.add_argument("--k", type=int, default=9, help="DnaA box length (default: 9).")
+    ap.add_argument("--d", type=int, default=1, help="Maximum mismatches (default: 1).")
+    ap.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                    help=f"Bases searched around the skew minimum (default: {DEFAULT_WINDOW}).")
+    ap.add_argument("--top", type=int, default=5, help="Candidates reported per genome (default: 5).")
+    ap.add_argument("--consensus", nargs="+", default=list(DNAA_CONSENSUS),
+                    help="Known DnaA box consensus sequences (default: TTATCCACA).")
+    ap.add_argument("--workers", type=int, default=1, help="Genomes processed in parallel (default: 1).")
+    ap.add_argument("--out", "-o", type=str, default=None, help="Output TSV (default: stdout).")
+    args = ap.parse_args()
+
+    paths = list(args.genomes) + (genome_files(args.dir) if args.dir else [])
+    if not paths:
+        ap.error("no genome files given")
+    rows = run_pipeline(paths, args.k, args.d, args.window, args.top, args.consensus, args.workers)
+    lines = ["\t".join(COLUMNS)] + ["\t".join(map(str, row)) for row in rows]
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        print(f"{len(paths)} genomes, {len(rows)} rows written to {args.out}")
+    else:
+        print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
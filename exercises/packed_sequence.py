@@ -0,0 +1,233 @@
+# exercises/packed_sequence.py
+# Run:
+#   python exercises/packed_sequence.py --file data/raw/Genomes/e_coli.txt --k 9
+
+"""
+PackedSequence: DNA held as a NumPy array of 2-bit base codes.
+
+The k-mer scripts keep the genome as a Python str and slice text[i:i+k] at
+every position, which allocates one new string per k-mer. A PackedSequence
+stores one uint8 code per base (A=0, C=1, G=2, T=3, anything else = N_CODE)
+and produces the integer codes of all k-mers at once, so k-mer algorithms can
+work on integer arrays with no per-k-mer allocation.
+
+Conventions shared by the k-mer engines in this folder:
+- A k-mer code is its bases read as base-4 digits, first base most significant,
+  so sorting codes sorts k-mers lexicographically. k is limited to 32 (uint64).
+- The complement of code c is 3 - c; the canonical code of a k-mer is the
+  smaller of its code and the code of its reverse complement.
+- Windows containing a non-ACGT base have no meaningful code; valid_kmers(k)
+  masks them out.
+- pack()/from_packed() convert to and from a 4-bases-per-byte layout for storage.
+"""
+
+import argparse
+from typing import Optional, Tuple
+
+import numpy as np
+
+BASES = "ACGT"
+N_CODE = 4
+MAX_K = 32
+
+_ENCODE = np.full(256, N_CODE, dtype=np.uint8)
+for _code, _base in enumerate(BASES):
+    _ENCODE[ord(_base)] = _code
+    _ENCODE[ord(_base.lower())] = _code
+_DECODE = np.frombuffer(b"ACGTN", dtype=np.uint8)
+
+
+def encode_kmer(kmer: str) -> int:
+    """Integer code of a k-mer over A/C/G/T."""
+    code = 0
+    for base in kmer:
+        code = (code << 2) | BASES.index(base)
+    return code
+
+
+def decode_kmer(code: int, k: int) -> str:
+    """k-mer string of an integer code."""
+    bases = []
+    for _ in range(k):
+        bases.append(BASES[code & 3])
+        code >>= 2
+    return "".join(reversed(bases))
+
+
+def reverse_complement_code(code: int, k: int) -> int:
+    """Code of the reverse complement of the k-mer with the given code."""
+    rc = 0
+    for _ in range(k):
+        rc = (rc << 2) | (3 - (code & 3))
+        code >>= 2
+    return rc
+
+
+def reverse_complement_codes(codes: np.ndarray, k: int) -> np.ndarray:
+    """
+    Reverse-complement codes of an array of k-mer codes, with a fixed number of
+    bit operations per code: complement every 2-bit digit (c -> 3 - c is a bitwise NOT),
+    reverse the order of the 32 digits of the 64-bit word, then drop the unused low digits.
+    """
+    x = ~np.asarray(codes, dtype=np.uint64)
+    for shift, mask in ((2, 0x3333333333333333), (4, 0x0F0F0F0F0F0F0F0F),
+                        (8, 0x00FF00FF00FF00FF), (16, 0x0000FFFF0000FFFF)):
+        s, m = np.uint64(shift), np.uint64(mask)
+        x = ((x >> s) & m) | ((x & m) << s)
+    x = (x >> np.uint64(32)) | (x << np.uint64(32))
+    return x >> np.uint64(64 - 2 * k)
+
+
+def window_codes(symbols: np.ndarray, k: int) -> np.ndarray:
+    """
+    Codes of all length-k windows of an array of base codes (0..3), built by
+    doubling: codes of 2h-mers are combined from codes of h-mers, so only
+    O(log k) passes over the array are needed.
+    """
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}.")
+    n_windows = len(symbols) - k + 1
+    if n_windows <= 0:
+        return np.zeros(0, dtype=np.uint64)
+
+    block = symbols.astype(np.uint64)  # codes of windows of length block_len
+    block_len = 1
+    result = None                      # codes of windows of length result_len
+    result_len = 0
+    remaining = k
+    while True:
+        if remaining & 1:
+            if result is None:
+                result = block
+            else:
+                length = len(symbols) - (result_len + block_len) + 1
+                result = (result[:length] << np.uint64(2 * block_len)) | block[result_len:result_len + length]
+            result_len += block_len
+        remaining >>= 1
+        if not remaining:
+            break
+        block = (block[:-block_len] << np.uint64(2 * block_len)) | block[block_len:]
+        block_len *= 2
+    return np.ascontiguousarray(result[:n_windows])
+
+
+class PackedSequence:
+    """DNA sequence as an array of base codes, with vectorized k-mer encoding."""
+
+    __slots__ = ("codes",)
+
+    def __init__(self, codes: np.ndarray):
+        self.codes = codes
+
+    @classmethod
+    def from_string(cls, text: str) -> "PackedSequence":
+        """Encode a DNA string (case-insensitive; non-ACGT characters become N_CODE)."""
+        return cls.from_ascii(np.frombuffer(text.encode("ascii"), dtype=np.uint8))
+
+    @classmethod
+    def from_ascii(cls, raw: np.ndarray) -> "PackedSequence":
+        """Encode a uint8 array of ASCII characters (e.g. bytes read from a FASTA file)."""
+        return cls(_ENCODE[raw])
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "PackedSequence":
+        """Encode a plain genome file, dropping line breaks and whitespace."""
+        with open(file_path, "r") as f:
+            return cls.from_string("".join(f.read().split()))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, item):
+        """A base as a string for an integer index; a view (no copy) for a slice."""
+        if isinstance(item, slice):
+            return PackedSequence(self.codes[item])
+        return chr(_DECODE[self.codes[item]])
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    def __repr__(self) -> str:
+        preview = self[:20].to_string() + ("..." if len(self) > 20 else "")
+        return f"PackedSequence('{preview}', length={len(self)})"
+
+    def to_string(self) -> str:
+        """Decode back to a DNA string (non-ACGT bases come back as 'N')."""
+        return _DECODE[self.codes].tobytes().decode("ascii")
+
+    def reverse_complement(self) -> "PackedSequence":
+        """Reverse complement (N stays N)."""
+        rc = np.where(self.codes == N_CODE, N_CODE, 3 - self.codes).astype(np.uint8)
+        return PackedSequence(rc[::-1])
+
+    def valid_kmers(self, k: int) -> np.ndarray:
+        """Boolean mask of the windows of length k made only of A/C/G/T."""
+        if not 1 <= k <= MAX_K:
+            raise ValueError(f"k must be between 1 and {MAX_K}.")
+        n_windows = len(self) - k + 1
+        if n_windows <= 0:
+            return np.zeros(0, dtype=bool)
+        ambiguous = np.concatenate(([0], np.cumsum(self.codes == N_CODE)))
+        return ambiguous[k:] == ambiguous[:-k]
+
+    def kmer_codes(self, k: int) -> np.ndarray:
+        """uint64 codes of every window of length k (check valid_kmers for N-containing windows)."""
+        symbols = np.where(self.codes == N_CODE, 0, self.codes)
+        return window_codes(symbols, k)
+
+    def revcomp_kmer_codes(self, k: int) -> np.ndarray:
+        """uint64 codes of the reverse complement of every window of length k."""
+        complement = np.where(self.codes == N_CODE, 0, 3 - self.codes)
+        return window_codes(complement[::-1], k)[::-1]
+
+    def canonical_kmer_codes(self, k: int) -> np.ndarray:
+        """
+        Strand-independent code of every window: min(forward code, reverse-complement code).
+        A k-mer and its reverse complement get the same canonical code.
+        """
+        forward = self.kmer_codes(k)
+        return np.minimum(forward, reverse_complement_codes(forward, k))
+
+    def pack(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Four bases per byte, plus the positions of non-ACGT bases (stored as A in the packed array).
+        """
+        ambiguous = np.flatnonzero(self.codes == N_CODE)
+        symbols = np.where(self.codes == N_CODE, 0, self.codes).astype(np.uint8)
+        padded = np.zeros(-(-len(symbols) // 4) * 4, dtype=np.uint8)
+        padded[:len(symbols)] = symbols
+        quads = padded.reshape(-1, 4)
+        packed = (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+        return packed.astype(np.uint8), ambiguous
+
+    @classmethod
+    def from_packed(cls, packed: np.ndarray, length: int,
+                    ambiguous: Optional[np.ndarray] = None) -> "PackedSequence":
+        """Inverse of pack()."""
+        shifts = np.array([6, 4, 2, 0], dtype=np.uint8)
+        codes = ((packed[:, None] >> shifts) & 3).astype(np.uint8).ravel()[:length]
+        if ambiguous is not None and len(ambiguous):
+            codes[ambiguous] = N_CODE
+        return cls(codes)
+
+
+def as_packed_sequence(seq) -> PackedSequence:
+    """Accept either a DNA string or a PackedSequence."""
+    return seq if isinstance(seq, PackedSequence) else PackedSequence.from_string(seq)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Encode a genome as a PackedSequence and summarize its k-mers.")
+    ap.add_argument("--file", "-f", required=True, help="Path to the genome file.")
+    ap.add_argument("--k", type=int, default=9, help="k-mer length (default: 9).")
+    args = ap.parse_args()
+
+    seq = PackedSequence.from_file(args.file)
+    codes = seq.kmer_codes(args.k)[seq.valid_kmers(args.k)]
+    packed, ambiguous = seq.pack()
+    print(f"Length: {len(seq)} bases ({packed.nbytes} bytes packed, {len(ambiguous)} non-ACGT)")
+    print(f"Valid {args.k}-mers: {len(codes)}, distinct: {len(np.unique(codes))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+# exercises/parallel_scan.py
+# Run:
+#   python exercises/parallel_scan.py --file genome.fasta --workers 32 approx --pattern TTATCCACA --d 1
+#   python exercises/parallel_scan.py --file genome.fasta --workers 32 count --pattern TTATCCACA --d 1
+#   python exercises/parallel_scan.py --file genome.fasta --workers 32 ori
+#   python exercises/parallel_scan.py --file genome.fasta --workers 32 clumps --k 9 --L 500 --t 3
+#   python exercises/parallel_scan.py --workers 32 sweep --params 9,500,3 --params 10,1000,4 assemblies/*.fasta > clumps.tsv
+
+"""
+Multiprocess sharded genome scans.
+
+approximate_pattern_count, ApproximatePatternMatching and find_origin_in_genome
+are single-threaded. This layer runs them over shards of the genome in a
+process pool:
+
+- The genome is copied once into a multiprocessing shared-memory block; each
+  worker attaches to it by name and decodes only its own shard, so the genome
+  is never pickled.
+- Window start positions [0, n - window + 1) are split into contiguous ranges,
+  one per shard. A shard's text runs from its first start to its last start
+  plus (window - 1) bases, so every window lies entirely in exactly one shard:
+  boundary matches are found once and never duplicated.
+- Shard results are shifted to global coordinates and merged in shard order,
+  so the output is deterministic and identical to the single-process scan.
+
+Clump finding uses the same shards with window = L: every length-L window
+lies in exactly one shard (shards overlap by L - 1 bases), so the union of the
+per-shard pattern sets is the whole-genome result. clump_sweep() runs many
+(k, L, t) settings over many genomes from one process pool, keeping a bounded
+number of genomes in shared memory and interleaving the shards of different
+genomes, so both a single large genome and hundreds of small assemblies keep
+all workers busy.
+
+The scripts expose this as --workers N.
+"""
+
+import argparse
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Union
+
+from approximate_pattern_count import approximate_pattern_count
+from approximate_pattern_matching import ApproximatePatternMatching
+from clump_engine import find_clumps
+from find_ori import find_dnaA_box_positions, find_origin_in_genome
+
+SHARDS_PER_WORKER = 4  # more shards than workers keeps the pool busy until the end
+
+
+def _approximate_positions(text: str, pattern: str, d: int, backend: str) -> List[int]:
+    return [int(pos) for pos in ApproximatePatternMatching(pattern, text, d, backend).split()]
+
+
+# Scans that can run on a shard: name -> function(text, *params)
+SHARD_TASKS: Dict[str, Callable] = {
+    "approximate_positions": _approximate_positions,
+    "approximate_count": approximate_pattern_count,
+    "dnaA_box_positions": find_dnaA_box_positions,
+    "clumps": find_clumps,
+}
+
+
+def shard_bounds(n: int, window: int, n_shards: int) -> List[Tuple[int, int]]:
+    """
+    Split the window starts [0, n - window + 1) into n_shards contiguous ranges and
+    return the text span [start, end) each shard must read (overlap = window - 1).
+    """
+    n_windows = n - window + 1
+    if n_windows <= 0:
+        return []
+    n_shards = max(1, min(n_shards, n_windows))
+    cuts = [n_windows * i // n_shards for i in range(n_shards + 1)]
+    return [(cuts[i], cuts[i + 1] + window - 1) for i in range(n_shards)]
+
+
+class SharedGenome:
+    """A genome copied once into shared memory, readable by name from worker processes."""
+
+    def __init__(self, genome: str):
+        data = genome.encode("ascii")
+        self.size = len(data)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, self.size))
+        self._shm.buf[:self.size] = data
+        self.name = self._shm.name
+
+    def __enter__(self) -> "SharedGenome":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _run_shard(job: Tuple[str, int, int, str, tuple]):
+    """Worker entry point: decode one shard from shared memory and scan it."""
+    shm_name, start, end, task, params = job
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        text = bytes(shm.buf[start:end]).decode("ascii")
+    finally:
+        shm.close()
+    return SHARD_TASKS[task](text, *params)
+
+
+def sharded_scan(genome: str, window: int, task: str, params: tuple,
+                 workers: int) -> List[Tuple[int, Union[int, List[int]]]]:
+    """Run SHARD_TASKS[task] over the shards of 'genome'; returns (shard start, result) in shard order."""
+    bounds = shard_bounds(len(genome), window, max(1, workers) * SHARDS_PER_WORKER)
+    if workers <= 1:
+        return [(start, SHARD_TASKS[task](genome[start:end], *params)) for start, end in bounds]
+
+    with SharedGenome(genome) as shared, ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [(shared.name, start, end, task, params) for start, end in bounds]
+        results = list(pool.map(_run_shard, jobs))
+    return [(start, result) for (start, _), result in zip(bounds, results)]
+
+
+def parallel_approximate_positions(pattern: str, text: str, d: int, workers: int,
+                                   backend: str = "python") -> List[int]:
+    """Same positions as ApproximatePatternMatching, computed by 'workers' processes."""
+    shards = sharded_scan(text, len(pattern), "approximate_positions", (pattern, d, backend), workers)
+    return [start + pos for start, positions in shards for pos in positions]
+
+
+def parallel_approximate_count(text: str, pattern: str, d: int, workers: int,
+                               backend: str = "python") -> int:
+    """Same count as approximate_pattern_count, computed by 'workers' processes."""
+    shards = sharded_scan(text, len(pattern), "approximate_count", (pattern, d, backend), workers)
+    return sum(count for _, count in shards)
+
+
+def stitch_nonoverlapping(genome_sequence: str, m: int, dnaA_box_pattern: str,
+                          shards: List[Tuple[int, List[int]]], bounds: List[Tuple[int, int]]) -> List[int]:
+    """
+    Merge per-shard regex hits into the hits of one serial finditer pass.
+    finditer does not report overlapping matches, and each shard restarts it at its own
+    start. When a shard's first hits fall inside the previous match, that shard is
+    rescanned serially from the end of the previous match, as the serial pass would.
+    """
+    positions: List[int] = []
+    for (start, hits), (_, end) in zip(shards, bounds):
+        resume = positions[-1] + m if positions else 0
+        if hits and start + hits[0] < resume:
+            positions.extend(resume + pos for pos in find_dnaA_box_positions(genome_sequence[resume:end],
+                                                                             dnaA_box_pattern))
+        else:
+            positions.extend(start + pos for pos in hits)
+    return positions
+
+
+def parallel_find_origin(genome_sequence: str, dnaA_box_pattern: str = "TTATCCACA",
+                         workers: int = 1):
+    """Same result as find_origin_in_genome, with the DnaA box scan split across processes."""
+    if workers <= 1:
+        return find_origin_in_genome(genome_sequence, dnaA_box_pattern)
+    m = len(dnaA_box_pattern)
+    shards = sharded_scan(genome_sequence, m, "dnaA_box_positions", (dnaA_box_pattern,), workers)
+    bounds = shard_bounds(len(genome_sequence), m, max(1, workers) * SHARDS_PER_WORKER)
+    positions = stitch_nonoverlapping(genome_sequence, m, dnaA_box_pattern, shards, bounds)
+    if not positions:
+        return "No DnaA box found."
+    return min(positions), max(positions)
+
+
+def parallel_find_clumps(genome: str, k: int, L: int, t: int, workers: int,
+                         method: str = "sliding") -> Set[str]:
+    """Same pattern set as clump_finding2.find_clumps, with the shards scanned by 'workers' processes."""
+    shards = sharded_scan(genome, L, "clumps", (k, L, t, method), workers)
+    return set().union(*(patterns for _, patterns in shards))
+
+
+def clump_sweep(genome_paths: Iterable[str], params: Iterable[Tuple[int, int, int]], workers: int = 1,
+                method: str = "sliding") -> Dict[Tuple[str, int, int, int], Set[str]]:
+    """
+    Clumps of every (k, L, t) in 'params' for every genome file (first record), as
+    {(path, k, L, t): patterns}. One pool serves all genomes: at most 'workers' genomes
+    are held in shared memory at a time, and each is split into enough shards to keep
+    the pool busy when only a few genomes are left.
+    """
+    paths = list(dict.fromkeys(genome_paths))
+    params = list(params)
+    from fasta_index import read_genome
+    if workers <= 1:
+        results = {}
+        for path in paths:
+            genome = read_genome(path)
+            for k, L, t in params:
+                results[(path, k, L, t)] = find_clumps(genome, k, L, t, method)
+        return results
+
+    max_open = max(1, min(workers, len(paths)))
+    n_shards = -(-workers * SHARDS_PER_WORKER // max_open)
+    results = {(path, k, L, t): set() for path in paths for k, L, t in params}
+    pending = deque(paths)
+    open_genomes: Dict[str, list] = {}  # path -> [SharedGenome, unfinished jobs]
+    futures = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            while pending or futures:
+                while pending and len(open_genomes) < max_open:
+                    path = pending.popleft()
+                    genome = read_genome(path)
+                    shared = SharedGenome(genome)
+                    jobs = 0
+                    for k, L, t in params:
+                        for start, end in shard_bounds(len(genome), L, n_shards):
+                            job = (shared.name, start, end, "clumps", (k, L, t, method))
+                            futures[pool.submit(_run_shard, job)] = (path, k, L, t)
+                            jobs += 1
+                    del genome
+                    if jobs:
+                        open_genomes[path] = [shared, jobs]
+                    else:
+                        shared.__exit__(None, None, None)
+                if not futures:
+                    continue
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = futures.pop(future)
+                    results[key] |= future.result()
+                    entry = open_genomes[key[0]]
+                    entry[1] -= 1
+                    if not entry[1]:
+                        entry[0].__exit__(None, None, None)
+                        del open_genomes[key[0]]
+        finally:
+            for future in futures:
+                future.cancel()
+            for shared, _ in open_genomes.values():
+                shared.__exit__(None, None, None)
+    return results
+
+
+def _parse_params(text: str) -> Tuple[int, int, int]:
+    k, L, t = map(int, text.split(","))
+    return k, L, t
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Sharded multiprocess genome scans.")
+    ap.add_argument("--file", "-f", help="Path to a FASTA or plain sequence file.")
+    ap.add_argument("--workers", type=int, default=1, help="Number of worker processes (default: 1).")
+    sub = ap.add_subparsers(dest="mode", required=True)
+
+    for mode, help_text in (("approx", "Approximate match positions."),
+                            ("count", "Approximate match count.")):
+        p = sub.add_parser(mode, help=help_text)
+        p.add_argument("--pattern", "-p", required=True)
+        p.add_argument("--d", type=int, default=0)
+        p.add_argument("--backend", choices=["python", "numpy"], default="python")
+
+    o = sub.add_parser("ori", help="DnaA box span (find_origin_in_genome).")
+    o.add_argument("--box", type=str, default="TTATCCACA", help="DnaA box consensus (default: TTATCCACA).")
+
+    c = sub.add_parser("clumps", help="(L, t)-clump forming k-mers.")
+    c.add_argument("--k", type=int, default=9)
+    c.add_argument("--L", type=int, default=500)
+    c.add_argument("--t", type=int, default=3)
+    c.add_argument("--method", choices=["sliding", "positions"], default="sliding")
+
+    w = sub.add_parser("sweep", help="Clumps for several (k, L, t) over several genomes, as TSV.")
+    w.add_argument("--params", type=_parse_params, action="append", required=True,
+                   help="A k,L,t setting, e.g. 9,500,3; repeatable.")
+    w.add_argument("--method", choices=["sliding", "positions"], default="sliding")
+    w.add_argument("genomes", nargs="+", help="Genome files (first record of each is used).")
+    args = ap.parse_args()
+
+    if args.mode == "sweep":
+        results = clump_sweep(args.genomes, args.params, args.workers, args.method)
+        print("genome\tk\tL\tt\tclumps\tkmers")
+        for (path, k, L, t), patterns in results.items():
+            print(f"{path}\t{k}\t{L}\t{t}\t{len(patterns)}\t{' '.join(sorted(patterns))}")
+        return
+    if not args.file:
+        ap.error(f"--file is required for '{args.mode}'")
+
+    from fasta_index import read_genome
+    genome = read_genome(args.file)
+    if args.mode == "approx":
+        positions = parallel_approximate_positions(args.pattern, genome, args.d, args.workers, args.backend)
+        print(" ".join(map(str, positions)))
+    elif args.mode == "count":
+        print(parallel_approximate_count(genome, args.pattern, args.d, args.workers, args.backend))
+    elif args.mode == "clumps":
+        clumps = parallel_find_clumps(genome, args.k, args.L, args.t, args.workers, args.method)
+        print(f"Number of distinct {args.k}-mers forming ({args.L},{args.t})-clumps: {len(clumps)}")
+        print(" ".join(sorted(clumps)))
+    else:
+        print(f"Estimated origin position: {parallel_find_origin(genome, args.box, args.workers)}")
+
+
+if __name__ == "__main__":
+    main()
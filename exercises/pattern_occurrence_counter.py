@@ -13,10 +13,16 @@ def count_pattern_occurrences(sequence, pattern):
 
     return count
 
-# Example sequence and pattern from the exercise
-sequence = "CGTGACAGTGTATGGGCATCTTT"
-pattern = "TGT"
+# Batch version: counts every pattern of a collection in a single pass (Aho-Corasick, see aho_corasick.py)
+def count_many_pattern_occurrences(sequence, patterns, reverse_complement=False):
+    from aho_corasick import count_patterns
+    return count_patterns(sequence, patterns, reverse_complement)
 
-# Compute the number of pattern occurrences in the sequence
-count = count_pattern_occurrences(sequence, pattern)
-print(count)
+if __name__ == "__main__":
+    # Example sequence and pattern from the exercise
+    sequence = "CGTGACAGTGTATGGGCATCTTT"
+    pattern = "TGT"
+
+    # Compute the number of pattern occurrences in the sequence
+    count = count_pattern_occurrences(sequence, pattern)
+    print(count)
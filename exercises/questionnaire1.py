@@ -1,8 +1,14 @@
 # /bioinformatics-portfolio/exercises/questionnaire1.py
 # Code to solve five DNA sequence–based questions
 
+import numpy as np
+
 # Function 1: Count how many times a pattern appears in a sequence
-def count_pattern_occurrences(sequence, pattern):
+# database: optional KmerDatabase of the sequence (see kmer_database.py), used when its k is len(pattern)
+def count_pattern_occurrences(sequence, pattern, database=None):
+    if database is not None and database.matches(len(pattern)):
+        return database.count(pattern)
+
     count = 0
     pattern_length = len(pattern)
     for i in range(len(sequence) - pattern_length + 1):
@@ -10,8 +16,32 @@ def count_pattern_occurrences(sequence, pattern):
             count += 1
     return count
 
+# Batch version of Function 1: counts every pattern of a collection in a single pass (Aho-Corasick, see aho_corasick.py)
+def count_many_pattern_occurrences(sequence, patterns, reverse_complement=False):
+    from aho_corasick import count_patterns
+    return count_patterns(sequence, patterns, reverse_complement)
+
 # Function 2: Find the most frequent k-mer in a given sequence
-def most_frequent_kmer(sequence, k):
+# backend="numpy" counts the 2-bit window codes with np.unique (packed_sequence.py); ties go to
+# the k-mer seen first, as with the dict, using the first window of each code
+# database: optional KmerDatabase with positions of the sequence; the saved counts and first positions replace counting
+def most_frequent_kmer(sequence, k, backend="python", database=None):
+    if database is not None and database.matches(k, with_positions=True):
+        from packed_sequence import decode_kmer
+        counts, first = np.asarray(database.counts), database.first_positions()
+        best = counts.max()
+        winner = np.argmin(np.where(counts == best, first, len(sequence)))
+        return decode_kmer(int(database.codes[winner]), k), int(best)
+
+    if backend == "numpy":
+        from packed_sequence import PackedSequence, decode_kmer
+        seq = PackedSequence.from_string(sequence)
+        starts = np.flatnonzero(seq.valid_kmers(k))
+        codes, first, counts = np.unique(seq.kmer_codes(k)[starts], return_index=True, return_counts=True)
+        best = counts.max()
+        winner = np.argmin(np.where(counts == best, first, len(starts)))
+        return decode_kmer(int(codes[winner]), k), int(best)
+
     kmer_frequencies = frequency_table(sequence, k)
     most_frequent = max(kmer_frequencies, key=kmer_frequencies.get)
     return most_frequent, kmer_frequencies[most_frequent]
@@ -22,7 +52,10 @@ def reverse_complement(dna_sequence):
     return "".join(complement[base] for base in reversed(dna_sequence))
 
 # Function 4: Find all starting positions of a pattern in a sequence (0-based indexing)
-def pattern_matching_positions(text, pattern):
+# An FM-index built over text (fm_index.FMIndex) answers the query without scanning the text
+def pattern_matching_positions(text, pattern, index=None):
+    if index is not None:
+        return index.locate(pattern)
     positions = []
     for i in range(len(text) - len(pattern) + 1):
         if text[i:i + len(pattern)] == pattern:
@@ -30,38 +63,48 @@ def pattern_matching_positions(text, pattern):
     return positions
 
 # Function 5: Build a frequency table of k-mers in a text window
-def frequency_table(text, k):
+# backend="numpy" gives the same table from KmerCounter for an upper-case A/C/G/T text
+# (dense 4^k table only when the text has at least 4^k windows); database: optional KmerDatabase of the text
+def frequency_table(text, k, backend="python", database=None):
+    if database is not None and database.matches(k):
+        return dict(database.items())
+
+    if backend == "numpy":
+        from kmer_counter import KmerCounter
+        return KmerCounter(text, k, dense=4 ** k <= len(text)).to_dict()
+
     frequency_map = {}
     for i in range(len(text) - k + 1):
         k_mer = text[i:i + k]
         frequency_map[k_mer] = frequency_map.get(k_mer, 0) + 1
     return frequency_map
 
-# Question 1: Count occurrences of "CGCG" in a specific sequence
-sequence1 = "CGCGATACGTTACATACATGATAGACCGCGCGATCATATCGCGATTATC"
-pattern1 = "CGCG"
-count1 = count_pattern_occurrences(sequence1, pattern1)
-print(f"Question 1 – Count of '{pattern1}': {count1}")
-
-# Question 2: Find the most frequent 3-mer in a sequence
-sequence2 = "TAAACGTGAGAGAAACGTGCTGATTACACTTGTTCGTGTGGTAT"
-most_frequent_3mer, freq = most_frequent_kmer(sequence2, 3)
-print(f"Question 2 – Most frequent 3-mer is '{most_frequent_3mer}' with {freq} occurrences.")
-
-# Question 3: Get the reverse complement of a given sequence
-sequence3 = "GCTAGCT"
-reverse_complement3 = reverse_complement(sequence3)
-print(f"Question 3 – Reverse complement of '{sequence3}' is '{reverse_complement3}'.")
-
-# Question 4: Find all starting positions of "CGC" in a sequence
-sequence4 = "ATGACTTCGCTGTTACGCGC"
-pattern4 = "CGC"
-positions4 = pattern_matching_positions(sequence4, pattern4)
-print(f"Question 4 – Positions of '{pattern4}': {' '.join(map(str, positions4))}")
-
-# Question 5: Find all starting positions of "CGC" in a sequence
-# (Note: same pattern as Question 4—replace pattern if intended)
-sequence5 = "ATGACTTCGCTGTTACGCGC"
-pattern5 = "CGC"
-positions5 = pattern_matching_positions(sequence5, pattern5)
-print(f"Question 5 – Positions of '{pattern5}': {' '.join(map(str, positions5))}")
+if __name__ == "__main__":
+    # Question 1: Count occurrences of "CGCG" in a specific sequence
+    sequence1 = "CGCGATACGTTACATACATGATAGACCGCGCGATCATATCGCGATTATC"
+    pattern1 = "CGCG"
+    count1 = count_pattern_occurrences(sequence1, pattern1)
+    print(f"Question 1 – Count of '{pattern1}': {count1}")
+
+    # Question 2: Find the most frequent 3-mer in a sequence
+    sequence2 = "TAAACGTGAGAGAAACGTGCTGATTACACTTGTTCGTGTGGTAT"
+    most_frequent_3mer, freq = most_frequent_kmer(sequence2, 3)
+    print(f"Question 2 – Most frequent 3-mer is '{most_frequent_3mer}' with {freq} occurrences.")
+
+    # Question 3: Get the reverse complement of a given sequence
+    sequence3 = "GCTAGCT"
+    reverse_complement3 = reverse_complement(sequence3)
+    print(f"Question 3 – Reverse complement of '{sequence3}' is '{reverse_complement3}'.")
+
+    # Question 4: Find all starting positions of "CGC" in a sequence
+    sequence4 = "ATGACTTCGCTGTTACGCGC"
+    pattern4 = "CGC"
+    positions4 = pattern_matching_positions(sequence4, pattern4)
+    print(f"Question 4 – Positions of '{pattern4}': {' '.join(map(str, positions4))}")
+
+    # Question 5: Find all starting positions of "CGC" in a sequence
+    # (Note: same pattern as Question 4—replace pattern if intended)
+    sequence5 = "ATGACTTCGCTGTTACGCGC"
+    pattern5 = "CGC"
+    positions5 = pattern_matching_positions(sequence5, pattern5)
+    print(f"Question 5 – Positions of '{pattern5}': {' '.join(map(str, positions5))}")
@@ -0,0 +1,191 @@
+# exercises/seed_index.py
+# Run:
+#   python exercises/seed_index.py build --genome data/raw/Genomes/e_coli.txt --out e_coli.seeds.npz
+#   python exercises/seed_index.py search --index e_coli.seeds.npz --d 3 GTTCGTAAGAACTTTAGCTTGGCAATG
+
+"""
+Pigeonhole seed-and-verify approximate search (Hamming distance <= d).
+
+If a pattern occurs with at most d mismatches, then splitting it into d+1
+non-overlapping seeds guarantees that at least one seed occurs exactly.
+So a search only needs to:
+  1. look every seed up in a prebuilt k-mer position index of the genome,
+  2. turn each seed hit into a candidate window start,
+  3. verify the candidate windows with the Hamming distance.
+
+The index stores the sorted 2-bit codes of all k-mers together with their
+positions, so a seed of any length can be looked up as a code range
+(seeds shorter than k become prefix queries, longer seeds use their first k
+bases). The work per query is proportional to the number of seed hits, not
+the genome length, which pays off for long selective patterns (20-40 nt
+primers) with d up to 4.
+
+Both strands are searched in one call; reverse-strand hits are reported at
+the forward-strand start of the matching window.
+"""
+
+import argparse
+from typing import List, Tuple
+
+import numpy as np
+
+from packed_sequence import BASES, PackedSequence, encode_kmer
+
+DEFAULT_K = 12
+COMPLEMENT = {"A": "T", "C": "G", "G": "C", "T": "A"}
+
+
+def read_genome(file_path: str) -> str:
+    """Read a plain genome file, dropping line breaks and whitespace."""
+    with open(file_path, "r") as f:
+        return "".join(f.read().split())
+
+
+def reverse_complement(pattern: str) -> str:
+    return "".join(COMPLEMENT[base] for base in reversed(pattern))
+
+
+def split_seeds(pattern: str, d: int) -> List[Tuple[int, str]]:
+    """Split 'pattern' into d+1 non-overlapping seeds of near-equal length, as (offset, seed)."""
+    m = len(pattern)
+    pieces = d + 1
+    bounds = [m * i // pieces for i in range(pieces + 1)]
+    return [(bounds[i], pattern[bounds[i]:bounds[i + 1]]) for i in range(pieces)]
+
+
+class SeedIndex:
+    """Sorted k-mer position index of a genome with pigeonhole approximate search."""
+
+    def __init__(self, text: str, codes: np.ndarray, positions: np.ndarray,
+                 unindexed: np.ndarray, k: int):
+        self.text = text
+        # uint8 view of the genome, built once and indexed when verifying seeds
+        self.genome = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        self.k = k
+        self.codes = codes          # sorted 2-bit k-mer codes
+        self.positions = positions  # start position of each code, ascending within equal codes
+        # Starts whose k-mer runs into a non-ACGT base (e.g. N) or off the end of the
+        # text: a seed shorter than k can still match there, so they are always verified.
+        self.unindexed = unindexed
+
+    @classmethod
+    def from_text(cls, text: str, k: int = DEFAULT_K) -> "SeedIndex":
+        """Index every A/C/G/T k-mer of 'text'."""
+        seq = PackedSequence.from_string(text)
+        valid = seq.valid_kmers(k)
+        positions = np.flatnonzero(valid)
+        codes = seq.kmer_codes(k)[positions]
+        order = np.argsort(codes, kind="stable")
+
+        starts_acgt = np.isin(np.frombuffer(text.encode("ascii"), dtype=np.uint8),
+                              np.frombuffer(BASES.encode("ascii"), dtype=np.uint8))
+        indexed = np.zeros(len(text), dtype=bool)
+        indexed[:len(valid)] = valid
+        unindexed = np.flatnonzero(starts_acgt & ~indexed)
+        return cls(text, codes[order], positions[order], unindexed, k)
+
+    def save(self, path: str) -> None:
+        """Write the index (and the genome, needed for verification) to an .npz file."""
+        np.savez(path, text=self.genome,
+                 codes=self.codes, positions=self.positions, unindexed=self.unindexed,
+                 k=np.array(self.k))
+
+    @classmethod
+    def load(cls, path: str) -> "SeedIndex":
+        """Load an index written by save()."""
+        with np.load(path) as data:
+            text = data["text"].tobytes().decode("ascii")
+            return cls(text, data["codes"], data["positions"], data["unindexed"], int(data["k"]))
+
+    def seed_positions(self, seed: str) -> np.ndarray:
+        """
+        Genome positions whose indexed k-mer agrees with 'seed' (exact for seeds up to
+        k bases; longer seeds are matched on their first k bases and checked during verification).
+        """
+        s = min(len(seed), self.k)
+        shift = 2 * (self.k - s)
+        lo_code = encode_kmer(seed[:s]) << shift
+        hi_code = lo_code + (1 << shift) - 1
+        lo = np.searchsorted(self.codes, np.uint64(lo_code), side="left")
+        hi = np.searchsorted(self.codes, np.uint64(hi_code), side="right")
+        return self.positions[lo:hi]
+
+    def _strand_hits(self, pattern: str, d: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Verified window starts (and their mismatch counts) for one strand."""
+        m = len(pattern)
+        last_start = len(self.text) - m
+        if last_start < 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        if d >= m:
+            starts = np.arange(last_start + 1)
+        else:
+            candidates = []
+            for offset, seed in split_seeds(pattern, d):
+                candidates.append(self.seed_positions(seed).astype(np.int64) - offset)
+                if len(seed) < self.k:
+                    candidates.append(self.unindexed.astype(np.int64) - offset)
+            starts = np.unique(np.concatenate(candidates))
+            starts = starts[(starts >= 0) & (starts <= last_start)]
+
+        query = np.frombuffer(pattern.encode("ascii"), dtype=np.uint8)
+        windows = self.genome[starts[:, None] + np.arange(m)]
+        mismatches = np.count_nonzero(windows != query, axis=1)
+        keep = mismatches <= d
+        return starts[keep], mismatches[keep]
+
+    def search(self, pattern: str, d: int, both_strands: bool = True) -> List[Tuple[int, str, int]]:
+        """
+        All windows within d mismatches of 'pattern' (and of its reverse complement
+        when both_strands=True), as sorted (position, strand, mismatches) tuples.
+        """
+        if d < 0 or not pattern:
+            return []
+        if set(pattern) - set(BASES):
+            raise ValueError("Seed search needs a pattern over A/C/G/T.")
+        strands = [("+", pattern)]
+        if both_strands:
+            strands.append(("-", reverse_complement(pattern)))
+
+        hits = []
+        for strand, query in strands:
+            starts, mismatches = self._strand_hits(query, d)
+            hits.extend(zip(starts.tolist(), [strand] * len(starts), mismatches.tolist()))
+        return sorted(hits)
+
+    def positions_within(self, pattern: str, d: int) -> List[int]:
+        """Forward-strand start positions, as returned by ApproximatePatternMatching."""
+        return [pos for pos, _, _ in self.search(pattern, d, both_strands=False)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Seed-and-verify approximate search on a k-mer position index.")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    b = sub.add_parser("build", help="Build a k-mer position index from a genome file.")
+    b.add_argument("--genome", "-g", required=True, help="Path to the genome file.")
+    b.add_argument("--out", "-o", required=True, help="Output index path (.npz).")
+    b.add_argument("--k", type=int, default=DEFAULT_K, help=f"Indexed k-mer length (default: {DEFAULT_K}).")
+
+    s = sub.add_parser("search", help="Search patterns on both strands.")
+    s.add_argument("--index", "-i", required=True, help="Path to an index built with 'build'.")
+    s.add_argument("--d", type=int, default=0, help="Maximum number of mismatches (default: 0).")
+    s.add_argument("--forward-only", action="store_true", help="Search the forward strand only.")
+    s.add_argument("patterns", nargs="+", help="Patterns to search for.")
+    args = ap.parse_args()
+
+    if args.command == "build":
+        index = SeedIndex.from_text(read_genome(args.genome), args.k)
+        index.save(args.out)
+        print(f"Indexed {len(index.codes)} {index.k}-mers into {args.out}")
+        return
+
+    index = SeedIndex.load(args.index)
+    print("pattern\tposition\tstrand\tmismatches")
+    for pattern in args.patterns:
+        for pos, strand, mismatches in index.search(pattern, args.d, both_strands=not args.forward_only):
+            print(f"{pattern}\t{pos}\t{strand}\t{mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# exercises/streaming_scan.py
+# Run:
+#   python exercises/streaming_scan.py --file genome.fasta pattern --pattern TTATCCACA
+#   python exercises/streaming_scan.py --file genome.fasta approx --pattern TTATCCACA --d 1
+#   python exercises/streaming_scan.py --file genome.fasta skew
+#   python exercises/streaming_scan.py --file genome.fasta clumps --k 9 --L 500 --t 3
+
+"""
+Streaming (chunked) scans for genomes larger than RAM.
+
+pattern_matching, approximate_pattern_count, calculate_skew and find_clumps
+all expect the whole genome as one string. This driver feeds them overlapping
+chunks instead, so peak memory depends on the chunk size, not the genome size.
+
+How the chunks are stitched:
+- Each chunk is prefixed with the last (window - 1) bases seen so far, where
+  window is len(pattern) for the pattern scans and L for clumps. A window that
+  ends inside a chunk is therefore complete in exactly one stitched text, so
+  nothing is missed and nothing is reported twice.
+- Local positions are shifted by the global offset of the stitched text.
+- The skew carries its running total from one chunk to the next.
+
+The results are identical to calling the functions on the whole genome.
+Chunks come from any iterable of strings; read_chunks() streams a FASTA or
+plain sequence file through its .fai index (see fasta_index.py).
+"""
+
+import argparse
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from approximate_pattern_count import approximate_pattern_count
+from calculate_skew import calculate_skew
+from clump_finding2 import find_clumps
+from fasta_index import DEFAULT_CHUNK_SIZE, FastaIndex
+from patter_matching import pattern_matching
+from skew_engine import SkewStream
+
+
+def read_chunks(file_path: str, name: Optional[str] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Stream one record (the first by default) of a FASTA/plain file in chunks of chunk_size bases."""
+    with FastaIndex(file_path) as fasta:
+        if not fasta.records:
+            return
+        yield from fasta.iter_chunks(name or fasta.names[0], chunk_size)
+
+
+def iter_overlapping(chunks: Iterable[str], overlap: int) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (offset, text) where text is the previous 'overlap' bases followed by the
+    next chunk, and offset is the global position of text[0].
+    """
+    tail = ""
+    consumed = 0  # global position right after the last base seen
+    for chunk in chunks:
+        if not chunk:
+            continue
+        text = tail + chunk
+        yield consumed - len(tail), text
+        consumed += len(chunk)
+        tail = text[max(0, len(text) - overlap):] if overlap > 0 else ""
+
+
+def stream_pattern_matching(pattern: str, chunks: Iterable[str]) -> Iterator[int]:
+    """Global start positions of 'pattern', in increasing order (see pattern_matching)."""
+    for offset, text in iter_overlapping(chunks, len(pattern) - 1):
+        for pos in pattern_matching(pattern, text):
+            yield offset + pos
+
+
+def stream_approximate_pattern_count(chunks: Iterable[str], pattern: str, d: int,
+                                     backend: str = "python") -> int:
+    """Number of windows within d mismatches of 'pattern' (see approximate_pattern_count)."""
+    return sum(approximate_pattern_count(text, pattern, d, backend)
+               for _, text in iter_overlapping(chunks, len(pattern) - 1))
+
+
+def stream_skew(chunks: Iterable[str]) -> Iterator[int]:
+    """Skew values Skew_0 .. Skew_n, exactly as calculate_skew() returns them, one at a time."""
+    total = 0
+    yield total
+    for chunk in chunks:
+        skew = calculate_skew(chunk)
+        for value in skew[1:]:
+            yield total + value
+        total += skew[-1]
+
+
+def stream_min_skew_positions(chunks: Iterable[str]) -> Tuple[List[int], int]:
+    """Positions where the skew is minimal, and the minimum (see find_min_skew_positions)."""
+    stream = SkewStream().feed(chunks)
+    return stream.min_positions.tolist(), stream.min_value
+
+
+def stream_find_clumps(chunks: Iterable[str], k: int, L: int, t: int) -> Set[str]:
+    """Distinct k-mers forming (L, t)-clumps (see find_clumps)."""
+    patterns = set()
+    for _, text in iter_overlapping(chunks, L - 1):
+        patterns |= find_clumps(text, k, L, t)
+    return patterns
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Chunked scans of genomes larger than memory.")
+    ap.add_argument("--file", "-f", required=True, help="Path to a FASTA or plain sequence file.")
+    ap.add_argument("--record", type=str, default=None, help="Record name (default: first record).")
+    ap.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                    help=f"Bases per chunk (default: {DEFAULT_CHUNK_SIZE}).")
+    sub = ap.add_subparsers(dest="mode", required=True)
+
+    p = sub.add_parser("pattern", help="Exact pattern positions.")
+    p.add_argument("--pattern", "-p", required=True)
+
+    a = sub.add_parser("approx", help="Approximate pattern count.")
+    a.add_argument("--pattern", "-p", required=True)
+    a.add_argument("--d", type=int, default=0)
+    a.add_argument("--backend", choices=["python", "numpy"], default="python")
+
+    sub.add_parser("skew", help="Positions of minimum skew.")
+
+    c = sub.add_parser("clumps", help="(L, t)-clump forming k-mers.")
+    c.add_argument("--k", type=int, default=9)
+    c.add_argument("--L", type=int, default=500)
+    c.add_argument("--t", type=int, default=3)
+    args = ap.parse_args()
+
+    chunks = read_chunks(args.file, args.record, args.chunk_size)
+    if args.mode == "pattern":
+        print(" ".join(map(str, stream_pattern_matching(args.pattern, chunks))))
+    elif args.mode == "approx":
+        print(stream_approximate_pattern_count(chunks, args.pattern, args.d, args.backend))
+    elif args.mode == "skew":
+        positions, value = stream_min_skew_positions(chunks)
+        print(f"Minimum skew {value} at positions: {' '.join(map(str, positions))}")
+    else:
+        clumps = stream_find_clumps(chunks, args.k, args.L, args.t)
+        print(f"Number of distinct {args.k}-mers forming ({args.L},{args.t})-clumps: {len(clumps)}")
+        print(" ".join(sorted(clumps)))
+
+
+if __name__ == "__main__":
+    main()
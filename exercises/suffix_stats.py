@@ -0,0 +1,181 @@
+# exercises/suffix_stats.py
+# Run:
+#   python exercises/suffix_stats.py --file data/raw/Genomes/e_coli.txt --kmin 4 --kmax 12 --gaps 9 --repeats 5
+
+"""
+Multi-k diversity and repeat statistics from one suffix array + LCP array.
+
+estimate_k() builds a set of k-mers for each k and estimate_L() a position
+dict per k, so a parameter sweep costs one genome scan per k. SuffixStats
+builds the suffix array once (prefix doubling, see fm_index.py) and the LCP
+array (longest common prefix of neighbouring suffixes) next to it; then:
+
+- distinct_kmer_counts(): a suffix starts a new distinct k-mer exactly when
+  lcp < k <= its length, so one pass over the LCP array with a difference
+  array gives the distinct counts of every k at once;
+- repeat_gaps(k): runs of rows with lcp >= k are the occurrences of one
+  k-mer; sorting positions within runs gives the spacing between consecutive
+  occurrences (the distances estimate_L() averages);
+- longest_repeats(): the largest LCP values are the longest repeated
+  substrings.
+
+The LCP array is computed in vector passes: neighbouring suffixes are
+compared one machine word (up to 21 characters) at a time, and only pairs
+that are still equal go on to the next word. Like the string-based scripts,
+every character counts (N-containing k-mers are k-mers too).
+"""
+
+import argparse
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from fm_index import build_suffix_array, encode_text
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Exact bit length of non-negative int64 values (two exact float conversions of 32-bit halves)."""
+    high = (x >> 32).astype(np.float64)
+    low = (x & 0xFFFFFFFF).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+def lcp_array(codes: np.ndarray, sa: np.ndarray, sigma: int) -> np.ndarray:
+    """
+    lcp[i] = length of the longest common prefix of suffixes sa[i - 1] and sa[i] (lcp[0] = 0).
+    'codes' must end with the unique sentinel 0, as for build_suffix_array().
+    """
+    n = len(codes)
+    lcp = np.zeros(n, dtype=np.int64)
+    if n < 2:
+        return lcp
+    bits = max(1, int(sigma).bit_length())
+    q = 63 // bits  # characters per int64 word
+
+    # words[i] = characters i .. i+q-1 packed into one int64 (zeros past the end)
+    padded = np.zeros(n + q, dtype=np.int64)
+    padded[:n] = codes
+    words = np.zeros(n + 1, dtype=np.int64)
+    for j in range(q):
+        words[:n] = (words[:n] << bits) | padded[j:j + n]
+    del padded
+
+    rows = np.arange(1, n)
+    left, right = sa[:-1].astype(np.int64), sa[1:].astype(np.int64)
+    offset = 0
+    # The unique sentinel guarantees a mismatch at or before the end of the shorter suffix
+    while len(rows):
+        a = words[np.minimum(left + offset, n)]
+        b = words[np.minimum(right + offset, n)]
+        differ = a != b
+        first_diff = (q * bits - _bit_length(a[differ] ^ b[differ])) // bits
+        lcp[rows[differ]] = offset + first_diff
+        rows, left, right = rows[~differ], left[~differ], right[~differ]
+        offset += q
+    return lcp
+
+
+class SuffixStats:
+    """Suffix array + LCP array of a text, with k-mer diversity and repeat queries."""
+
+    def __init__(self, text: str, sa: np.ndarray, lcp: np.ndarray):
+        self.text = text
+        self.sa = sa    # includes the sentinel suffix at row 0
+        self.lcp = lcp
+
+    @classmethod
+    def from_text(cls, text: str) -> "SuffixStats":
+        codes, alphabet = encode_text(text)
+        sa = build_suffix_array(codes, len(alphabet))
+        return cls(text, sa, lcp_array(codes, sa, len(alphabet)))
+
+    def _suffix_lengths(self) -> np.ndarray:
+        """Length of each suffix in suffix-array order, without the sentinel."""
+        return len(self.text) - self.sa.astype(np.int64)
+
+    def distinct_kmer_counts(self, ks: Iterable[int] = range(4, 13)) -> Dict[int, int]:
+        """Number of distinct k-mers of the text for every k in 'ks' (estimate_k's diversity)."""
+        lengths = self._suffix_lengths()
+        opens = self.lcp < lengths  # suffix i starts new k-mers for lcp[i] < k <= lengths[i]
+        size = len(self.text) + 2
+        diff = np.bincount(self.lcp[opens] + 1, minlength=size) - np.bincount(lengths[opens] + 1, minlength=size)
+        distinct = np.cumsum(diff)
+        return {k: int(distinct[k]) if 0 < k <= len(self.text) else 0 for k in ks}
+
+    def kmer_groups(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (positions, group) for every occurrence of every k-mer: positions in suffix-array order,
+        group[i] numbering the distinct k-mers in lexicographic order.
+        """
+        lengths = self._suffix_lengths()
+        rows = np.flatnonzero(lengths >= k)
+        opens = np.ones(len(rows), dtype=bool)
+        # A row continues the previous row's k-mer only if both are complete k-mers sharing k characters
+        opens[1:] = (self.lcp[rows[1:]] < k) | (rows[1:] != rows[:-1] + 1)
+        return self.sa[rows].astype(np.int64), np.cumsum(opens) - 1
+
+    def repeat_gaps(self, k: int) -> np.ndarray:
+        """Distances between consecutive occurrences of every repeated k-mer (estimate_L's distances)."""
+        positions, group = self.kmer_groups(k)
+        if not len(positions):
+            return np.zeros(0, dtype=np.int64)
+        order = np.lexsort((positions, group))
+        positions, group = positions[order], group[order]
+        same = group[1:] == group[:-1]
+        return (positions[1:] - positions[:-1])[same]
+
+    def longest_repeats(self, top: int = 1) -> List[Tuple[int, str, List[int]]]:
+        """
+        The 'top' longest repeated substrings as (length, substring, sorted positions).
+        Each repeat is reported once, and only if it cannot be extended to the left
+        (so shifted copies of a longer repeat are skipped).
+        """
+        results = []
+        lcp = self.lcp
+        candidates = np.argsort(-lcp, kind="stable")
+        seen = np.zeros(len(lcp), dtype=bool)
+        for row in candidates.tolist():
+            length = int(lcp[row])
+            if length == 0 or len(results) >= top:
+                break
+            if seen[row]:
+                continue
+            # Extend the run of rows sharing this prefix length in both directions
+            lo, hi = row, row
+            while lo > 1 and lcp[lo - 1] >= length:
+                lo -= 1
+            while hi + 1 < len(lcp) and lcp[hi + 1] >= length:
+                hi += 1
+            seen[lo:hi + 1] = True
+            positions = sorted(self.sa[lo - 1:hi + 1].tolist())
+            if positions[0] > 0 and len({self.text[p - 1] for p in positions}) == 1:
+                continue
+            start = positions[0]
+            results.append((length, self.text[start:start + length], positions))
+        return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="k-mer diversity and repeat statistics from a suffix array + LCP.")
+    ap.add_argument("--file", "-f", required=True, help="Path to a FASTA or plain sequence file.")
+    ap.add_argument("--kmin", type=int, default=4, help="Smallest k (default: 4).")
+    ap.add_argument("--kmax", type=int, default=12, help="Largest k (default: 12).")
+    ap.add_argument("--gaps", type=int, default=None, help="k for which to summarize repeat spacing.")
+    ap.add_argument("--repeats", type=int, default=3, help="Number of longest repeats to print (default: 3).")
+    args = ap.parse_args()
+
+    from fasta_index import read_genome
+    stats = SuffixStats.from_text(read_genome(args.file))
+    for k, count in stats.distinct_kmer_counts(range(args.kmin, args.kmax + 1)).items():
+        print(f"k={k}\t{count} distinct")
+    if args.gaps:
+        gaps = stats.repeat_gaps(args.gaps)
+        mean = gaps.mean() if len(gaps) else float("nan")
+        print(f"{args.gaps}-mer repeat gaps: {len(gaps)}, mean {mean:.1f}")
+    for length, repeat, positions in stats.longest_repeats(args.repeats):
+        preview = repeat if length <= 60 else repeat[:57] + "..."
+        print(f"{length}\t{preview}\t{' '.join(map(str, positions))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+# tests/conftest.py
+# The exercises are standalone scripts that import each other by module name.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exercises"))
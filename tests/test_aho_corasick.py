@@ -0,0 +1,23 @@
+# tests/test_aho_corasick.py
+import random
+
+import pytest
+
+import pattern_occurrence_counter
+import questionnaire1
+from aho_corasick import AhoCorasick
+
+
+def test_batch_counts_match_single_pattern_counts():
+    rng = random.Random(7)
+    sequence = "".join(rng.choice("ACGT") for _ in range(500))
+    patterns = ["A", "ACG", "TT", "GATC", sequence[40:48]]
+    for module in (pattern_occurrence_counter, questionnaire1):
+        counts = module.count_many_pattern_occurrences(sequence, patterns)
+        assert counts == {p: module.count_pattern_occurrences(sequence, p) for p in patterns}
+
+
+def test_reverse_complement_mode_rejects_non_acgt_patterns():
+    with pytest.raises(ValueError):
+        AhoCorasick(["ACGN"], reverse_complement_mode=True)
+    assert AhoCorasick(["ACGN"]).count("TACGNA") == {"ACGN": 1}
@@ -0,0 +1,24 @@
+# tests/test_fasta_index.py
+import os
+
+from fasta_index import parse_record, read_genome
+
+
+def test_read_genome_does_not_write_an_index(tmp_path):
+    path = tmp_path / "genome.fa"
+    path.write_text(">chr1\nACGT\nACGT\nAC\n>chr2\nTTTT\n")
+    assert read_genome(str(path)) == "ACGTACGTAC"
+    assert read_genome(str(path), "chr2") == "TTTT"
+    assert not os.path.exists(str(path) + ".fai")
+    read_genome(str(path), save_index=True)
+    assert os.path.exists(str(path) + ".fai")
+
+
+def test_read_genome_accepts_varying_line_lengths(tmp_path):
+    path = tmp_path / "ragged.fa"
+    path.write_text(">chr1 first\nACG\nTTACG\nA\n\n>chr2\nGG\nCCCC\n")
+    assert read_genome(str(path)) == "ACGTTACGA"
+    assert read_genome(str(path), "chr2") == "GGCCCC"
+    plain = tmp_path / "plain.txt"
+    plain.write_text("ACGTAC\nGT\nACGTACGT\n")
+    assert read_genome(str(plain)) == parse_record(str(plain)) == "ACGTACGTACGTACGT"
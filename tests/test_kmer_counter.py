@@ -0,0 +1,47 @@
+# tests/test_kmer_counter.py
+import random
+
+import clump_finding
+import questionnaire1
+
+
+def _random_dna(rng, n):
+    return "".join(rng.choice("ACGT") for _ in range(n))
+
+
+def test_frequency_table_backends_agree():
+    rng = random.Random(1)
+    for _ in range(30):
+        text = _random_dna(rng, rng.randint(0, 300))
+        k = rng.randint(1, 8)
+        for module in (clump_finding, questionnaire1):
+            assert module.frequency_table(text, k, backend="numpy") == module.frequency_table(text, k)
+
+
+def test_most_frequent_kmer_backends_agree():
+    rng = random.Random(2)
+    for _ in range(30):
+        text = _random_dna(rng, rng.randint(10, 300))
+        k = rng.randint(1, 6)
+        assert questionnaire1.most_frequent_kmer(text, k, backend="numpy") == questionnaire1.most_frequent_kmer(text, k)
+
+
+def test_find_clumps_backends_agree():
+    rng = random.Random(3)
+    genome = _random_dna(rng, 400)
+    assert clump_finding.find_clumps(genome, 3, 50, 4, backend="numpy") == clump_finding.find_clumps(genome, 3, 50, 4)
+
+
+def test_find_clumps_backends_agree_random():
+    rng = random.Random(4)
+    for _ in range(20):
+        genome = _random_dna(rng, rng.randint(0, 300))
+        k, L, t = rng.randint(1, 5), rng.randint(5, 80), rng.randint(1, 4)
+        assert clump_finding.find_clumps(genome, k, L, t, backend="numpy") == clump_finding.find_clumps(genome, k, L, t)
+
+
+def test_most_frequent_kmer_ties_go_to_first_occurrence():
+    # CCC, GGG and AAA all occur twice; CCC is seen first
+    text = "CCCTGGGTAAATCCCTGGGTAAA"
+    assert questionnaire1.most_frequent_kmer(text, 3, backend="numpy") == ("CCC", 2)
+    assert questionnaire1.most_frequent_kmer(text, 3) == ("CCC", 2)
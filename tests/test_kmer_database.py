@@ -0,0 +1,37 @@
+# tests/test_kmer_database.py
+import random
+
+import clump_finding2
+import estimate_ktl
+import questionnaire1
+from kmer_database import KmerDatabase
+
+
+def _genome_file(tmp_path, seed, n):
+    rng = random.Random(seed)
+    genome = "".join(rng.choice("ACGT") for _ in range(n))
+    path = tmp_path / "genome.fa"
+    path.write_text(">chr\n" + "\n".join(genome[i:i + 60] for i in range(0, n, 60)) + "\n")
+    return genome, str(path)
+
+
+def test_reused_database_matches_recounting(tmp_path):
+    genome, path = _genome_file(tmp_path, 5, 3000)
+    db_path = str(tmp_path / "k5.kdb")
+    KmerDatabase.open_or_build(db_path, path, 5, with_positions=True)
+    # The second call reuses the saved directory
+    db = KmerDatabase.open_or_build(db_path, path, 5, with_positions=True)
+
+    assert clump_finding2.find_clumps(genome, 5, 200, 3, database=db) == clump_finding2.find_clumps(genome, 5, 200, 3)
+    assert estimate_ktl.estimate_L(genome, 5, database=db) == estimate_ktl.estimate_L(genome, 5)
+    assert questionnaire1.frequency_table(genome, 5, database=db) == questionnaire1.frequency_table(genome, 5)
+    assert questionnaire1.most_frequent_kmer(genome, 5, database=db) == questionnaire1.most_frequent_kmer(genome, 5)
+    for pattern in ("ACGTA", "TTTTT", genome[100:105]):
+        assert (questionnaire1.count_pattern_occurrences(genome, pattern, database=db)
+                == questionnaire1.count_pattern_occurrences(genome, pattern))
+
+
+def test_estimate_k_from_databases(tmp_path):
+    genome, path = _genome_file(tmp_path, 6, 2000)
+    databases = {k: KmerDatabase.open_or_build(str(tmp_path / f"k{k}"), path, k) for k in estimate_ktl.K_VALUES}
+    assert estimate_ktl.estimate_k(genome, databases=databases) == estimate_ktl.estimate_k(genome)
@@ -0,0 +1,20 @@
+# tests/test_parallel_scan.py
+import random
+
+from find_ori import find_origin_in_genome
+from parallel_scan import parallel_find_origin
+
+
+def test_self_overlapping_box_matches_serial():
+    genome = "A" * 40
+    assert find_origin_in_genome(genome, "AAAAAAAAA") == (0, 27)
+    assert parallel_find_origin(genome, "AAAAAAAAA", workers=2) == (0, 27)
+
+
+def test_random_periodic_genomes_match_serial():
+    rng = random.Random(7)
+    for _ in range(20):
+        genome = "".join(rng.choice("AT") for _ in range(rng.randint(20, 400)))
+        expected = find_origin_in_genome(genome, "ATATATATA")
+        for workers in (2, 3):
+            assert parallel_find_origin(genome, "ATATATATA", workers=workers) == expected